@@ -0,0 +1,270 @@
+import os
+import sqlite3
+import sys
+
+import pandas as pd
+
+from scout_ingest import (
+    STORE_COLUMNS,
+    conditions_to_numeric,
+    list_scout_exports,
+    normalise_scout_columns,
+    parse_scout_dates,
+)
+
+# Rough ratio between the parsed size of a chunk and the working memory
+# needed to aggregate it (string copies, group keys, sort buffers)
+WORKING_SET_FACTOR = 4
+
+SAMPLE_ROWS = 1000
+
+LATEST_COLUMNS = ['ordinal', 'date', 'section', 'metric', 'condition',
+                  'condition_numeric', 'scout', 'notes']
+
+
+def estimate_chunk_rows(source, max_memory_mb):
+    """Work out how many rows fit in one chunk for the given memory budget"""
+    path = list_scout_exports(source)[0]
+    if path.endswith('.db'):
+        conn = sqlite3.connect(path)
+        try:
+            sample = pd.read_sql_query(
+                f"SELECT {', '.join(STORE_COLUMNS)} FROM observations LIMIT {SAMPLE_ROWS}", conn
+            )
+        finally:
+            conn.close()
+    else:
+        sample = pd.read_csv(path, dtype=str, keep_default_na=False, nrows=SAMPLE_ROWS)
+
+    if sample.empty:
+        return SAMPLE_ROWS
+
+    bytes_per_row = sample.memory_usage(deep=True).sum() / len(sample)
+    budget = max_memory_mb * 1024 * 1024 / WORKING_SET_FACTOR
+    return max(1, int(budget / bytes_per_row))
+
+
+def iter_scout_chunks(source, chunk_rows):
+    """Yield normalised chunks of at most chunk_rows rows from CSV exports or the ingest store"""
+    for path in list_scout_exports(source):
+        if path.endswith('.db'):
+            conn = sqlite3.connect(path)
+            try:
+                query = f"SELECT {', '.join(STORE_COLUMNS)} FROM observations ORDER BY rowid"
+                for chunk in pd.read_sql_query(query, conn, chunksize=chunk_rows):
+                    yield chunk.fillna('')
+            finally:
+                conn.close()
+        else:
+            reader = pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_rows)
+            for chunk in reader:
+                yield normalise_scout_columns(chunk, os.path.basename(path))
+
+
+def _add_counts(total, part):
+    """Add two count Series, treating missing keys as zero"""
+    if total is None:
+        return part
+    return total.add(part, fill_value=0).astype('int64')
+
+
+def _keep_latest(frames, keys):
+    """Keep the latest row per key; ties on date go to the earliest row seen"""
+    combined = pd.concat([f for f in frames if f is not None], ignore_index=True)
+    combined = combined.sort_values(['date', 'ordinal'], ascending=[False, True], kind='mergesort')
+    return combined.drop_duplicates(subset=keys, keep='first')
+
+
+class DashboardAggregates:
+    """Mergeable partial aggregates behind the section dashboards.
+
+    Every field is either a count, a sum or a latest/min/max reduction, so the
+    state for a whole history can be built one chunk at a time and the states
+    of separate files or farms can be combined with merge(). The state grows
+    with the number of sections, metrics and dates, never with the row count.
+    """
+
+    def __init__(self):
+        self.rows_seen = 0
+        self.total_observations = 0
+        self.min_date = None
+        self.max_date = None
+        self.section_counts = None
+        self.metric_counts = None
+        self.condition_counts = None
+        self.section_condition_counts = None
+        self.daily_scores = None
+        self.monthly_scores = None
+        self.latest_by_section = None
+        self.latest_by_section_metric = None
+
+    def update(self, chunk):
+        """Fold one normalised chunk of scout rows into the aggregates"""
+        chunk = chunk.copy()
+        chunk['ordinal'] = range(self.rows_seen, self.rows_seen + len(chunk))
+        self.rows_seen += len(chunk)
+
+        chunk['date'] = parse_scout_dates(chunk['date'])
+        chunk = chunk.dropna(subset=['date'])
+        if chunk.empty:
+            return self
+
+        chunk['condition_numeric'] = conditions_to_numeric(chunk['condition'])
+        chunk = chunk[LATEST_COLUMNS]
+
+        self.total_observations += len(chunk)
+        chunk_min, chunk_max = chunk['date'].min(), chunk['date'].max()
+        self.min_date = chunk_min if self.min_date is None else min(self.min_date, chunk_min)
+        self.max_date = chunk_max if self.max_date is None else max(self.max_date, chunk_max)
+
+        self.section_counts = _add_counts(self.section_counts, chunk.groupby('section').size())
+        self.metric_counts = _add_counts(self.metric_counts, chunk.groupby('metric').size())
+        self.condition_counts = _add_counts(self.condition_counts, chunk.groupby('condition').size())
+        self.section_condition_counts = _add_counts(
+            self.section_condition_counts, chunk.groupby(['section', 'condition']).size()
+        )
+
+        scores = chunk.groupby('date')['condition_numeric'].agg(['sum', 'count'])
+        self.daily_scores = scores if self.daily_scores is None else \
+            self.daily_scores.add(scores, fill_value=0)
+
+        months = chunk['date'].dt.to_period('M')
+        scores = chunk.groupby(months)['condition_numeric'].agg(['sum', 'count'])
+        self.monthly_scores = scores if self.monthly_scores is None else \
+            self.monthly_scores.add(scores, fill_value=0)
+
+        self.latest_by_section = _keep_latest([self.latest_by_section, chunk], ['section'])
+        self.latest_by_section_metric = _keep_latest(
+            [self.latest_by_section_metric, chunk], ['section', 'metric']
+        )
+        return self
+
+    def merge(self, other):
+        """Combine the aggregates of another source into this one.
+
+        Ordinals of the other state are shifted past this state's rows, so
+        date ties resolve to this source first, as if the sources were read
+        one after the other.
+        """
+        if other.total_observations == 0:
+            self.rows_seen += other.rows_seen
+            return self
+
+        offset = self.rows_seen
+        shifted = []
+        for latest in (other.latest_by_section, other.latest_by_section_metric):
+            latest = latest.copy()
+            latest['ordinal'] += offset
+            shifted.append(latest)
+
+        self.rows_seen += other.rows_seen
+        self.total_observations += other.total_observations
+        self.min_date = other.min_date if self.min_date is None else min(self.min_date, other.min_date)
+        self.max_date = other.max_date if self.max_date is None else max(self.max_date, other.max_date)
+
+        self.section_counts = _add_counts(self.section_counts, other.section_counts)
+        self.metric_counts = _add_counts(self.metric_counts, other.metric_counts)
+        self.condition_counts = _add_counts(self.condition_counts, other.condition_counts)
+        self.section_condition_counts = _add_counts(
+            self.section_condition_counts, other.section_condition_counts
+        )
+        for name in ('daily_scores', 'monthly_scores'):
+            mine = getattr(self, name)
+            setattr(self, name, getattr(other, name) if mine is None else
+                    mine.add(getattr(other, name), fill_value=0))
+
+        self.latest_by_section = _keep_latest([self.latest_by_section, shifted[0]], ['section'])
+        self.latest_by_section_metric = _keep_latest(
+            [self.latest_by_section_metric, shifted[1]], ['section', 'metric']
+        )
+        return self
+
+    def latest_data(self):
+        """Most recent row per section, as used by the dashboards.
+
+        Scores are widened to int64 like the dashboards' own condition
+        column; rankings of tied scores depend on the sort kernel numpy
+        picks for the dtype.
+        """
+        latest = self.latest_by_section.sort_values('section').set_index('ordinal')
+        return latest.astype({'condition_numeric': 'int64'})
+
+    def section_scores(self):
+        """Current health score per section"""
+        return self.latest_data().groupby('section')['condition_numeric'].mean().sort_values()
+
+    def metric_scores(self):
+        """Current average score per metric"""
+        return self.latest_data().groupby('metric')['condition_numeric'].mean().sort_values()
+
+    def daily_health(self, since=None):
+        """Average health score per date, optionally from a given date onwards"""
+        scores = self.daily_scores.sort_index()
+        if since is not None:
+            scores = scores[scores.index >= since]
+        return scores['sum'] / scores['count']
+
+    def monthly_health(self):
+        """Average health score per month"""
+        scores = self.monthly_scores.sort_index()
+        return scores['sum'] / scores['count']
+
+    def mode_conditions(self):
+        """Most frequent condition per section (ties go to the first condition alphabetically)"""
+        counts = self.section_condition_counts.reset_index(name='count')
+        counts = counts.sort_values(['section', 'count', 'condition'],
+                                    ascending=[True, False, True], kind='mergesort')
+        return counts.drop_duplicates('section').set_index('section')['condition']
+
+
+def compute_dashboard_aggregates(source='scout.csv', max_memory_mb=64, metric=None):
+    """Stream a scout history in bounded chunks and return its dashboard aggregates.
+
+    source may be a CSV export, a directory of exports or the ingest store
+    (.db). Pass metric to restrict the aggregates to one observation type,
+    e.g. 'soil moisture'. CSV rows are not deduplicated here, within or across
+    exports (that would need every row hash in memory); ingest the exports
+    into the store first and stream the store for the dashboards' totals.
+    """
+    chunk_rows = estimate_chunk_rows(source, max_memory_mb)
+    aggregates = DashboardAggregates()
+
+    for chunk in iter_scout_chunks(source, chunk_rows):
+        if metric is not None:
+            # Keep the ordinals aligned with the unfiltered source
+            keep = chunk['metric'].str.lower() == metric.lower()
+            aggregates.rows_seen += int((~keep).sum())
+            chunk = chunk[keep]
+        aggregates.update(chunk)
+
+    return aggregates
+
+
+def print_aggregate_summary(aggregates, source=None):
+    """Print the headline aggregates to the console"""
+    if aggregates.total_observations == 0:
+        print("No observations found.")
+        return
+
+    print("=== Chunked Aggregate Summary ===")
+    print(f"Total observations: {aggregates.total_observations}")
+    if source is not None and not source.endswith('.db'):
+        print("Note: CSV exports are streamed without dedup, so repeated rows are counted here but "
+              "dropped by the dashboards; stream the ingest store (scout_ingest.py) for matching totals")
+    print(f"Date range: {aggregates.min_date.strftime('%Y-%m-%d')} to {aggregates.max_date.strftime('%Y-%m-%d')}")
+    print(f"Sections: {len(aggregates.section_counts)}")
+    print(f"Metrics: {len(aggregates.metric_counts)}")
+
+    print("\n=== Section Health (Current) ===")
+    for section, score in aggregates.section_scores().sort_values(ascending=False).items():
+        print(f"{section}: {score:.2f}")
+
+    print("\n=== Metric Performance (Current) ===")
+    for metric, score in aggregates.metric_scores().sort_values(ascending=False).items():
+        print(f"{metric}: {score:.2f}")
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else 'scout.csv'
+    max_memory_mb = float(sys.argv[2]) if len(sys.argv) > 2 else 64
+    print_aggregate_summary(compute_dashboard_aggregates(source, max_memory_mb), source)
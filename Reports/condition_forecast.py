@@ -0,0 +1,203 @@
+import sys
+import time
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from scout_ingest import load_scout_exports, parse_scout_dates
+from tiled_output import save_dashboard
+
+STATES = ['fail', 'partial', 'pass']
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+N_STATES = len(STATES)
+
+SERIES_KEYS = ['section', 'metric']
+
+
+class TransitionModel:
+    """Pass/partial/fail transition counts for every (section, metric) series.
+
+    counts[s, i, j] is how often series s went from state i on one visit to
+    state j on the next. last_state and last_date describe each series'
+    most recent visit, which is all that is needed to add new visits
+    without going back to the raw history.
+    """
+
+    def __init__(self, keys=None, counts=None, last_state=None, last_date=None):
+        self.keys = keys if keys is not None else pd.MultiIndex.from_arrays([[], []], names=SERIES_KEYS)
+        self.counts = counts if counts is not None else np.zeros((0, N_STATES, N_STATES), dtype='int64')
+        self.last_state = last_state if last_state is not None else np.zeros(0, dtype='int8')
+        self.last_date = last_date if last_date is not None else np.zeros(0, dtype='datetime64[D]')
+
+    def update(self, rows):
+        """Add the transitions in newly ingested rows to the counts"""
+        visits = prepare_visits(rows)
+        if visits.empty:
+            return self
+
+        # Grow the series arrays for pairs seen for the first time
+        keys = pd.MultiIndex.from_frame(visits[SERIES_KEYS])
+        new_keys = keys.unique().difference(self.keys)
+        if len(new_keys):
+            self.keys = self.keys.append(new_keys)
+            self.counts = np.concatenate([self.counts, np.zeros((len(new_keys), N_STATES, N_STATES), 'int64')])
+            self.last_state = np.concatenate([self.last_state, np.full(len(new_keys), -1, 'int8')])
+            self.last_date = np.concatenate([self.last_date, np.full(len(new_keys), np.datetime64('NaT'), 'datetime64[D]')])
+
+        series = self.keys.get_indexer(keys)
+        dates = visits['date'].to_numpy(dtype='datetime64[D]')
+        states = visits['state'].to_numpy(dtype='int8')
+
+        # Only visits after a series' last known visit extend it
+        known = ~np.isnat(self.last_date[series])
+        newer = ~known | (dates > np.where(known, self.last_date[series], dates))
+        series, dates, states = series[newer], dates[newer], states[newer]
+        if not len(series):
+            return self
+
+        # Prepend each touched series' last known visit so the first new visit forms a transition
+        touched = np.unique(series)
+        touched = touched[self.last_state[touched] >= 0]
+        series = np.concatenate([touched, series])
+        dates = np.concatenate([self.last_date[touched], dates])
+        states = np.concatenate([self.last_state[touched], states])
+
+        order = np.lexsort((dates, series))
+        series, dates, states = series[order], dates[order], states[order]
+
+        self.counts += count_transitions(series, states, len(self.keys))
+
+        # Last visit per series is the final element of each run
+        last = np.flatnonzero(np.append(series[1:] != series[:-1], True))
+        self.last_state[series[last]] = states[last]
+        self.last_date[series[last]] = dates[last]
+        return self
+
+    def transition_matrices(self, alpha=1.0):
+        """Row-stochastic matrices per series, shrunk towards the pooled farm-wide matrix.
+
+        A series with few visits borrows most of its behaviour from the
+        pooled counts; alpha is the weight of the pooled matrix in visits.
+        """
+        pooled = self.counts.sum(axis=0).astype('float64') + 1.0
+        pooled /= pooled.sum(axis=1, keepdims=True)
+
+        counts = self.counts + alpha * pooled[np.newaxis]
+        return counts / counts.sum(axis=2, keepdims=True)
+
+    def forecast(self, steps=1, alpha=1.0):
+        """Probability of each state after the given number of visits, for every series"""
+        matrices = np.linalg.matrix_power(self.transition_matrices(alpha), steps)
+        valid = self.last_state >= 0
+        probabilities = np.full((len(self.keys), N_STATES), np.nan)
+        probabilities[valid] = matrices[valid, self.last_state[valid]]
+        return pd.DataFrame(probabilities, index=self.keys, columns=STATES)
+
+    def save(self, path):
+        """Persist the counts so later runs only add new visits"""
+        np.savez(path, sections=np.asarray(self.keys.get_level_values('section'), dtype=str),
+                 metrics=np.asarray(self.keys.get_level_values('metric'), dtype=str),
+                 counts=self.counts, last_state=self.last_state, last_date=self.last_date)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            keys = pd.MultiIndex.from_arrays([data['sections'], data['metrics']], names=SERIES_KEYS)
+            return cls(keys, data['counts'], data['last_state'], data['last_date'])
+
+
+def prepare_visits(df):
+    """One state per (section, metric, date): the last observation recorded that day"""
+    visits = df[SERIES_KEYS + ['date', 'condition']].copy()
+    visits['date'] = parse_scout_dates(visits['date'])
+    visits['section'] = visits['section'].str.upper()
+    visits['metric'] = visits['metric'].str.lower()
+    visits['state'] = visits['condition'].str.lower().map(STATE_CODES)
+    visits = visits.dropna(subset=['date', 'state'])
+    visits['state'] = visits['state'].astype('int8')
+    return visits.drop_duplicates(subset=SERIES_KEYS + ['date'], keep='last')
+
+
+def count_transitions(series, states, n_series):
+    """Count consecutive-visit transitions for all series at once.
+
+    series and states must be sorted by series then date. Returns an
+    (n_series, 3, 3) array built with a single bincount.
+    """
+    same = series[1:] == series[:-1]
+    flat = (series[1:][same].astype('int64') * N_STATES + states[:-1][same]) * N_STATES + states[1:][same]
+    counts = np.bincount(flat, minlength=n_series * N_STATES * N_STATES)
+    return counts.reshape(n_series, N_STATES, N_STATES)
+
+
+def fail_risk_ranking(model, steps=1, top=20):
+    """Series most likely to be failing on the next visit"""
+    probabilities = model.forecast(steps).dropna()
+    current = pd.Series(np.asarray(STATES)[model.last_state.clip(min=0)], index=model.keys, name='current')
+    ranking = probabilities.join(current).sort_values('fail', ascending=False)
+    return ranking.head(top).reset_index()
+
+
+def plot_fail_risk(ranking, ax):
+    """Horizontal bar panel of next-visit fail probability"""
+    labels = ranking['section'] + ' - ' + ranking['metric']
+    colors = ['red' if p >= 0.5 else 'orange' if p >= 0.25 else 'green' for p in ranking['fail']]
+    ax.barh(range(len(ranking)), ranking['fail'], color=colors)
+    ax.set_yticks(range(len(ranking)))
+    ax.set_yticklabels(labels, fontsize=8)
+    ax.invert_yaxis()
+    ax.set_xlim(0, 1)
+    ax.set_xlabel('Probability of Fail on Next Visit')
+    ax.set_title('Likely to Fail Next Visit', fontsize=12, fontweight='bold')
+
+
+def create_condition_forecast_report(source='scout.csv', model_path=None, top=20, tiled=False):
+    """Fit (or update) the transition model, draw the fail-risk panel and report the series most likely to fail"""
+    df = load_scout_exports(source)
+
+    start = time.perf_counter()
+    model = TransitionModel.load(model_path) if model_path else TransitionModel()
+    model.update(df)
+    ranking = fail_risk_ranking(model, top=top)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if model_path:
+        model.save(model_path)
+
+    if not ranking.empty:
+        fig, ax = plt.subplots(figsize=(10, max(4, 0.35 * len(ranking))))
+        plot_fail_risk(ranking, ax)
+        plt.tight_layout()
+        output = save_dashboard(fig, 'condition_forecast_panel.png', dpi=150, tiled=tiled)
+        plt.close(fig)
+        print(f"Fail risk panel saved as '{output}'")
+
+    report = []
+    report.append("=" * 80)
+    report.append("CONDITION FORECAST: LIKELY TO FAIL ON NEXT VISIT")
+    report.append("=" * 80)
+    report.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append(f"Series Modelled: {len(model.keys)} ({int(model.counts.sum())} transitions, fitted in {elapsed:.0f} ms)")
+    report.append("")
+    for i, row in ranking.iterrows():
+        report.append(f"{i + 1:2d}. {row['section']} - {row['metric']}: fail {row['fail']:.0%}, "
+                      f"partial {row['partial']:.0%}, pass {row['pass']:.0%} (currently {row['current']})")
+    report.append("")
+    report.append("=" * 80)
+
+    with open('condition_forecast_report.txt', 'w', encoding='utf-8') as f:
+        f.write('\n'.join(report))
+    print('\n'.join(report))
+    print("\nText report saved as 'condition_forecast_report.txt'")
+    return model
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != '--tiled']
+    create_condition_forecast_report(
+        args[0] if args else 'scout.csv',
+        args[1] if len(args) > 1 else None,
+        tiled='--tiled' in sys.argv
+    )
@@ -0,0 +1,262 @@
+import hashlib
+import os
+import sys
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from scout_index import read_records, update_index
+from scout_ingest import (
+    ROW_HASH_VERSION,
+    load_scout_exports,
+    normalise_metric,
+    normalise_section,
+    parse_scout_dates
+)
+from scout_validator import FARM_DBF, SCOUT_METRIC_TYPES, read_farm_sections
+
+PAIR_KEYS = ['section', 'metric']
+
+LATEST_SUFFIX = '.latest.npz'
+
+
+def _prepare(df):
+    """Parse dates and fold spelling variants ('B1S2'/'b1-s2', 'Insect pests'/'insect pests')"""
+    df = df[PAIR_KEYS + ['date']].copy()
+    df['date'] = parse_scout_dates(df['date'])
+    df = df.dropna(subset=['date'])
+    for column, normalise in (('section', normalise_section), ('metric', normalise_metric)):
+        values = df[column].unique()
+        df[column] = df[column].map(dict(zip(values, map(normalise, values))))
+    return df
+
+
+def visit_dates(df):
+    """Distinct (section, metric, date) visits in a frame of scout rows"""
+    return _prepare(df).drop_duplicates().reset_index(drop=True)
+
+
+def build_latest_table(df):
+    """First date, last date and number of visit dates for every (section, metric) pair"""
+    visits = visit_dates(df)
+    return visits.groupby(PAIR_KEYS)['date'].agg(first_date='min', last_date='max', visits='size')
+
+
+def update_latest_table(table, new_rows, known_visits=None):
+    """Fold newly ingested rows into an existing latest-date table.
+
+    With known_visits (the visit_dates already folded into the table) a new
+    visit is any (section, metric, date) not seen before. Without them, new
+    visits are the distinct dates after a pair's last observation; rows
+    dated on or before it (late syncs) only widen the first date.
+    """
+    new = visit_dates(new_rows)
+    if new.empty:
+        return table
+
+    if known_visits is not None:
+        after = ~pd.MultiIndex.from_frame(new).isin(pd.MultiIndex.from_frame(known_visits))
+    else:
+        known_last = table['last_date'].reindex(pd.MultiIndex.from_frame(new[PAIR_KEYS]))
+        after = known_last.isna().to_numpy() | (new['date'].to_numpy() > known_last.to_numpy())
+    batch = new.groupby(PAIR_KEYS)['date'].agg(first_date='min', last_date='max')
+    batch['visits'] = new[after].groupby(PAIR_KEYS).size().reindex(batch.index).fillna(0).astype('int64')
+
+    table, batch = table.align(batch, join='outer')
+    return pd.DataFrame({
+        'first_date': pd.concat([table['first_date'], batch['first_date']], axis=1).min(axis=1),
+        'last_date': pd.concat([table['last_date'], batch['last_date']], axis=1).max(axis=1),
+        'visits': table['visits'].fillna(0).astype('int64') + batch['visits'].fillna(0).astype('int64')
+    })
+
+
+def latest_table_path(path):
+    """Sidecar location of an export's latest-date table"""
+    return path + LATEST_SUFFIX
+
+
+def _hashes_digest(hashes):
+    return hashlib.sha256(np.ascontiguousarray(hashes).tobytes()).hexdigest()
+
+
+def _load_latest_table(path):
+    """(table, visit dates, records folded, digest of their row hashes), or None without a usable sidecar"""
+    sidecar = latest_table_path(path)
+    if not os.path.exists(sidecar):
+        return None
+    try:
+        with np.load(sidecar) as data:
+            if int(data['hash_version']) != ROW_HASH_VERSION:
+                return None
+            index = pd.MultiIndex.from_arrays([data['section'], data['metric']], names=PAIR_KEYS)
+            table = pd.DataFrame({
+                'first_date': data['first_date'].astype('datetime64[ns]'),
+                'last_date': data['last_date'].astype('datetime64[ns]'),
+                'visits': data['visits']
+            }, index=index)
+            visits = pd.DataFrame({
+                'section': data['visit_section'].astype(object),
+                'metric': data['visit_metric'].astype(object),
+                'date': data['visit_date'].astype('datetime64[ns]')
+            })
+            return table, visits, int(data['records']), str(data['digest'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_latest_table(path, table, visits, records, digest):
+    sidecar = latest_table_path(path)
+    temp_path = sidecar + '.tmp.npz'
+    np.savez(
+        temp_path,
+        section=np.asarray(table.index.get_level_values('section'), dtype=str),
+        metric=np.asarray(table.index.get_level_values('metric'), dtype=str),
+        first_date=table['first_date'].to_numpy(dtype='datetime64[D]'),
+        last_date=table['last_date'].to_numpy(dtype='datetime64[D]'),
+        visits=table['visits'].to_numpy(dtype='int64'),
+        visit_section=visits['section'].to_numpy(dtype=str),
+        visit_metric=visits['metric'].to_numpy(dtype=str),
+        visit_date=visits['date'].to_numpy(dtype='datetime64[D]'),
+        records=records, digest=digest, hash_version=ROW_HASH_VERSION
+    )
+    os.replace(temp_path, sidecar)
+
+
+def load_latest_table(source):
+    """Latest-date table of an export, kept in a sidecar and updated incrementally.
+
+    The sidecar keeps the table, its distinct visit dates, how many records
+    of the export it has folded in and a digest of their row hashes (from
+    the scout_index sidecar). When those records are unchanged only the
+    records after them are parsed and folded in with update_latest_table;
+    a rewritten export is rebuilt from scratch. A directory of exports is
+    always rebuilt.
+    """
+    if os.path.isdir(source):
+        return build_latest_table(load_scout_exports(source))
+
+    index = update_index(source)
+    records = len(index.hashes)
+    saved = _load_latest_table(source)
+
+    if saved is not None and saved[2] <= records and _hashes_digest(index.hashes[:saved[2]]) == saved[3]:
+        table, visits, folded, _ = saved
+        if folded == records:
+            return table
+        new_rows = read_records(source, np.arange(folded, records), index)
+        table = update_latest_table(table, new_rows, visits)
+        visits = pd.concat([visits, visit_dates(new_rows)], ignore_index=True).drop_duplicates()
+    else:
+        rows = read_records(source, np.arange(records), index)
+        table = build_latest_table(rows)
+        visits = visit_dates(rows)
+
+    _save_latest_table(source, table, visits, records, _hashes_digest(index.hashes))
+    return table
+
+
+def pair_universe(table, dbf_path=FARM_DBF):
+    """Every section and metric a pair can have: farm.dbf sections and scout sheet
+    metrics, plus any others that appear in the data"""
+    sections = set(table.index.get_level_values('section'))
+    if os.path.exists(dbf_path):
+        sections |= read_farm_sections(dbf_path)
+    metrics = set(table.index.get_level_values('metric')) | set(SCOUT_METRIC_TYPES)
+    return sorted(sections), sorted(metrics)
+
+
+def staleness_matrix(table, as_of=None, sections=None, metrics=None):
+    """Days since last observation, cadence and overdue ratio for every pair.
+
+    With sections and metrics the matrix covers their full cross product;
+    pairs never observed get infinite days_since and overdue, so they rank
+    ahead of every observed pair. cadence_days is the mean gap between
+    visits of the pair. Pairs with a single visit (or none) borrow the
+    median cadence of their metric across sections, then the farm-wide
+    median. overdue is days_since / cadence_days, so 1.0 means a pair is
+    exactly one usual interval behind.
+    """
+    as_of = pd.Timestamp(as_of) if as_of is not None else table['last_date'].max()
+
+    result = table.copy()
+    if sections is not None and metrics is not None:
+        universe = pd.MultiIndex.from_product([sections, metrics], names=PAIR_KEYS)
+        result = result.reindex(result.index.union(universe))
+        result['visits'] = result['visits'].fillna(0).astype('int64')
+    result['days_since'] = (as_of - result['last_date']).dt.days.astype('float64').fillna(np.inf)
+    span = (result['last_date'] - result['first_date']).dt.days
+    result['cadence_days'] = (span / (result['visits'] - 1)).where(result['visits'] > 1)
+
+    metric_median = result.groupby(level='metric')['cadence_days'].transform('median')
+    result['cadence_days'] = result['cadence_days'].fillna(metric_median)
+    result['cadence_days'] = result['cadence_days'].fillna(result['cadence_days'].median()).clip(lower=1)
+
+    result['overdue'] = result['days_since'] / result['cadence_days']
+    return result
+
+
+def scout_next(matrix, top=20):
+    """Pairs ranked by how overdue they are, never-observed pairs first, then most overdue"""
+    ranked = matrix.sort_index().sort_values(['overdue', 'days_since'], ascending=False, kind='mergesort')
+    return ranked.head(top).reset_index()
+
+
+def plot_staleness_heatmap(matrix, ax):
+    """Draw days-since-last-observation for every section x metric as a heatmap panel"""
+    grid = matrix['days_since'].unstack('metric').sort_index()
+    image = ax.imshow(np.ma.masked_invalid(grid.to_numpy(dtype='float64')), cmap='YlOrRd', aspect='auto')
+    ax.set_xticks(range(len(grid.columns)))
+    ax.set_xticklabels(grid.columns, rotation=45, ha='right', fontsize=8)
+    ax.set_yticks(range(len(grid.index)))
+    ax.set_yticklabels(grid.index, fontsize=8)
+    ax.set_title('Days Since Last Observation (blank = never observed)', fontsize=12, fontweight='bold')
+    plt.colorbar(image, ax=ax, label='Days')
+    return image
+
+
+def create_coverage_staleness_report(source='scout.csv', as_of=None, top=20):
+    """Create the staleness heatmap and the ranked 'scout next' list"""
+    table = load_latest_table(source)
+    if table.empty:
+        print("No dated observations found.")
+        return
+
+    sections, metrics = pair_universe(table)
+    matrix = staleness_matrix(table, as_of, sections, metrics)
+    ranked = scout_next(matrix, top)
+    never = int(np.isinf(matrix['days_since']).sum())
+
+    fig, ax = plt.subplots(figsize=(16, max(6, 0.4 * len(sections))))
+    plot_staleness_heatmap(matrix, ax)
+    plt.tight_layout()
+    plt.savefig('coverage_staleness_heatmap.png', dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    print("Heatmap saved as 'coverage_staleness_heatmap.png'")
+
+    report = []
+    report.append("=" * 80)
+    report.append("SCOUT NEXT: MOST OVERDUE SECTION / METRIC PAIRS")
+    report.append("=" * 80)
+    report.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append(f"As Of: {(pd.Timestamp(as_of) if as_of else table['last_date'].max()).strftime('%Y-%m-%d')}")
+    report.append(f"Pairs Never Observed: {never} of {len(matrix)} ({len(sections)} sections x {len(metrics)} metrics)")
+    report.append("")
+    for i, row in ranked.iterrows():
+        if np.isinf(row['days_since']):
+            report.append(f"{i + 1:2d}. {row['section']} - {row['metric']}: never observed")
+            continue
+        report.append(f"{i + 1:2d}. {row['section']} - {row['metric']}: {row['days_since']:.0f} days since last visit "
+                      f"(usual every {row['cadence_days']:.0f} days, {row['overdue']:.1f}x overdue)")
+    report.append("")
+    report.append("=" * 80)
+
+    with open('scout_next_report.txt', 'w', encoding='utf-8') as f:
+        f.write('\n'.join(report))
+    print('\n'.join(report))
+    print("\nText report saved as 'scout_next_report.txt'")
+
+
+if __name__ == "__main__":
+    create_coverage_staleness_report(sys.argv[1] if len(sys.argv) > 1 else 'scout.csv')
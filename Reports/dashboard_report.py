@@ -4,6 +4,9 @@ import seaborn as sns
 from datetime import datetime
 import numpy as np
 from collections import defaultdict
+import sys
+from scout_ingest import load_scout_exports
+from tiled_output import save_dashboard
 
 def parse_date(date_str):
     """Parse date string to datetime object"""
@@ -22,25 +25,66 @@ def condition_to_numeric(condition):
     }
     return condition_map.get(condition.lower(), 0)
 
-def create_dashboard_report():
-    """Create comprehensive dashboard report showing section health by section and metric"""
-    
-    # Read the CSV file
-    df = pd.read_csv('scout.csv')
-    
-    # Rename the last column to 'notes' for easier access
-    df.columns = list(df.columns[:-1]) + ['notes']
-    
-    # Parse dates
+def prepare_dashboard_data(df):
+    """Parse dates and score conditions row by row, dropping undated rows"""
     df['date'] = df['date'].apply(parse_date)
     df = df.dropna(subset=['date'])
-    
-    # Convert conditions to numeric values
     df['condition_numeric'] = df['condition'].apply(condition_to_numeric)
+    return df
+
+def critical_issues_text(latest_data):
+    """Text for the critical issues panel"""
+    fail_issues = latest_data[latest_data['condition'].str.lower() == 'fail']
+    
+    if fail_issues.empty:
+        return "✅ NO CRITICAL ISSUES DETECTED\nAll sections are currently in acceptable condition."
+    
+    critical_text = "CRITICAL ISSUES REQUIRING ATTENTION:\n\n"
+    for _, row in fail_issues.iterrows():
+        critical_text += f"• {row['section']} - {row['metric']}: {row['condition']}\n"
+        if pd.notna(row['notes']) and str(row['notes']).strip():
+            critical_text += f"  Note: {row['notes']}\n"
+    return critical_text
+
+def compute_dashboard_panels(df):
+    """Everything the dashboard shows, computed from the prepared rows"""
     
     # Get the most recent date for each section
     latest_data = df.loc[df.groupby('section')['date'].idxmax()]
     
+    # Trend panel covers the last 30 days
+    latest_date = df['date'].max()
+    thirty_days_ago = latest_date - pd.Timedelta(days=30)
+    recent_data = df[df['date'] >= thirty_days_ago]
+    
+    return panels_from_latest(latest_data, recent_data.groupby('date')['condition_numeric'].mean())
+
+def compute_dashboard_panels_from_aggregates(aggregates):
+    """The same panels from chunked DashboardAggregates, without the rows"""
+    thirty_days_ago = aggregates.max_date - pd.Timedelta(days=30)
+    return panels_from_latest(aggregates.latest_data(), aggregates.daily_health(since=thirty_days_ago))
+
+def panels_from_latest(latest_data, daily_health):
+    """Panels from the latest row per section and the daily average health scores"""
+    return {
+        'latest_data': latest_data,
+        'current_pivot': latest_data.pivot_table(
+            index='section', 
+            columns='metric', 
+            values='condition_numeric', 
+            aggfunc='first'
+        ),
+        'section_scores': latest_data.groupby('section')['condition_numeric'].mean().sort_values(ascending=True),
+        'metric_performance': latest_data.groupby('metric')['condition_numeric'].mean().sort_values(ascending=True),
+        'condition_counts': latest_data['condition'].value_counts(),
+        'section_activity': latest_data.groupby('section').size().sort_values(ascending=True),
+        'daily_health': daily_health,
+        'critical_text': critical_issues_text(latest_data)
+    }
+
+def draw_dashboard(panels):
+    """Build the dashboard figure from computed panels"""
+    
     # Create the dashboard
     fig = plt.figure(figsize=(20, 16))
     
@@ -50,16 +94,8 @@ def create_dashboard_report():
     # 1. Current Health Status by Section (Heatmap)
     ax1 = fig.add_subplot(gs[0, :2])
     
-    # Create pivot table for current conditions
-    current_pivot = latest_data.pivot_table(
-        index='section', 
-        columns='metric', 
-        values='condition_numeric', 
-        aggfunc='first'
-    )
-    
     # Create heatmap
-    sns.heatmap(current_pivot, annot=True, cmap='RdYlGn', center=2, 
+    sns.heatmap(panels['current_pivot'], annot=True, cmap='RdYlGn', center=2, 
                 cbar_kws={'label': 'Condition (1=Fail, 2=Partial, 3=Pass)'}, ax=ax1)
     ax1.set_title('Current Health Status by Section and Metric', fontsize=14, fontweight='bold')
     ax1.set_xlabel('Metric')
@@ -68,8 +104,7 @@ def create_dashboard_report():
     # 2. Overall Section Health Score
     ax2 = fig.add_subplot(gs[0, 2])
     
-    # Calculate average health score per section
-    section_scores = latest_data.groupby('section')['condition_numeric'].mean().sort_values(ascending=True)
+    section_scores = panels['section_scores']
     
     bars = ax2.barh(range(len(section_scores)), section_scores.values, color='skyblue')
     ax2.set_yticks(range(len(section_scores)))
@@ -87,7 +122,7 @@ def create_dashboard_report():
     # 3. Metric Performance Distribution
     ax3 = fig.add_subplot(gs[1, 0])
     
-    metric_performance = latest_data.groupby('metric')['condition_numeric'].mean().sort_values(ascending=True)
+    metric_performance = panels['metric_performance']
     
     bars = ax3.barh(range(len(metric_performance)), metric_performance.values, color='lightgreen')
     ax3.set_yticks(range(len(metric_performance)))
@@ -99,7 +134,7 @@ def create_dashboard_report():
     # 4. Condition Distribution
     ax4 = fig.add_subplot(gs[1, 1])
     
-    condition_counts = latest_data['condition'].value_counts()
+    condition_counts = panels['condition_counts']
     colors = ['red', 'orange', 'green']
     ax4.pie(condition_counts.values, labels=condition_counts.index, autopct='%1.1f%%', 
             colors=colors, startangle=90)
@@ -108,7 +143,7 @@ def create_dashboard_report():
     # 5. Section Activity (Number of metrics monitored)
     ax5 = fig.add_subplot(gs[1, 2])
     
-    section_activity = latest_data.groupby('section').size().sort_values(ascending=True)
+    section_activity = panels['section_activity']
     
     bars = ax5.barh(range(len(section_activity)), section_activity.values, color='lightcoral')
     ax5.set_yticks(range(len(section_activity)))
@@ -119,15 +154,9 @@ def create_dashboard_report():
     # 6. Time Series of Health Trends (Last 30 days)
     ax6 = fig.add_subplot(gs[2, :])
     
-    # Get data from last 30 days
-    latest_date = df['date'].max()
-    thirty_days_ago = latest_date - pd.Timedelta(days=30)
-    recent_data = df[df['date'] >= thirty_days_ago]
+    daily_health = panels['daily_health']
     
-    if not recent_data.empty:
-        # Calculate daily average health score
-        daily_health = recent_data.groupby('date')['condition_numeric'].mean()
-        
+    if not daily_health.empty:
         ax6.plot(daily_health.index, daily_health.values, marker='o', linewidth=2, markersize=6)
         ax6.set_title('Overall Health Trend (Last 30 Days)', fontsize=14, fontweight='bold')
         ax6.set_xlabel('Date')
@@ -145,39 +174,55 @@ def create_dashboard_report():
     ax7 = fig.add_subplot(gs[3, :])
     ax7.axis('off')
     
-    # Find sections with fail conditions
-    fail_issues = latest_data[latest_data['condition'].str.lower() == 'fail']
+    ax7.text(0.05, 0.95, panels['critical_text'], transform=ax7.transAxes, fontsize=11,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
     
-    if not fail_issues.empty:
-        critical_text = "CRITICAL ISSUES REQUIRING ATTENTION:\n\n"
-        for _, row in fail_issues.iterrows():
-            critical_text += f"• {row['section']} - {row['metric']}: {row['condition']}\n"
-            if pd.notna(row['notes']) and str(row['notes']).strip():
-                critical_text += f"  Note: {row['notes']}\n"
-    else:
-        critical_text = "✅ NO CRITICAL ISSUES DETECTED\nAll sections are currently in acceptable condition."
+    return fig
+
+def create_dashboard_report(source='scout.csv', tiled=False):
+    """Create comprehensive dashboard report showing section health by section and metric"""
     
-    ax7.text(0.05, 0.95, critical_text, transform=ax7.transAxes, fontsize=11,
-             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
+    # Read the scout exports (a single CSV or a directory of CSVs)
+    df = prepare_dashboard_data(load_scout_exports(source))
+    
+    panels = compute_dashboard_panels(df)
+    fig = draw_dashboard(panels)
     
     # Save the dashboard
-    plt.savefig('section_health_dashboard.png', dpi=300, bbox_inches='tight')
-    print("Dashboard saved as 'section_health_dashboard.png'")
+    output = save_dashboard(fig, 'section_health_dashboard.png', dpi=300, tiled=tiled)
+    print(f"Dashboard saved as '{output}'")
     
     # Generate text report
-    generate_text_report(df, latest_data)
+    generate_text_report(df, panels['latest_data'])
     
     plt.show()
 
+def create_dashboard_from_aggregates(aggregates, tiled=False):
+    """Render the dashboard and text report from DashboardAggregates (e.g. of the ingest store)"""
+    
+    panels = compute_dashboard_panels_from_aggregates(aggregates)
+    fig = draw_dashboard(panels)
+    
+    output = save_dashboard(fig, 'section_health_dashboard.png', dpi=300, tiled=tiled)
+    print(f"Dashboard saved as '{output}'")
+    plt.close(fig)
+    
+    write_text_report(panels['latest_data'], aggregates.min_date, aggregates.max_date,
+                      aggregates.total_observations)
+
 def generate_text_report(df, latest_data):
     """Generate a detailed text report"""
+    write_text_report(latest_data, df['date'].min(), df['date'].max(), len(df))
+
+def format_text_report(latest_data, first_date, last_date, total_observations):
+    """Text report lines from the latest row per section and the totals of the whole history"""
     
     report = []
     report.append("=" * 80)
     report.append("FARM SECTION HEALTH DASHBOARD REPORT")
     report.append("=" * 80)
     report.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append(f"Data Range: {df['date'].min().strftime('%Y-%m-%d')} to {df['date'].max().strftime('%Y-%m-%d')}")
+    report.append(f"Data Range: {first_date.strftime('%Y-%m-%d')} to {last_date.strftime('%Y-%m-%d')}")
     report.append("")
     
     # Summary Statistics
@@ -185,7 +230,7 @@ def generate_text_report(df, latest_data):
     report.append("-" * 40)
     report.append(f"Total Sections Monitored: {latest_data['section'].nunique()}")
     report.append(f"Total Metrics Tracked: {latest_data['metric'].nunique()}")
-    report.append(f"Total Observations: {len(df)}")
+    report.append(f"Total Observations: {total_observations}")
     report.append("")
     
     # Section Health Rankings
@@ -241,6 +286,11 @@ def generate_text_report(df, latest_data):
     
     report.append("")
     report.append("=" * 80)
+    return report
+
+def write_text_report(latest_data, first_date, last_date, total_observations):
+    """Save and print the text report"""
+    report = format_text_report(latest_data, first_date, last_date, total_observations)
     
     # Save text report
     with open('section_health_report.txt', 'w', encoding='utf-8') as f:
@@ -251,4 +301,5 @@ def generate_text_report(df, latest_data):
     print("\nText report saved as 'section_health_report.txt'")
 
 if __name__ == "__main__":
-    create_dashboard_report() 
\ No newline at end of file
+    args = [arg for arg in sys.argv[1:] if arg != '--tiled']
+    create_dashboard_report(args[0] if args else 'scout.csv', tiled='--tiled' in sys.argv) 
\ No newline at end of file
@@ -0,0 +1,675 @@
+import os
+import sys
+import time
+
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import ListedColormap, Normalize
+
+import dashboard_report
+import moisture_dashboard
+import section_summary_dashboard
+from downsample import downsample_series, pixel_budget
+from scout_ingest import conditions_to_numeric, load_scout_exports, parse_scout_dates
+
+CONDITIONS = ['pass', 'partial', 'fail']
+CONDITION_COLORS = ['green', 'orange', 'red']
+
+
+def score_color(score):
+    """Bar colour used by the dashboards for a health score"""
+    return 'red' if score < 1.5 else 'orange' if score < 2.5 else 'green'
+
+
+class SectionDashboardTemplate:
+    """Section dashboard whose layout is built once and refilled per section.
+
+    The figure, gridspec, axes, tick labels and text boxes are created in
+    the constructor. update() only changes artist data (bar widths and
+    colours, the heatmap array, line data and text), so rendering many
+    sections costs one layout plus one draw per section.
+    """
+
+    def __init__(self, metrics, n_visits=12, figsize=(20, 16)):
+        self.metrics = list(metrics)
+        self.n_visits = n_visits
+
+        self.fig = plt.figure(figsize=figsize)
+        gs = self.fig.add_gridspec(3, 3, hspace=0.4, wspace=0.3, height_ratios=[2, 1, 1])
+        self.title = self.fig.suptitle('', fontsize=16, fontweight='bold')
+
+        # 1. Current score per metric
+        self.ax_metrics = self.fig.add_subplot(gs[0, 0])
+        positions = range(len(self.metrics))
+        self.metric_bars = self.ax_metrics.barh(positions, np.zeros(len(self.metrics)), color='lightblue')
+        self.ax_metrics.set_yticks(positions)
+        self.ax_metrics.set_yticklabels(self.metrics, fontsize=8)
+        # First metric at the top, like the rows of the history heatmap beside it
+        self.ax_metrics.invert_yaxis()
+        self.ax_metrics.set_xlim(0, 3)
+        self.ax_metrics.set_xlabel('Health Score (1=Fail, 2=Partial, 3=Pass)')
+        self.ax_metrics.set_title('Current Metric Scores', fontsize=12, fontweight='bold')
+
+        # 2. Metric history over the most recent visits
+        self.ax_history = self.fig.add_subplot(gs[0, 1:])
+        empty = np.ma.masked_all((len(self.metrics), n_visits))
+        self.history_image = self.ax_history.imshow(empty, cmap='RdYlGn', vmin=0, vmax=3, aspect='auto')
+        self.ax_history.set_yticks(positions)
+        self.ax_history.set_yticklabels(self.metrics, fontsize=8)
+        self.ax_history.set_xticks(range(n_visits))
+        self.ax_history.set_title(f'Metric History (Last {n_visits} Visits)', fontsize=12, fontweight='bold')
+        self.fig.colorbar(self.history_image, ax=self.ax_history, label='Condition (1=Fail, 2=Partial, 3=Pass)')
+
+        # 3. Condition distribution
+        self.ax_conditions = self.fig.add_subplot(gs[1, 0])
+        self.condition_bars = self.ax_conditions.bar(CONDITIONS, np.zeros(len(CONDITIONS)), color=CONDITION_COLORS)
+        self.ax_conditions.set_ylabel('Number of Observations')
+        self.ax_conditions.set_title('Condition Distribution', fontsize=12, fontweight='bold')
+
+        # 4. Health trend
+        self.ax_trend = self.fig.add_subplot(gs[1, 1:])
+        self.trend_line, = self.ax_trend.plot([], [], marker='o', linewidth=2, markersize=4)
+        self.ax_trend.xaxis_date()
+        self.ax_trend.set_ylim(0, 3)
+        self.ax_trend.set_xlabel('Date')
+        self.ax_trend.set_ylabel('Average Health Score')
+        self.ax_trend.set_title('Health Trend', fontsize=12, fontweight='bold')
+        self.ax_trend.grid(True, alpha=0.3)
+
+        # 5. Current issues
+        self.ax_notes = self.fig.add_subplot(gs[2, :])
+        self.ax_notes.axis('off')
+        self.notes_text = self.ax_notes.text(
+            0.02, 0.95, '', transform=self.ax_notes.transAxes, fontsize=10, verticalalignment='top',
+            bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8)
+        )
+
+    def update(self, section, section_df, latest_df):
+        """Fill the template with one section's observations and latest rows"""
+        self.title.set_text(f'Section {section} Health Dashboard')
+
+        # Metric bars keep their fixed positions; unobserved metrics stay at 0
+        latest_scores = latest_df.set_index('metric')['condition_numeric']
+        scores = latest_scores.reindex(self.metrics).fillna(0).to_numpy()
+        for bar, score in zip(self.metric_bars, scores):
+            bar.set_width(score)
+            bar.set_color(score_color(score) if score > 0 else 'lightgrey')
+
+        # Heatmap of the last n visits, oldest on the left
+        visits = np.sort(section_df['date'].unique())[-self.n_visits:]
+        recent = section_df[section_df['date'].isin(visits)]
+        grid = recent.pivot_table(index='metric', columns='date', values='condition_numeric', aggfunc='last')
+        grid = grid.reindex(index=self.metrics, columns=visits)
+        history = np.ma.masked_invalid(
+            np.pad(grid.to_numpy(dtype='float64'), ((0, 0), (self.n_visits - len(visits), 0)),
+                   constant_values=np.nan)
+        )
+        self.history_image.set_data(history)
+        labels = [''] * (self.n_visits - len(visits)) + [pd.Timestamp(d).strftime('%d/%m/%y') for d in visits]
+        self.ax_history.set_xticklabels(labels, rotation=45, ha='right', fontsize=8)
+
+        # Condition counts
+        counts = section_df['condition'].str.lower().value_counts().reindex(CONDITIONS).fillna(0)
+        for bar, count in zip(self.condition_bars, counts.to_numpy()):
+            bar.set_height(count)
+        self.ax_conditions.set_ylim(0, max(1, counts.max()) * 1.1)
+
+        # Trend line
+        daily = section_df.groupby('date')['condition_numeric'].mean()
+        days = mdates.date2num(daily.index)
+        self.trend_line.set_data(days, daily.to_numpy())
+        if len(days):
+            self.ax_trend.set_xlim(days.min() - 1, days.max() + 1)
+
+        # Issues text
+        issues = latest_df[latest_df['condition_numeric'] < 3]
+        if issues.empty:
+            text = "✅ NO CURRENT ISSUES\nAll metrics in this section are passing."
+        else:
+            text = "CURRENT ISSUES:\n\n"
+            for _, row in issues.iterrows():
+                text += f"• {row['metric']}: {row['condition']}"
+                if pd.notna(row['notes']) and str(row['notes']).strip():
+                    text += f" - {row['notes']}"
+                text += "\n"
+        self.notes_text.set_text(text)
+        return self
+
+    def save(self, path, dpi=100):
+        """Save the current variant; the layout is fixed so no tight bbox pass is needed"""
+        self.fig.savefig(path, dpi=dpi)
+
+    def close(self):
+        plt.close(self.fig)
+
+
+class BarPanel:
+    """Horizontal bars with room for up to capacity categories.
+
+    Bars are created once; update() sets their widths, colours and tick
+    labels, and hides the bars a variant does not use.
+    """
+
+    def __init__(self, ax, capacity, color, value_format=None, label_offset=0.05, label_kwargs=None,
+                 fontsize=None):
+        self.ax = ax
+        self.color = color
+        self.value_format = value_format
+        self.label_offset = label_offset
+        self.fontsize = fontsize
+        self.bars = ax.barh(range(capacity), np.zeros(capacity), color=color)
+        self.labels = [
+            ax.text(0, i, '', ha='left', va='center', **(label_kwargs or {})) for i in range(capacity)
+        ] if value_format else []
+
+    def update(self, values, colors=None, xlim=None):
+        """Show a Series of values, one bar per index entry from the bottom up"""
+        n = len(values)
+        colors = colors if colors is not None else [self.color] * n
+        for i, bar in enumerate(self.bars):
+            visible = i < n
+            bar.set_visible(visible)
+            if visible:
+                bar.set_width(values.iloc[i])
+                bar.set_color(colors[i])
+            if self.labels:
+                self.labels[i].set_visible(visible)
+                if visible:
+                    self.labels[i].set_x(values.iloc[i] + self.label_offset)
+                    self.labels[i].set_text(self.value_format(values.iloc[i]))
+
+        self.ax.set_yticks(range(n))
+        self.ax.set_yticklabels(values.index, fontsize=self.fontsize)
+        # Same limits autoscaling gives 0.8-high bars, so the layout matches a fresh figure
+        low, high = -0.4, n - 0.6
+        pad = (high - low) * 0.05
+        self.ax.set_ylim(low - pad, high + pad)
+        if xlim is not None:
+            self.ax.set_xlim(*xlim)
+        elif n:
+            low, high = min(0, values.min()), max(0, values.max())
+            pad = (high - low) * 0.05 or 0.5
+            self.ax.set_xlim(low - (pad if low < 0 else 0), high + pad)
+
+
+class PiePanel:
+    """Pie chart whose wedges and labels are moved rather than redrawn"""
+
+    def __init__(self, ax, capacity, colors, startangle=90, labeldistance=1.1, pctdistance=0.6):
+        self.ax = ax
+        self.colors = colors
+        self.startangle = startangle
+        self.labeldistance = labeldistance
+        self.pctdistance = pctdistance
+        self.wedges, self.texts, self.autotexts = ax.pie(
+            np.ones(capacity), labels=[''] * capacity, autopct='%1.1f%%', colors=colors, startangle=startangle
+        )
+
+    def update(self, counts):
+        """Show a Series of counts in its own order, like ax.pie(counts.values, labels=counts.index)"""
+        total = counts.sum()
+        theta1 = self.startangle / 360
+        for i, (wedge, text, autotext) in enumerate(zip(self.wedges, self.texts, self.autotexts)):
+            visible = i < len(counts) and total > 0
+            for artist in (wedge, text, autotext):
+                artist.set_visible(visible)
+            if not visible:
+                continue
+
+            fraction = counts.iloc[i] / total
+            theta2 = theta1 + fraction
+            wedge.set_theta1(360 * theta1)
+            wedge.set_theta2(360 * theta2)
+            wedge.set_facecolor(self.colors[i % len(self.colors)])
+
+            middle = np.pi * (theta1 + theta2)
+            x, y = np.cos(middle), np.sin(middle)
+            text.set_position((self.labeldistance * x, self.labeldistance * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            text.set_text(str(counts.index[i]))
+            autotext.set_position((self.pctdistance * x, self.pctdistance * y))
+            autotext.set_text(f'{fraction * 100:1.1f}%')
+            theta1 = theta2
+
+
+def _set_line(ax, line, dates, values):
+    """Point a date line at new data and fit the x axis around it"""
+    days = mdates.date2num(pd.DatetimeIndex(dates))
+    line.set_data(days, np.asarray(values, dtype='float64'))
+    line.set_visible(len(days) > 0)
+    if len(days):
+        pad = max((days.max() - days.min()) * 0.05, 1)
+        ax.set_xlim(days.min() - pad, days.max() + pad)
+    return days
+
+
+def _text_color(cmap, norm, value):
+    """Black or white annotation text, whichever reads better on the cell colour (as seaborn picks)"""
+    r, g, b, _ = cmap(norm(value))
+    luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    return 'black' if luminance > 0.408 else 'white'
+
+
+class HealthDashboardTemplate:
+    """dashboard_report's section health dashboard, laid out once and refilled per variant.
+
+    Takes the panels computed by dashboard_report.compute_dashboard_panels.
+    Artists are created for every section and metric of the history; each
+    variant shows and moves the ones it needs.
+    """
+
+    def __init__(self, sections, metrics, conditions, figsize=(20, 16)):
+        self.sections = list(sections)
+        self.metrics = list(metrics)
+
+        self.fig = plt.figure(figsize=figsize)
+        gs = self.fig.add_gridspec(4, 3, hspace=0.3, wspace=0.3)
+        self.title = self.fig.suptitle('', fontsize=16, fontweight='bold')
+
+        # 1. Current health status heatmap, sized to each variant's sections and metrics
+        self.ax_heatmap = self.fig.add_subplot(gs[0, :2])
+        self.cmap = plt.get_cmap('RdYlGn')
+        self.norm = Normalize(vmin=1, vmax=3)
+        self.heatmap = self.ax_heatmap.imshow(np.ma.masked_all((1, 1)), cmap=self.cmap, norm=self.norm,
+                                              aspect='auto', interpolation='nearest')
+        self.cells = [[self.ax_heatmap.text(j, i, '', ha='center', va='center')
+                       for j in range(len(self.metrics))] for i in range(len(self.sections))]
+        self.colorbar = self.fig.colorbar(self.heatmap, ax=self.ax_heatmap,
+                                          label='Condition (1=Fail, 2=Partial, 3=Pass)')
+        self.ax_heatmap.set_title('Current Health Status by Section and Metric', fontsize=14, fontweight='bold')
+        self.ax_heatmap.set_xlabel('Metric')
+        self.ax_heatmap.set_ylabel('Section')
+
+        # 2. Overall section health score
+        ax = self.fig.add_subplot(gs[0, 2])
+        self.section_bars = BarPanel(ax, len(self.sections), 'skyblue', value_format=lambda v: f'{v:.1f}')
+        ax.set_xlabel('Average Health Score')
+        ax.set_title('Overall Section Health Score\n(Current)', fontsize=12, fontweight='bold')
+
+        # 3. Metric performance
+        ax = self.fig.add_subplot(gs[1, 0])
+        self.metric_bars = BarPanel(ax, len(self.metrics), 'lightgreen', fontsize=8)
+        ax.set_xlabel('Average Score')
+        ax.set_title('Metric Performance\n(Current)', fontsize=12, fontweight='bold')
+
+        # 4. Condition distribution
+        ax = self.fig.add_subplot(gs[1, 1])
+        self.condition_pie = PiePanel(ax, len(conditions), ['red', 'orange', 'green'])
+        ax.set_title('Current Condition Distribution', fontsize=12, fontweight='bold')
+
+        # 5. Section activity
+        ax = self.fig.add_subplot(gs[1, 2])
+        self.activity_bars = BarPanel(ax, len(self.sections), 'lightcoral', fontsize=8)
+        ax.set_xlabel('Number of Metrics Monitored')
+        ax.set_title('Section Activity\n(Metrics Monitored)', fontsize=12, fontweight='bold')
+
+        # 6. Health trend with its least-squares line
+        self.ax_trend = self.fig.add_subplot(gs[2, :])
+        self.trend_line, = self.ax_trend.plot([], [], marker='o', linewidth=2, markersize=6, color='tab:blue')
+        self.fit_line, = self.ax_trend.plot([], [], 'r--', alpha=0.8, label='Trend')
+        self.ax_trend.xaxis_date()
+        self.ax_trend.set_title('Overall Health Trend (Last 30 Days)', fontsize=14, fontweight='bold')
+        self.ax_trend.set_xlabel('Date')
+        self.ax_trend.set_ylabel('Average Health Score')
+        self.ax_trend.grid(True, alpha=0.3)
+        self.ax_trend.set_ylim(0, 3)
+        self.ax_trend.legend()
+
+        # 7. Critical issues
+        ax = self.fig.add_subplot(gs[3, :])
+        ax.axis('off')
+        self.critical_text = ax.text(0.05, 0.95, '', transform=ax.transAxes, fontsize=11, verticalalignment='top',
+                                     bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
+
+    def update(self, panels, title=''):
+        """Fill the template with one variant's panels"""
+        self.title.set_text(title)
+
+        pivot = panels['current_pivot']
+        grid = pivot.to_numpy(dtype='float64')
+        rows, columns = grid.shape
+        self.heatmap.set_data(np.ma.masked_invalid(grid))
+        self.heatmap.set_extent((-0.5, columns - 0.5, rows - 0.5, -0.5))
+        self.ax_heatmap.set_xlim(-0.5, columns - 0.5)
+        self.ax_heatmap.set_ylim(rows - 0.5, -0.5)
+        self.ax_heatmap.set_xticks(range(columns))
+        self.ax_heatmap.set_xticklabels(pivot.columns, rotation=90 if columns > 8 else 0)
+        self.ax_heatmap.set_yticks(range(rows))
+        self.ax_heatmap.set_yticklabels(pivot.index)
+
+        # Colours centred on 2 (partial) over the variant's range, as seaborn's center=2 does
+        low, high = np.nanmin(grid), np.nanmax(grid)
+        spread = max(high - 2, 2 - low) or 1
+        self.norm.vmin, self.norm.vmax = 2 - spread, 2 + spread
+        self.colorbar.ax.set_ylim(low, high if high > low else low + 1)
+
+        for i, cell_row in enumerate(self.cells):
+            for j, cell in enumerate(cell_row):
+                value = grid[i, j] if i < rows and j < columns else np.nan
+                cell.set_visible(not np.isnan(value))
+                if not np.isnan(value):
+                    cell.set_text(f'{value:.2g}')
+                    cell.set_color(_text_color(self.cmap, self.norm, value))
+
+        self.section_bars.update(panels['section_scores'], xlim=(0, 3))
+        self.metric_bars.update(panels['metric_performance'], xlim=(0, 3))
+        self.condition_pie.update(panels['condition_counts'])
+        self.activity_bars.update(panels['section_activity'])
+
+        daily_health = panels['daily_health']
+        days = _set_line(self.ax_trend, self.trend_line, daily_health.index, daily_health.values)
+        if len(days) >= 2:
+            positions = np.arange(len(days))
+            fit = np.poly1d(np.polyfit(positions, daily_health.values, 1))
+            self.fit_line.set_data(days, fit(positions))
+        self.fit_line.set_visible(len(days) >= 2)
+
+        self.critical_text.set_text(panels['critical_text'])
+        return self
+
+    def save(self, path, dpi=100):
+        self.fig.savefig(path, dpi=dpi)
+
+    def close(self):
+        plt.close(self.fig)
+
+
+class SummaryDashboardTemplate:
+    """section_summary_dashboard's layout, refilled from compute_summary_panels output"""
+
+    def __init__(self, sections, metrics, conditions, figsize=(20, 16)):
+        self.fig = plt.figure(figsize=figsize)
+        gs = self.fig.add_gridspec(4, 3, hspace=0.4, wspace=0.3)
+        self.title = self.fig.suptitle('', fontsize=16, fontweight='bold')
+
+        # 1. Section health summary, bars coloured by score
+        ax = self.fig.add_subplot(gs[0, :2])
+        self.section_bars = BarPanel(ax, len(sections), 'green', value_format=lambda v: f'{v:.1f}',
+                                     label_kwargs={'fontweight': 'bold'})
+        ax.set_xlabel('Health Score (1=Fail, 2=Partial, 3=Pass)')
+        ax.set_title('Section Health Summary (Last 200 Lines)', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+
+        # 2. Metric performance
+        ax = self.fig.add_subplot(gs[0, 2])
+        self.metric_bars = BarPanel(ax, len(metrics), 'lightblue', fontsize=9)
+        ax.set_xlabel('Average Score')
+        ax.set_title('Metric Performance\n(Last 200 Lines)', fontsize=12, fontweight='bold')
+
+        # 3. Condition distribution
+        ax = self.fig.add_subplot(gs[1, 0])
+        self.condition_pie = PiePanel(ax, len(conditions), ['red', 'orange', 'green'])
+        ax.set_title('Condition Distribution\n(Last 200 Lines)', fontsize=12, fontweight='bold')
+
+        # 4. Section activity
+        ax = self.fig.add_subplot(gs[1, 1])
+        self.activity_bars = BarPanel(ax, len(sections), 'lightcoral', fontsize=8)
+        ax.set_xlabel('Number of Observations')
+        ax.set_title('Section Activity\n(Last 200 Lines)', fontsize=12, fontweight='bold')
+
+        # 5. Recent health trend
+        self.ax_trend = self.fig.add_subplot(gs[1, 2])
+        self.trend_line, = self.ax_trend.plot([], [], marker='o', linewidth=2, markersize=4, color='tab:blue')
+        self.ax_trend.xaxis_date()
+        self.ax_trend.set_title('Recent Health Trend\n(Last 200 Lines)', fontsize=12, fontweight='bold')
+        self.ax_trend.set_xlabel('Date')
+        self.ax_trend.set_ylabel('Average Health Score')
+        self.ax_trend.grid(True, alpha=0.3)
+        self.ax_trend.set_ylim(0, 3)
+        self.ax_trend.tick_params(axis='x', labelrotation=45)
+
+        # 6. Warning notes and 7. detailed section analysis
+        ax = self.fig.add_subplot(gs[2, :])
+        ax.axis('off')
+        self.warning_text = ax.text(0.05, 0.95, '', transform=ax.transAxes, fontsize=10, verticalalignment='top',
+                                    bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
+        ax = self.fig.add_subplot(gs[3, :])
+        ax.axis('off')
+        self.analysis_text = ax.text(0.05, 0.95, '', transform=ax.transAxes, fontsize=9, verticalalignment='top',
+                                     bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+
+    def update(self, panels, title=''):
+        """Fill the template with one variant's panels"""
+        self.title.set_text(title)
+        scores = panels['section_scores']
+        self.section_bars.update(scores, colors=[score_color(score) for score in scores.values], xlim=(0, 3))
+        self.metric_bars.update(panels['metric_performance'], xlim=(0, 3))
+        self.condition_pie.update(panels['condition_counts'])
+        self.activity_bars.update(panels['section_activity'])
+        daily_health = panels['daily_health']
+        _set_line(self.ax_trend, self.trend_line, daily_health.index, daily_health.values)
+        self.warning_text.set_text(panels['warning_text'])
+        self.analysis_text.set_text(panels['analysis_text'])
+        return self
+
+    def save(self, path, dpi=100):
+        self.fig.savefig(path, dpi=dpi)
+
+    def close(self):
+        plt.close(self.fig)
+
+
+class MoistureDashboardTemplate:
+    """moisture_dashboard's layout, refilled from compute_moisture_panels output"""
+
+    def __init__(self, sections, figsize=(6, 40), full_resolution=False):
+        self.full_resolution = full_resolution
+        capacity = len(sections)
+
+        self.fig = plt.figure(figsize=figsize)
+        gs = self.fig.add_gridspec(5, 1, hspace=0.5, wspace=0.3, height_ratios=[1, 1.5, 1.5, 1, 2])
+        self.title = self.fig.suptitle('', fontsize=14, fontweight='bold')
+
+        # Current moisture status, one cell per section
+        self.ax_heatmap = self.fig.add_subplot(gs[0, :])
+        self.cmap = ListedColormap(['red', 'orange', 'green'])
+        self.heatmap = self.ax_heatmap.imshow(np.ma.masked_all((1, capacity)), cmap=self.cmap, aspect='auto',
+                                              vmin=0.5, vmax=3.5)
+        self.cells = [self.ax_heatmap.text(i, 0, '', ha='center', va='center', fontweight='bold', fontsize=10)
+                      for i in range(capacity)]
+        self.ax_heatmap.set_yticks([])
+        self.ax_heatmap.set_title('Current Moisture Status Heatmap', fontsize=12, fontweight='bold')
+
+        # Trend over the last 60 days
+        ax = self.fig.add_subplot(gs[1, :])
+        self.trend_bars = BarPanel(ax, capacity, 'green', fontsize=9)
+        ax.set_xlabel('Trend (Negative = Worsening, Positive = Improving)')
+        ax.set_title('Moisture Trend Analysis (Last 60 Days)', fontsize=12, fontweight='bold')
+        ax.axvline(x=0, color='black', linestyle='--', alpha=0.5)
+        ax.grid(True, alpha=0.3)
+
+        # Monitoring activity
+        ax = self.fig.add_subplot(gs[2, :])
+        self.activity_bars = BarPanel(ax, capacity, 'grey', value_format=lambda v: f'{int(v)}', label_offset=0.1,
+                                      label_kwargs={'fontsize': 8}, fontsize=9)
+        ax.set_xlabel('Number of Observations')
+        ax.set_title('Section Monitoring Activity', fontsize=12, fontweight='bold')
+
+        # Monthly averages
+        self.ax_monthly = self.fig.add_subplot(gs[3, :])
+        self.monthly_line, = self.ax_monthly.plot([], [], marker='o', linewidth=2, markersize=8, color='blue')
+        self.ax_monthly.set_ylabel('Average Moisture Score')
+        self.ax_monthly.set_title('Monthly Average Moisture Conditions', fontsize=12, fontweight='bold')
+        self.ax_monthly.grid(True, alpha=0.3)
+        self.ax_monthly.set_ylim(0.5, 3.5)
+        self.ax_monthly.axhline(y=2.5, color='green', linestyle='--', alpha=0.7, label='Good Threshold')
+        self.ax_monthly.axhline(y=1.5, color='orange', linestyle='--', alpha=0.7, label='Fair Threshold')
+        self.ax_monthly.legend()
+
+        # Critical issues and alerts
+        ax = self.fig.add_subplot(gs[4, :])
+        ax.axis('off')
+        self.issues_text = ax.text(0.05, 0.95, '', transform=ax.transAxes, fontsize=10, verticalalignment='top',
+                                   fontfamily='monospace',
+                                   bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8))
+
+    def update(self, panels, title=''):
+        """Fill the template with one variant's panels"""
+        self.title.set_text(title)
+
+        scores = panels['section_scores']
+        n = len(scores)
+        self.heatmap.set_data(np.ma.masked_invalid(scores.to_numpy(dtype='float64').reshape(1, -1)))
+        self.heatmap.set_extent((-0.5, n - 0.5, 0.5, -0.5))
+        self.ax_heatmap.set_xlim(-0.5, n - 0.5)
+        self.ax_heatmap.set_xticks(range(n))
+        self.ax_heatmap.set_xticklabels(scores.index, rotation=45, ha='right', fontsize=9)
+        for i, cell in enumerate(self.cells):
+            cell.set_visible(i < n)
+            if i < n:
+                score = scores.iloc[i]
+                cell.set_text(f'{score:.1f}')
+                cell.set_color('white' if score < 2 else 'black')
+
+        trend_df = panels['section_trends']
+        if trend_df is None:
+            trend_df = pd.DataFrame({'section': [], 'trend': []})
+        trends = trend_df.set_index('section')['trend']
+        self.trend_bars.update(trends, colors=['red' if t < -0.5 else 'orange' if t < 0.5 else 'green'
+                                               for t in trends])
+
+        activity = panels['section_activity']
+        self.activity_bars.update(activity, colors=plt.cm.viridis(np.linspace(0, 1, len(activity))))
+
+        monthly_avg = panels['monthly_avg']
+        if not self.full_resolution:
+            monthly_avg = downsample_series(monthly_avg, 'position', 'condition_numeric',
+                                            max_points=pixel_budget(self.ax_monthly), method='lttb')
+        self.monthly_line.set_data(monthly_avg['position'], monthly_avg['condition_numeric'])
+        self.ax_monthly.set_xticks(monthly_avg['position'])
+        self.ax_monthly.set_xticklabels(monthly_avg['month'], rotation=45, ha='right')
+        if len(monthly_avg):
+            self.ax_monthly.set_xlim(monthly_avg['position'].min() - 0.5, monthly_avg['position'].max() + 0.5)
+
+        self.issues_text.set_text(panels['issues_text'])
+        return self
+
+    def save(self, path, dpi=100):
+        self.fig.savefig(path, dpi=dpi)
+
+    def close(self):
+        plt.close(self.fig)
+
+
+def prepare_section_frames(df):
+    """Parse a loaded scout frame once and split it into per-section observations and latest rows"""
+    df = df.copy()
+    df['date'] = parse_scout_dates(df['date'])
+    df = df.dropna(subset=['date'])
+    df['condition_numeric'] = conditions_to_numeric(df['condition'])
+
+    latest = df.sort_values('date', ascending=False, kind='mergesort')
+    latest = latest.drop_duplicates(subset=['section', 'metric'], keep='first')
+
+    sections = dict(tuple(df.groupby('section', sort=True)))
+    latest_by_section = dict(tuple(latest.groupby('section', sort=True)))
+    return df, sections, latest_by_section
+
+
+def render_section_dashboards(source='scout.csv', output_dir='section_dashboards', sections=None,
+                              n_visits=12, dpi=100):
+    """Render one dashboard per section, reusing a single figure template"""
+    df, section_frames, latest_frames = prepare_section_frames(load_scout_exports(source))
+    os.makedirs(output_dir, exist_ok=True)
+
+    metrics = sorted(df['metric'].unique())
+    template = SectionDashboardTemplate(metrics, n_visits=n_visits)
+    start = time.perf_counter()
+    paths = []
+    try:
+        for section in sections or section_frames.keys():
+            if section not in section_frames:
+                print(f"Warning: no observations for section {section}")
+                continue
+            path = os.path.join(output_dir, f'section_{section}_dashboard.png')
+            template.update(section, section_frames[section], latest_frames[section]).save(path, dpi=dpi)
+            paths.append(path)
+    finally:
+        template.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(paths)} section dashboards to '{output_dir}' in {elapsed:.1f}s")
+    return paths
+
+
+def _summary_window(rows):
+    return section_summary_dashboard.compute_summary_panels(rows.tail(200))
+
+
+# Per dashboard type: how its rows are prepared, how one variant's panels are
+# computed (the dashboard's own functions) and the template that draws them
+DASHBOARD_TYPES = {
+    'health': {
+        'prepare': dashboard_report.prepare_dashboard_data,
+        'panels': dashboard_report.compute_dashboard_panels,
+        'template': lambda df: HealthDashboardTemplate(sorted(df['section'].unique()), sorted(df['metric'].unique()),
+                                                       df['condition'].unique()),
+        'title': 'Section Health'
+    },
+    'summary': {
+        'prepare': section_summary_dashboard.prepare_summary_data,
+        'panels': _summary_window,
+        'template': lambda df: SummaryDashboardTemplate(sorted(df['section'].unique()),
+                                                        sorted(df['metric'].unique()), df['condition'].unique()),
+        'title': 'Section Summary'
+    },
+    'moisture': {
+        'prepare': moisture_dashboard.prepare_moisture_data,
+        'panels': moisture_dashboard.compute_moisture_panels,
+        'template': lambda df: MoistureDashboardTemplate(sorted(df['section'].unique())),
+        'title': 'Soil Moisture'
+    }
+}
+
+
+def render_dashboard_variants(source='scout.csv', kind='health', as_of=None, n_variants=12,
+                              output_dir='dashboard_variants', dpi=100):
+    """Render one dashboard type as it stood on each of several dates, reusing one template.
+
+    Rows are loaded and prepared once. Each variant keeps the rows dated on
+    or before its date and computes its panels with the dashboard's own
+    functions (the summary takes the last 200 of those rows). By default
+    the variants are weekly, ending at the latest observation.
+    """
+    if kind not in DASHBOARD_TYPES:
+        raise ValueError(f"Unknown dashboard type: {kind}")
+    spec = DASHBOARD_TYPES[kind]
+
+    df = spec['prepare'](load_scout_exports(source))
+    if df.empty:
+        print("No dated observations found.")
+        return []
+    if as_of is None:
+        as_of = pd.date_range(end=df['date'].max(), periods=n_variants, freq='7D')
+    os.makedirs(output_dir, exist_ok=True)
+
+    template = spec['template'](df)
+    start = time.perf_counter()
+    paths = []
+    try:
+        for date in pd.DatetimeIndex(as_of):
+            rows = df[df['date'] <= date]
+            if rows.empty:
+                continue
+            path = os.path.join(output_dir, f"{kind}_{date.strftime('%Y%m%d')}.png")
+            title = f"{spec['title']} as of {date.strftime('%d/%m/%Y')}"
+            template.update(spec['panels'](rows), title=title).save(path, dpi=dpi)
+            paths.append(path)
+    finally:
+        template.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(paths)} {kind} dashboards to '{output_dir}' in {elapsed:.1f}s")
+    return paths
+
+
+if __name__ == "__main__":
+    # python dashboard_templates.py [source] [section|health|summary|moisture] [variants]
+    source = sys.argv[1] if len(sys.argv) > 1 else 'scout.csv'
+    kind = sys.argv[2] if len(sys.argv) > 2 else 'section'
+    if kind == 'section':
+        render_section_dashboards(source)
+    else:
+        render_dashboard_variants(source, kind, n_variants=int(sys.argv[3]) if len(sys.argv) > 3 else 12)
@@ -0,0 +1,254 @@
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from scout_validator import FARM_DBF, read_farm_locations
+
+CACHE_SUFFIX = '.measurements.npz'
+
+# Declared data types (ObservationTypeDataPoint.DataType) that hold numbers
+NUMERIC_DATA_TYPES = {'long'}
+
+# .NET ticks at the Unix epoch; sqlite-net stores DateTime columns as ticks
+EPOCH_TICKS = 621355968000000000
+
+UNKNOWN_SECTION = 'UNKNOWN'
+
+PERCENTILES = (10, 50, 90)
+
+
+class MeasurementTable:
+    """Numeric data point values held as typed columns, one set per data point code.
+
+    columns[code] holds 'section' (int16 codes into sections), 'date'
+    (datetime64[D]) and 'value'. A 'Long' data point is stored as int32
+    unless one of its values has a fraction (e.g. a moisture reading),
+    in which case the whole column is float32. Strings are parsed once when
+    the table is built; every aggregation after that works on the arrays.
+    """
+
+    def __init__(self, sections=None, columns=None, labels=None, source_stamp=None):
+        self.sections = list(sections) if sections is not None else []
+        self.columns = columns if columns is not None else {}
+        self.labels = labels if labels is not None else {}
+        self.source_stamp = source_stamp
+
+    @property
+    def codes(self):
+        return sorted(self.columns)
+
+    def frame(self, code):
+        """One data point's values as a DataFrame with section names"""
+        column = self.columns[code]
+        return pd.DataFrame({
+            'section': pd.Categorical.from_codes(column['section'], self.sections),
+            'date': column['date'],
+            'value': column['value']
+        })
+
+    def save(self, path):
+        arrays = {'sections': np.asarray(self.sections, dtype=str), 'source_stamp': np.asarray(self.source_stamp)}
+        for code, column in self.columns.items():
+            arrays[f"label/{code}"] = np.asarray(self.labels.get(code, code))
+            for name, values in column.items():
+                arrays[f"{name}/{code}"] = values
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            columns, labels = {}, {}
+            for key in data.files:
+                name, _, code = key.partition('/')
+                if name == 'label':
+                    labels[code] = str(data[key])
+                elif code:
+                    columns.setdefault(code, {})[name] = data[key]
+            return cls(data['sections'].tolist(), columns, labels, data['source_stamp'].tolist())
+
+
+def _source_stamp(db_path):
+    stat = os.stat(db_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def ticks_to_dates(ticks):
+    """Convert .NET ticks to datetime64[D] without going through Python datetimes"""
+    micros = (np.asarray(ticks, dtype='int64') - EPOCH_TICKS) // 10
+    return micros.astype('datetime64[us]').astype('datetime64[D]')
+
+
+def read_numeric_values(db_path):
+    """Raw rows for every numerically declared data point in an app database copy"""
+    types = ', '.join(f"'{t}'" for t in sorted(NUMERIC_DATA_TYPES))
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql_query(
+            "SELECT dp.Code AS code, dp.Label AS label, lower(o.FarmLocationId) AS location_id, "
+            "o.Timestamp AS ticks, m.Value AS value "
+            "FROM ObservationMetadata m "
+            "JOIN ObservationTypeDataPoints dp ON dp.Id = m.DataPointId "
+            "JOIN Observation o ON o.Id = m.ObservationId "
+            f"WHERE lower(dp.DataType) IN ({types})",
+            conn
+        )
+    finally:
+        conn.close()
+
+
+def build_measurement_table(db_path, dbf_path=FARM_DBF):
+    """Parse every numeric data point value once into typed columns"""
+    rows = read_numeric_values(db_path)
+    locations = read_farm_locations(dbf_path)
+
+    values = pd.to_numeric(rows['value'].str.strip(), errors='coerce')
+    rows = rows.assign(value=values).dropna(subset=['value'])
+
+    sections = rows['location_id'].map(locations).fillna(UNKNOWN_SECTION)
+    section_codes, section_names = pd.factorize(sections, sort=True)
+    dates = ticks_to_dates(rows['ticks'].to_numpy())
+
+    columns = {}
+    codes = rows['code'].to_numpy()
+    for code in np.unique(codes):
+        selected = codes == code
+        column_values = rows['value'].to_numpy()[selected]
+        whole = np.all(np.mod(column_values, 1) == 0) and np.all(np.abs(column_values) < 2 ** 31)
+        columns[code] = {
+            'section': section_codes[selected].astype('int16'),
+            'date': dates[selected],
+            'value': column_values.astype('int32' if whole else 'float32')
+        }
+
+    labels = dict(zip(rows['code'], rows['label']))
+    return MeasurementTable(section_names, columns, labels, _source_stamp(db_path))
+
+
+def load_measurement_table(db_path, dbf_path=FARM_DBF):
+    """Cached measurement table for a database copy, rebuilt when the copy changes"""
+    cache_path = db_path + CACHE_SUFFIX
+    if os.path.exists(cache_path):
+        table = MeasurementTable.load(cache_path)
+        if table.source_stamp == _source_stamp(db_path):
+            return table
+
+    table = build_measurement_table(db_path, dbf_path)
+    table.save(cache_path)
+    return table
+
+
+def _group_codes(column, by):
+    """Dense group number per value for the requested key columns"""
+    if not by:
+        return np.zeros(len(column['value']), dtype='int64'), pd.DataFrame(index=[0])
+    keys = pd.DataFrame({name: column[name] for name in by})
+    group, unique = pd.MultiIndex.from_frame(keys).factorize(sort=True)
+    unique = unique.to_frame(index=False)
+    unique.columns = by
+    return group, unique
+
+
+def measurement_statistics(table, code, by=('section', 'date'), percentiles=PERCENTILES, bins=10):
+    """Count, mean, min, max and percentiles per group, plus histogram counts.
+
+    Returns (stats, histogram, edges). The histogram uses the same edges for
+    every group so groups can be compared; histogram[g, b] counts values of
+    group g in bin b. Everything is computed from the typed arrays with a
+    sort and a few bincounts, without a Python loop over groups.
+    """
+    column = table.columns[code]
+    values = column['value'].astype('float64')
+    group, keys = _group_codes(column, list(by))
+    n_groups = len(keys)
+
+    count = np.bincount(group, minlength=n_groups)
+    stats = keys.copy()
+    stats['count'] = count
+    stats['mean'] = np.bincount(group, weights=values, minlength=n_groups) / count
+
+    # Sort by group then value; each group's values are then a contiguous sorted run
+    order = np.lexsort((values, group))
+    sorted_values = values[order]
+    starts = np.concatenate([[0], np.cumsum(count)[:-1]])
+    stats['min'] = sorted_values[starts]
+    stats['max'] = sorted_values[starts + count - 1]
+
+    for p in percentiles:
+        # Linear interpolation between closest ranks, like np.percentile
+        position = starts + (count - 1) * (p / 100)
+        lower = np.floor(position).astype('int64')
+        upper = np.minimum(lower + 1, starts + count - 1)
+        fraction = position - lower
+        stats[f"p{p}"] = sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+
+    edges = np.histogram_bin_edges(values, bins=bins)
+    bin_index = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, len(edges) - 2)
+    histogram = np.bincount(group * (len(edges) - 1) + bin_index,
+                            minlength=n_groups * (len(edges) - 1)).reshape(n_groups, len(edges) - 1)
+
+    if 'section' in stats:
+        stats['section'] = np.asarray(table.sections)[stats['section']]
+    return stats, histogram, edges
+
+
+def format_histogram(counts, width=20):
+    """Single-line text histogram"""
+    blocks = ' ▁▂▃▄▅▆▇█'
+    peak = counts.max() if counts.max() else 1
+    return ''.join(blocks[int(round(c / peak * (len(blocks) - 1)))] for c in counts[:width])
+
+
+def create_measurement_report(db_path, dbf_path=FARM_DBF):
+    """Report farm-wide and per-section statistics for every numeric data point"""
+    table = load_measurement_table(db_path, dbf_path)
+    if not table.columns:
+        print("No numeric data point values found.")
+        return table
+
+    report = []
+    report.append("=" * 80)
+    report.append("MEASURED DATA POINTS")
+    report.append("=" * 80)
+    report.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append(f"Data Points: {len(table.columns)}")
+    report.append("")
+
+    for code in table.codes:
+        farm, farm_histogram, edges = measurement_statistics(table, code, by=())
+        farm = farm.iloc[0]
+        dtype = table.columns[code]['value'].dtype
+        report.append(f"{table.labels.get(code, code).upper()} ({code}, {dtype})")
+        report.append("-" * 40)
+        report.append(f"Values: {int(farm['count'])}, mean {farm['mean']:.1f}, "
+                      f"p10 {farm['p10']:.1f}, median {farm['p50']:.1f}, p90 {farm['p90']:.1f}")
+        report.append(f"Distribution {edges[0]:g} to {edges[-1]:g}: {format_histogram(farm_histogram[0])}")
+
+        by_section, section_histograms, _ = measurement_statistics(table, code, by=('section',))
+        for i, row in by_section.iterrows():
+            report.append(f"  {row['section']}: {row['count']} values, mean {row['mean']:.1f}, "
+                          f"median {row['p50']:.1f} {format_histogram(section_histograms[i])}")
+
+        daily, _, _ = measurement_statistics(table, code)
+        latest = daily[daily['date'] == daily['date'].max()]
+        report.append(f"  Latest ({pd.Timestamp(latest['date'].iloc[0]).strftime('%d/%m/%Y')}): " + ', '.join(
+            f"{row['section']} {row['mean']:.1f}" for _, row in latest.iterrows()))
+        report.append("")
+
+    report.append("=" * 80)
+
+    with open('measurement_report.txt', 'w', encoding='utf-8') as f:
+        f.write('\n'.join(report))
+    print('\n'.join(report))
+    print("\nText report saved as 'measurement_report.txt'")
+    return table
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python data_points.py <farmscout.db3 copy>")
+        sys.exit(1)
+    create_measurement_report(sys.argv[1])
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+
+def pixel_budget(ax):
+    """Width of an axes in device pixels, i.e. the most points a line can show"""
+    return max(2, int(ax.get_window_extent().width))
+
+
+def _as_float(values):
+    """Convert a numeric or datetime Series to float64 for shape calculations"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.astype('int64').to_numpy(dtype='float64')
+    return values.to_numpy(dtype='float64')
+
+
+def minmax_downsample(df, x, y, by=None, max_points=1000):
+    """Keep the first, last, minimum and maximum point of each x bucket.
+
+    Every series (one per value of the by column) is cut into max_points // 4
+    equal-count buckets and the extremes of each bucket are kept, so spikes
+    and dips survive. All series are bucketed together with groupby, without
+    a Python loop per section. Series already within budget are left as-is.
+    Returns the kept rows of df in series and x order.
+    """
+    keys = [by] if by else []
+    df = df.sort_values(keys + [x], kind='mergesort').reset_index(drop=True)
+    if df.empty:
+        return df
+
+    # Up to four points survive per bucket
+    n_buckets = max(1, max_points // 4)
+    grouped = df.groupby(by, sort=False) if by else df.groupby(np.zeros(len(df)), sort=False)
+    position = grouped.cumcount().to_numpy()
+    size = grouped[x].transform('size').to_numpy()
+
+    small = size <= max_points
+    bucket = position * n_buckets // size
+
+    large = df[~small].assign(_bucket=bucket[~small])
+    if large.empty:
+        return df
+
+    bucket_keys = keys + ['_bucket']
+    bucketed = large.groupby(bucket_keys, sort=False)[y]
+    keep = np.concatenate([
+        bucketed.idxmin().to_numpy(),
+        bucketed.idxmax().to_numpy(),
+        large.groupby(bucket_keys, sort=False).head(1).index.to_numpy(),
+        large.groupby(bucket_keys, sort=False).tail(1).index.to_numpy(),
+    ])
+
+    kept = df.index[small].append(pd.Index(np.unique(keep)))
+    return df.loc[df.index.isin(kept)]
+
+
+def lttb_indices(x, y, max_points):
+    """Positions picked by Largest-Triangle-Three-Buckets for one series"""
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+    if max_points < 3:
+        # No room for interior buckets; the end points are always kept
+        return np.array([0, n - 1])
+
+    # Bucket edges for the interior points; first and last are always kept
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+
+        # Average of the next bucket is the third triangle vertex
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        next_end = max(next_end, next_start + 1)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        px, py = x[previous], y[previous]
+        areas = np.abs((px - avg_x) * (y[start:end] - py) - (px - x[start:end]) * (avg_y - py))
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+
+    return selected
+
+
+def lttb_downsample(df, x, y, by=None, max_points=1000):
+    """Downsample every series with LTTB, keeping the visual shape of each line.
+
+    Returns the kept rows of df in series and x order.
+    """
+    keys = [by] if by else []
+    df = df.sort_values(keys + [x], kind='mergesort')
+    if df.empty:
+        return df
+
+    x_values = _as_float(df[x])
+    y_values = df[y].to_numpy(dtype='float64')
+
+    # Series boundaries in the sorted frame
+    if by:
+        codes = pd.factorize(df[by], sort=False)[0]
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate([[0], bounds])
+        ends = np.concatenate([bounds, [len(df)]])
+    else:
+        starts, ends = np.array([0]), np.array([len(df)])
+
+    keep = [
+        start + lttb_indices(x_values[start:end], y_values[start:end], max_points)
+        for start, end in zip(starts, ends)
+    ]
+    return df.iloc[np.concatenate(keep)]
+
+
+DOWNSAMPLERS = {
+    'minmax': minmax_downsample,
+    'lttb': lttb_downsample,
+}
+
+
+def downsample_series(df, x, y, by=None, max_points=1000, method='minmax'):
+    """Downsample one or many series to at most about max_points points each"""
+    if method not in DOWNSAMPLERS:
+        raise ValueError(f"Unknown downsampling method: {method}")
+    return DOWNSAMPLERS[method](df, x, y, by=by, max_points=max_points)
@@ -0,0 +1,130 @@
+import sys
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from scout_ingest import load_scout_exports, parse_scout_dates
+
+
+def build_visit_matrices(df):
+    """Group rows into visits (same date and section) and build visit x metric int8 matrices.
+
+    Returns (observed, failed, visits, metrics): observed[v, m] is 1 when
+    metric m was recorded on visit v, failed[v, m] is 1 when its last
+    recorded condition that visit was 'fail'.
+    """
+    rows = df[['date', 'section', 'metric', 'condition']].copy()
+    rows['date'] = parse_scout_dates(rows['date'])
+    rows = rows.dropna(subset=['date'])
+    rows['section'] = rows['section'].str.upper()
+    rows['metric'] = rows['metric'].str.lower()
+    rows = rows.drop_duplicates(subset=['date', 'section', 'metric'], keep='last')
+
+    visit_codes, visits = pd.MultiIndex.from_frame(rows[['date', 'section']]).factorize()
+    metric_codes, metrics = pd.factorize(rows['metric'], sort=True)
+
+    observed = np.zeros((len(visits), len(metrics)), dtype='int8')
+    failed = np.zeros_like(observed)
+    observed[visit_codes, metric_codes] = 1
+    failed[visit_codes, metric_codes] = (rows['condition'].str.lower() == 'fail').to_numpy()
+    return observed, failed, visits, pd.Index(metrics, name='metric')
+
+
+def cooccurrence_statistics(observed, failed):
+    """Pairwise fail co-occurrence counts and lift for every metric pair.
+
+    All counts come from three visit-wise matrix products. The int8
+    matrices are multiplied as float32 so BLAS is used; counts stay exact
+    up to 16 million visits. lift[a, b] compares P(a fails and b fails)
+    with P(a fails) * P(b fails), all over visits that recorded both
+    metrics. 1 means independent, above 1 means failures go together.
+    """
+    f = failed.astype('float32')
+    o = observed.astype('float32')
+
+    both_failed = f.T @ f
+    both_observed = o.T @ o
+    failed_with_observed = f.T @ o
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lift = both_failed * both_observed / (failed_with_observed * failed_with_observed.T)
+    lift[~np.isfinite(lift)] = np.nan
+
+    return (both_failed.astype('int64'), both_observed.astype('int64'), lift)
+
+
+def top_cooccurring_pairs(both_failed, both_observed, lift, metrics, min_visits=3, top=20):
+    """Metric pairs that fail together most often, with support and lift"""
+    a, b = np.triu_indices(len(metrics), k=1)
+    pairs = pd.DataFrame({
+        'metric_a': metrics[a],
+        'metric_b': metrics[b],
+        'fail_together': both_failed[a, b],
+        'visits_with_both': both_observed[a, b],
+        'lift': lift[a, b]
+    })
+    pairs = pairs[(pairs['fail_together'] >= min_visits)]
+    return pairs.sort_values(['lift', 'fail_together'], ascending=False).head(top).reset_index(drop=True)
+
+
+def plot_lift_heatmap(lift, metrics, ax):
+    """Heatmap panel of metric-to-metric fail lift"""
+    mask = ~np.isfinite(lift)
+    np.fill_diagonal(mask, True)
+    values = np.ma.array(lift, mask=mask)
+    image = ax.imshow(values, cmap='coolwarm', vmin=0, vmax=2, aspect='auto')
+    ax.set_xticks(range(len(metrics)))
+    ax.set_xticklabels(metrics, rotation=45, ha='right', fontsize=8)
+    ax.set_yticks(range(len(metrics)))
+    ax.set_yticklabels(metrics, fontsize=8)
+    ax.set_title('Fail Co-occurrence Lift per Visit (1 = independent)', fontsize=12, fontweight='bold')
+    plt.colorbar(image, ax=ax, label='Lift')
+    return image
+
+
+def create_failure_cooccurrence_report(source='scout.csv', min_visits=3, top=20):
+    """Create the fail co-occurrence heatmap and table across all sections"""
+    observed, failed, visits, metrics = build_visit_matrices(load_scout_exports(source))
+    if not len(visits):
+        print("No dated observations found.")
+        return
+
+    both_failed, both_observed, lift = cooccurrence_statistics(observed, failed)
+    pairs = top_cooccurring_pairs(both_failed, both_observed, lift, metrics, min_visits, top)
+
+    fig, ax = plt.subplots(figsize=(14, 12))
+    plot_lift_heatmap(lift, metrics, ax)
+    plt.tight_layout()
+    plt.savefig('failure_cooccurrence_heatmap.png', dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    print("Heatmap saved as 'failure_cooccurrence_heatmap.png'")
+
+    report = []
+    report.append("=" * 80)
+    report.append("FAILURE CO-OCCURRENCE BY SCOUTING VISIT")
+    report.append("=" * 80)
+    report.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append(f"Visits Analyzed: {len(visits)}")
+    report.append(f"Metrics: {len(metrics)}")
+    report.append(f"Visits With At Least One Fail: {int(failed.any(axis=1).sum())}")
+    report.append("")
+    report.append(f"METRICS THAT FAIL TOGETHER (at least {min_visits} shared fails):")
+    report.append("-" * 40)
+    if pairs.empty:
+        report.append("No metric pairs fail together often enough to report.")
+    for i, row in pairs.iterrows():
+        report.append(f"{i + 1:2d}. {row['metric_a']} + {row['metric_b']}: "
+                      f"{row['fail_together']} of {row['visits_with_both']} visits, lift {row['lift']:.2f}")
+    report.append("")
+    report.append("=" * 80)
+
+    with open('failure_cooccurrence_report.txt', 'w', encoding='utf-8') as f:
+        f.write('\n'.join(report))
+    print('\n'.join(report))
+    print("\nText report saved as 'failure_cooccurrence_report.txt'")
+
+
+if __name__ == "__main__":
+    create_failure_cooccurrence_report(sys.argv[1] if len(sys.argv) > 1 else 'scout.csv')
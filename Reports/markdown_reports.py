@@ -0,0 +1,261 @@
+import hashlib
+import sqlite3
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from scout_ingest import conditions_to_numeric, load_scout_exports, parse_scout_dates
+
+# Bump when the report layout changes so every report is regenerated
+REPORT_FORMAT_VERSION = 1
+
+# Namespace for report ids derived from the content hash of their input slice
+REPORT_NAMESPACE = uuid.UUID('5f1d3c2a-8b7e-4f60-9a41-2c6e0d9b7a15')
+
+# Report groups as seeded by the app (DatabaseSeeder.SeedReportGroupsAsync)
+REPORT_GROUPS = {
+    'Scout Reports': {
+        'description': 'Overall section health and condition reports',
+        'icon': '🏥',
+        'color': '#4CAF50',
+        'sort_order': 2
+    },
+    'Moisture Reports': {
+        'description': 'Soil moisture analysis and monitoring reports',
+        'icon': '💧',
+        'color': '#00BCD4',
+        'sort_order': 1
+    }
+}
+
+SLICE_COLUMNS = ['date', 'section', 'metric', 'condition', 'scout', 'notes']
+
+
+def status_label(score):
+    """Status label used across the reports for a health score"""
+    return "🟢 Good" if score >= 2.5 else "🟡 Fair" if score >= 1.5 else "🔴 Poor"
+
+
+def condition_icon(condition):
+    """Icon for a pass/partial/fail condition"""
+    condition = str(condition).lower()
+    return "🔴" if condition == 'fail' else "🟡" if condition == 'partial' else "🟢"
+
+
+def to_ticks(value):
+    """Convert a datetime to .NET ticks, the way sqlite-net stores DateTime columns"""
+    return (value - datetime(1, 1, 1)) // timedelta(microseconds=1) * 10
+
+
+def slice_digest(group_name, section, slice_df):
+    """Content hash of a report's input rows, independent of row order"""
+    rows = slice_df[SLICE_COLUMNS].astype(str).sort_values(SLICE_COLUMNS, kind='mergesort')
+    row_hashes = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+
+    digest = hashlib.sha256(f"{REPORT_FORMAT_VERSION}|{group_name}|{section}".encode('utf-8'))
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def latest_by_metric(section_df):
+    """Most recent observation of each metric in a section"""
+    latest = section_df.sort_values('date', ascending=False, kind='mergesort')
+    return latest.drop_duplicates(subset='metric', keep='first').sort_values('metric')
+
+
+def render_section_health_markdown(section, section_df, generated):
+    """Markdown health report for one section"""
+    latest = latest_by_metric(section_df)
+    score = latest['condition_numeric'].mean()
+
+    lines = [
+        f"# Section {section} Health Report",
+        "",
+        f"**Report Generated:** {generated.strftime('%Y-%m-%d %H:%M:%S')}  ",
+        f"**Data Range:** {section_df['date'].min().strftime('%Y-%m-%d')} to {section_df['date'].max().strftime('%Y-%m-%d')}  ",
+        f"**Observations Analyzed:** {len(section_df)}  ",
+        "",
+        "## 🏥 Overall Health Status",
+        "",
+        f"Current health score is **{score:.2f}** ({status_label(score)}) across {len(latest)} metrics.",
+        "",
+        "## 📊 Health Metrics",
+        "",
+        "| Metric | Condition | Last Observed |",
+        "|---|---|---|",
+    ]
+    for _, row in latest.iterrows():
+        lines.append(f"| {row['metric']} | {condition_icon(row['condition'])} {row['condition']} | {row['date'].strftime('%d/%m/%Y')} |")
+
+    lines += ["", "## 🔍 Key Observations", ""]
+    noted = latest[latest['notes'].notna() & (latest['notes'] != '')]
+    if noted.empty:
+        lines.append("- No notes recorded for the current observations")
+    for _, row in noted.iterrows():
+        lines.append(f"- **{row['metric']}:** {row['notes']}")
+
+    lines += ["", "## 🎯 Action Items", ""]
+    issues = latest[latest['condition_numeric'] < 2]
+    if issues.empty:
+        lines.append("- No failing metrics; continue the current management program")
+    for _, row in issues.iterrows():
+        lines.append(f"- Address **{row['metric']}** ({row['condition']})")
+
+    lines += ["", "---", "", "*Generated from scout observations by the Reports engine.*"]
+    return '\n'.join(lines)
+
+
+def render_section_moisture_markdown(section, section_df, generated):
+    """Markdown soil moisture report for one section"""
+    history = section_df.sort_values('date', kind='mergesort')
+    latest = history.iloc[-1]
+    recent = history[history['date'] >= history['date'].max() - timedelta(days=60)]
+    counts = history['condition'].str.lower().value_counts()
+
+    lines = [
+        f"# Section {section} Soil Moisture Report",
+        "",
+        f"**Report Generated:** {generated.strftime('%Y-%m-%d %H:%M:%S')}  ",
+        f"**Data Range:** {history['date'].min().strftime('%Y-%m-%d')} to {history['date'].max().strftime('%Y-%m-%d')}  ",
+        f"**Moisture Observations:** {len(history)}  ",
+        "",
+        "## 📊 Current Moisture Status",
+        "",
+        f"{condition_icon(latest['condition'])} **{latest['condition']}** on {latest['date'].strftime('%d/%m/%Y')}",
+    ]
+    if pd.notna(latest['notes']) and str(latest['notes']).strip():
+        lines.append(f"> {latest['notes']}")
+
+    lines += ["", "## 📈 Key Findings", ""]
+    for condition in ['pass', 'partial', 'fail']:
+        count = int(counts.get(condition, 0))
+        lines.append(f"- **{condition.title()}:** {count} observations ({count / len(history) * 100:.1f}%)")
+    if len(recent) >= 2:
+        trend = recent['condition_numeric'].iloc[-1] - recent['condition_numeric'].iloc[0]
+        direction = "Improving" if trend > 0 else "Declining" if trend < 0 else "Stable"
+        lines.append(f"- **Trend (last 60 days):** {direction}")
+
+    lines += ["", "## 🎯 Recommendations", ""]
+    if latest['condition_numeric'] < 1.5:
+        lines.append("- Investigate irrigation or drainage for this section")
+        lines.append("- Increase monitoring frequency until moisture recovers")
+    elif latest['condition_numeric'] < 2.5:
+        lines.append("- Monitor closely and consider targeted irrigation")
+    else:
+        lines.append("- Continue current moisture management practices")
+
+    lines += ["", "---", "", "*Generated from scout observations by the Reports engine.*"]
+    return '\n'.join(lines)
+
+
+# (group, title, file name, row filter, renderer) for every report kind
+REPORT_KINDS = [
+    ('Scout Reports', 'Section {section} Health Report', 'section_{section}_health_report.md',
+     lambda df: df, render_section_health_markdown),
+    ('Moisture Reports', 'Section {section} Soil Moisture Report', 'section_{section}_moisture_report.md',
+     lambda df: df[df['metric'].str.lower() == 'soil moisture'], render_section_moisture_markdown),
+]
+
+
+def ensure_report_groups(conn, now_ticks):
+    """Return report group ids by name, creating any group the app has not seeded yet"""
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS report_groups (Id varchar(36) PRIMARY KEY NOT NULL, "
+        "Name varchar(100) NOT NULL UNIQUE, Description varchar, Icon varchar(10), Color varchar(7), "
+        "SortOrder integer, IsActive integer, CreatedAt bigint, UpdatedAt bigint)"
+    )
+    group_ids = dict(conn.execute("SELECT Name, Id FROM report_groups").fetchall())
+
+    missing = []
+    for name, group in REPORT_GROUPS.items():
+        if name not in group_ids:
+            group_ids[name] = str(uuid.uuid5(REPORT_NAMESPACE, name))
+            missing.append((group_ids[name], name, group['description'], group['icon'],
+                            group['color'], group['sort_order'], 1, now_ticks, now_ticks))
+    conn.executemany(
+        "INSERT INTO report_groups (Id, Name, Description, Icon, Color, SortOrder, IsActive, "
+        "CreatedAt, UpdatedAt) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", missing
+    )
+    return group_ids
+
+
+def generate_markdown_reports(db_path, source='scout.csv'):
+    """Generate section Markdown reports and bulk-insert new ones into a copy of the app database.
+
+    Report ids are derived from the content hash of each report's input
+    slice, so a section whose observations have not changed keeps its id and
+    is skipped without being rendered. Older reports with the same title and
+    group are marked inactive in the same transaction, so the app lists one
+    active report per section and kind.
+    """
+    df = load_scout_exports(source)
+    df['date'] = parse_scout_dates(df['date'])
+    df = df.dropna(subset=['date'])
+    df['condition_numeric'] = conditions_to_numeric(df['condition'])
+
+    generated = datetime.now()
+    now_ticks = to_ticks(generated)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS markdown_reports (Id varchar(36) PRIMARY KEY NOT NULL, "
+            "Title varchar(255) NOT NULL, ReportGroupId varchar(36) NOT NULL, DateProduced bigint NOT NULL, "
+            "ReportMarkdown varchar NOT NULL, FileName varchar(255), FileSize integer, IsActive integer, "
+            "CreatedAt bigint, UpdatedAt bigint)"
+        )
+        existing = dict(conn.execute("SELECT Id, IsActive FROM markdown_reports").fetchall())
+
+        with conn:
+            group_ids = ensure_report_groups(conn, now_ticks)
+
+            rows = []
+            current = []
+            skipped = 0
+            for group_name, title, file_name, select_rows, render in REPORT_KINDS:
+                for section, section_df in select_rows(df).groupby('section', sort=True):
+                    report_id = str(uuid.uuid5(REPORT_NAMESPACE, slice_digest(group_name, section, section_df)))
+                    current.append((report_id, title.format(section=section), group_ids[group_name]))
+                    if report_id in existing:
+                        skipped += 1
+                        continue
+
+                    markdown = render(section, section_df, generated)
+                    rows.append((
+                        report_id, title.format(section=section), group_ids[group_name], now_ticks,
+                        markdown, file_name.format(section=section), len(markdown.encode('utf-8')),
+                        1, now_ticks, now_ticks
+                    ))
+
+            conn.executemany(
+                "INSERT INTO markdown_reports (Id, Title, ReportGroupId, DateProduced, ReportMarkdown, "
+                "FileName, FileSize, IsActive, CreatedAt, UpdatedAt) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+            # Only the report for the current slice stays active per title; an
+            # older report whose slice is current again is switched back on
+            changes = conn.total_changes
+            conn.executemany(
+                "UPDATE markdown_reports SET IsActive = (Id = ?), UpdatedAt = ? "
+                "WHERE Title = ? AND ReportGroupId = ? AND IsActive IS NOT (Id = ?)",
+                [(report_id, now_ticks, title, group_id, report_id)
+                 for report_id, title, group_id in current]
+            )
+            updated = conn.total_changes - changes
+    finally:
+        conn.close()
+
+    print(f"Markdown reports written: {len(rows)}")
+    print(f"Unchanged reports skipped: {skipped}")
+    print(f"Report activity flags updated: {updated}")
+    return len(rows), skipped
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python markdown_reports.py <farmscout.db3 copy> [scout.csv or export directory]")
+        sys.exit(1)
+    generate_markdown_reports(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else 'scout.csv')
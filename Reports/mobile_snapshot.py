@@ -0,0 +1,269 @@
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from chunked_aggregates import DashboardAggregates, compute_dashboard_aggregates
+from data_points import EPOCH_TICKS
+from scout_ingest import load_scout_exports
+
+SNAPSHOT_MAGIC = b'FSSN'
+
+# Bump when a record layout changes; readers refuse versions they do not know
+SNAPSHOT_VERSION = 1
+
+# All integers are little-endian and every record is naturally aligned, so a
+# reader can map each table straight onto an array of structs. Dates are
+# .NET ticks like sqlite-net's DateTime columns; text fields are indexes into
+# the string table (0 is the empty string).
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'), ('version', '<u2'), ('table_count', '<u2'),
+    ('generated', '<i8'), ('min_date', '<i8'), ('max_date', '<i8'),
+    ('observations', '<u4'), ('reserved', '<u4')
+])
+
+TABLE_DTYPE = np.dtype([('tag', 'S4'), ('offset', '<u4'), ('count', '<u4'), ('record_size', '<u4')])
+
+SECTION_DTYPE = np.dtype([
+    ('name', '<u4'), ('score', '<f4'), ('observations', '<u4'),
+    ('pass', '<u4'), ('partial', '<u4'), ('fail', '<u4'), ('latest_date', '<i8')
+])
+
+METRIC_DTYPE = np.dtype([('name', '<u4'), ('score', '<f4'), ('observations', '<u4'), ('reserved', '<u4')])
+
+LATEST_DTYPE = np.dtype([
+    ('date', '<i8'), ('section', '<u4'), ('metric', '<u4'), ('scout', '<u4'), ('notes', '<u4'),
+    ('condition', 'u1'), ('reserved', 'u1', (7,))
+])
+
+DAILY_DTYPE = np.dtype([('date', '<i8'), ('score', '<f4'), ('observations', '<u4')])
+
+MONTHLY_DTYPE = np.dtype([
+    ('year', '<u2'), ('month', 'u1'), ('reserved', 'u1'), ('score', '<f4'), ('observations', '<u4')
+])
+
+ALERT_DTYPE = np.dtype([
+    ('date', '<i8'), ('section', '<u4'), ('metric', '<u4'), ('notes', '<u4'),
+    ('severity', 'u1'), ('reserved', 'u1', (3,))
+])
+
+# Table order in the file; string offsets and bytes come first so text can be resolved while reading
+TABLES = [
+    (b'STRO', np.dtype('<u4')),
+    (b'STRB', np.dtype('u1')),
+    (b'SECT', SECTION_DTYPE),
+    (b'METR', METRIC_DTYPE),
+    (b'LATE', LATEST_DTYPE),
+    (b'DAYS', DAILY_DTYPE),
+    (b'MNTH', MONTHLY_DTYPE),
+    (b'ALRT', ALERT_DTYPE),
+]
+
+# Latest-state conditions that raise an alert, and how severe it is
+ALERT_SEVERITY = {'fail': 2, 'partial': 1}
+
+TABLE_ALIGNMENT = 8
+
+
+def dates_to_ticks(dates):
+    """Convert datetime64 values to .NET ticks"""
+    return pd.DatetimeIndex(dates).as_unit('ns').asi8 // 100 + EPOCH_TICKS
+
+
+class StringTable:
+    """Deduplicated UTF-8 strings addressed by index"""
+
+    def __init__(self):
+        self.index = {'': 0}
+        self.strings = ['']
+
+    def add(self, value):
+        value = '' if value is None or (isinstance(value, float) and np.isnan(value)) else str(value)
+        if value not in self.index:
+            self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return self.index[value]
+
+    def add_all(self, values):
+        return np.fromiter((self.add(v) for v in values), dtype='<u4', count=len(values))
+
+    def encode(self):
+        """(offsets, bytes): string i is bytes[offsets[i]:offsets[i + 1]]"""
+        encoded = [s.encode('utf-8') for s in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+        return offsets, np.frombuffer(b''.join(encoded), dtype='u1')
+
+
+def load_aggregates(source):
+    """Dashboard aggregates over deduplicated exports, or streamed from the ingest store"""
+    if source.endswith('.db'):
+        return compute_dashboard_aggregates(source)
+    return DashboardAggregates().update(load_scout_exports(source))
+
+
+def build_snapshot_tables(aggregates, strings):
+    """Fill the fixed-layout record arrays from the dashboard aggregates"""
+    latest = aggregates.latest_by_section_metric.sort_values(['section', 'metric'])
+
+    section_scores = aggregates.section_scores()
+    sections = aggregates.section_counts.sort_index()
+    condition_counts = aggregates.section_condition_counts.unstack(fill_value=0)
+    condition_counts.columns = condition_counts.columns.str.lower()
+    condition_counts = condition_counts.T.groupby(level=0).sum().T.reindex(
+        index=sections.index, columns=['pass', 'partial', 'fail'], fill_value=0)
+    latest_dates = latest.groupby('section')['date'].max().reindex(sections.index)
+
+    section_table = np.zeros(len(sections), dtype=SECTION_DTYPE)
+    section_table['name'] = strings.add_all(sections.index)
+    section_table['score'] = section_scores.reindex(sections.index).fillna(0).to_numpy()
+    section_table['observations'] = sections.to_numpy()
+    for condition in ('pass', 'partial', 'fail'):
+        section_table[condition] = condition_counts[condition].to_numpy()
+    section_table['latest_date'] = dates_to_ticks(latest_dates)
+
+    metric_scores = aggregates.metric_scores()
+    metrics = aggregates.metric_counts.sort_index()
+    metric_table = np.zeros(len(metrics), dtype=METRIC_DTYPE)
+    metric_table['name'] = strings.add_all(metrics.index)
+    metric_table['score'] = metric_scores.reindex(metrics.index).fillna(0).to_numpy()
+    metric_table['observations'] = metrics.to_numpy()
+
+    latest_table = np.zeros(len(latest), dtype=LATEST_DTYPE)
+    latest_table['date'] = dates_to_ticks(latest['date'])
+    latest_table['section'] = strings.add_all(latest['section'].tolist())
+    latest_table['metric'] = strings.add_all(latest['metric'].tolist())
+    latest_table['scout'] = strings.add_all(latest['scout'].tolist())
+    latest_table['notes'] = strings.add_all(latest['notes'].tolist())
+    latest_table['condition'] = latest['condition_numeric'].to_numpy()
+
+    daily = aggregates.daily_health()
+    daily_counts = aggregates.daily_scores.sort_index()['count']
+    daily_table = np.zeros(len(daily), dtype=DAILY_DTYPE)
+    daily_table['date'] = dates_to_ticks(daily.index)
+    daily_table['score'] = daily.to_numpy()
+    daily_table['observations'] = daily_counts.to_numpy()
+
+    monthly = aggregates.monthly_health()
+    monthly_counts = aggregates.monthly_scores.sort_index()['count']
+    monthly_table = np.zeros(len(monthly), dtype=MONTHLY_DTYPE)
+    monthly_table['year'] = monthly.index.year
+    monthly_table['month'] = monthly.index.month
+    monthly_table['score'] = monthly.to_numpy()
+    monthly_table['observations'] = monthly_counts.to_numpy()
+
+    # Alerts: latest state is fail or partial; most severe, then most recent first
+    severity = latest['condition'].str.lower().map(ALERT_SEVERITY)
+    alerts = latest.assign(severity=severity).dropna(subset=['severity'])
+    alerts = alerts.sort_values(['severity', 'date', 'section', 'metric'],
+                                ascending=[False, False, True, True], kind='mergesort')
+    alert_table = np.zeros(len(alerts), dtype=ALERT_DTYPE)
+    alert_table['date'] = dates_to_ticks(alerts['date'])
+    alert_table['section'] = strings.add_all(alerts['section'].tolist())
+    alert_table['metric'] = strings.add_all(alerts['metric'].tolist())
+    alert_table['notes'] = strings.add_all(alerts['notes'].tolist())
+    alert_table['severity'] = alerts['severity'].to_numpy()
+
+    return {
+        b'SECT': section_table,
+        b'METR': metric_table,
+        b'LATE': latest_table,
+        b'DAYS': daily_table,
+        b'MNTH': monthly_table,
+        b'ALRT': alert_table,
+    }
+
+
+def _align(position):
+    return -position % TABLE_ALIGNMENT
+
+
+def write_snapshot(aggregates, path, generated=None):
+    """Write the aggregates as a versioned binary snapshot and return its size in bytes"""
+    strings = StringTable()
+    tables = build_snapshot_tables(aggregates, strings)
+    tables[b'STRO'], tables[b'STRB'] = strings.encode()
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header['magic'] = SNAPSHOT_MAGIC
+    header['version'] = SNAPSHOT_VERSION
+    header['table_count'] = len(TABLES)
+    header['generated'] = dates_to_ticks([np.datetime64(generated or datetime.now())])
+    header['min_date'] = dates_to_ticks([aggregates.min_date])
+    header['max_date'] = dates_to_ticks([aggregates.max_date])
+    header['observations'] = aggregates.total_observations
+
+    directory = np.zeros(len(TABLES), dtype=TABLE_DTYPE)
+    position = HEADER_DTYPE.itemsize + TABLE_DTYPE.itemsize * len(TABLES)
+    chunks = []
+    for i, (tag, dtype) in enumerate(TABLES):
+        padding = _align(position)
+        chunks.append(b'\0' * padding)
+        position += padding
+
+        data = tables[tag].astype(dtype, copy=False)
+        directory[i] = (tag, position, len(data), dtype.itemsize)
+        chunks.append(data.tobytes())
+        position += data.nbytes
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(directory.tobytes())
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(temp_path, path)
+    return position
+
+
+def read_snapshot(path):
+    """Map a snapshot back to its header, record arrays and strings (no per-record parsing)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    header = np.frombuffer(data, dtype=HEADER_DTYPE, count=1)[0]
+    if header['magic'] != SNAPSHOT_MAGIC:
+        raise ValueError(f"{path} is not a FarmScout snapshot")
+    if header['version'] != SNAPSHOT_VERSION:
+        raise ValueError(f"{path} is snapshot version {header['version']}, expected {SNAPSHOT_VERSION}")
+
+    directory = np.frombuffer(data, dtype=TABLE_DTYPE, count=header['table_count'],
+                              offset=HEADER_DTYPE.itemsize)
+    dtypes = dict(TABLES)
+    tables = {}
+    for tag, offset, count, record_size in directory:
+        dtype = dtypes.get(tag)
+        if dtype is None or dtype.itemsize != record_size:
+            raise ValueError(f"{path} has an unexpected {tag.decode()} table")
+        tables[tag.decode()] = np.frombuffer(data, dtype=dtype, count=int(count), offset=int(offset))
+
+    offsets, blob = tables.pop('STRO'), tables.pop('STRB').tobytes()
+    strings = [blob[start:end].decode('utf-8') for start, end in zip(offsets[:-1], offsets[1:])]
+    return header, tables, strings
+
+
+def create_mobile_snapshot(source='scout.csv', path='farm_snapshot.bin'):
+    """Export the dashboard aggregates as a snapshot the app can load in one read"""
+    aggregates = load_aggregates(source)
+    if aggregates.total_observations == 0:
+        print("No dated observations found.")
+        return None
+
+    size = write_snapshot(aggregates, path)
+    header, tables, strings = read_snapshot(path)
+
+    print(f"Snapshot saved as '{path}' ({size / 1024:.1f} KB, version {SNAPSHOT_VERSION})")
+    print(f"Observations: {header['observations']}")
+    for tag, table in tables.items():
+        print(f"  {tag}: {len(table)} records x {table.dtype.itemsize} bytes")
+    print(f"  Strings: {len(strings)}")
+    return path
+
+
+if __name__ == "__main__":
+    create_mobile_snapshot(
+        sys.argv[1] if len(sys.argv) > 1 else 'scout.csv',
+        sys.argv[2] if len(sys.argv) > 2 else 'farm_snapshot.bin'
+    )
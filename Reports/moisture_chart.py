@@ -3,6 +3,10 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 import numpy as np
+import sys
+from scout_ingest import load_scout_exports
+from downsample import downsample_series, pixel_budget
+from tiled_output import save_dashboard
 
 def parse_date(date_str):
     """Parse date string to datetime object"""
@@ -21,14 +25,19 @@ def condition_to_numeric(condition):
     }
     return condition_map.get(condition.lower(), 0)
 
-def create_moisture_chart():
-    """Create chart showing soil moisture conditions over time by section"""
+def create_moisture_chart(source='scout.csv', full_resolution=False, method='minmax', max_points=None, tiled=False):
+    """Create chart showing soil moisture conditions over time by section
+
+    Each section's series is downsampled to the pixel width of the plot
+    (or max_points) unless full_resolution is set. With tiled set the chart
+    is written as a tile pyramid plus thumbnails instead of one PNG.
+    """
     
-    # Read the CSV file
-    df = pd.read_csv('scout.csv')
+    # Read the scout exports (a single CSV or a directory of CSVs)
+    df = load_scout_exports(source)
     
-    # Filter for moisture metrics only
-    moisture_df = df[df['metric'].str.lower() == 'moisture'].copy()
+    # Filter for moisture metrics only (the scout sheets call it 'Soil moisture')
+    moisture_df = df[df['metric'].str.lower() == 'soil moisture'].copy()
     
     if moisture_df.empty:
         print("No moisture data found in the CSV file.")
@@ -50,10 +59,19 @@ def create_moisture_chart():
     sections = moisture_df['section'].unique()
     colors = plt.cm.Set3(np.linspace(0, 1, len(sections)))
     
+    # Downsample all sections at once to what the axes can actually show
+    if full_resolution:
+        plot_df = moisture_df.sort_values(['section', 'date'], kind='mergesort')
+    else:
+        budget = max_points or pixel_budget(plt.gca())
+        plot_df = downsample_series(moisture_df, 'date', 'condition_numeric',
+                                    by='section', max_points=budget, method=method)
+    section_series = dict(tuple(plot_df.groupby('section', sort=False)))
+    
     # Plot each section
     for i, section in enumerate(sections):
-        section_data = moisture_df[moisture_df['section'] == section].sort_values('date')
-        if not section_data.empty:
+        section_data = section_series.get(section)
+        if section_data is not None:
             plt.plot(section_data['date'], section_data['condition_numeric'], 
                     marker='o', linewidth=2, markersize=6, label=section, color=colors[i])
     
@@ -79,8 +97,8 @@ def create_moisture_chart():
     plt.tight_layout()
     
     # Save the plot
-    plt.savefig('moisture_conditions_chart.png', dpi=300, bbox_inches='tight')
-    print("Chart saved as 'moisture_conditions_chart.png'")
+    output = save_dashboard(plt.gcf(), 'moisture_conditions_chart.png', dpi=300, tiled=tiled)
+    print(f"Chart saved as '{output}'")
     
     # Show the plot
     plt.show()
@@ -105,4 +123,5 @@ def create_moisture_chart():
         print(f"  Date range: {section_data['date'].min().strftime('%Y-%m-%d')} to {section_data['date'].max().strftime('%Y-%m-%d')}")
 
 if __name__ == "__main__":
-    create_moisture_chart() 
\ No newline at end of file
+    args = [arg for arg in sys.argv[1:] if arg != '--tiled']
+    create_moisture_chart(args[0] if args else 'scout.csv', tiled='--tiled' in sys.argv) 
\ No newline at end of file
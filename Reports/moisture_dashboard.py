@@ -5,6 +5,10 @@ from datetime import datetime, timedelta
 import numpy as np
 from matplotlib.patches import Rectangle
 import warnings
+import sys
+from scout_ingest import load_scout_exports
+from downsample import downsample_series, pixel_budget
+from tiled_output import save_dashboard
 warnings.filterwarnings('ignore')
 
 # Set style for better visualizations
@@ -77,21 +81,8 @@ def format_date_for_display(date_obj):
         return "Unknown"
     return date_obj.strftime('%d/%m/%Y')
 
-def create_moisture_dashboard():
-    """Create comprehensive dashboard showing recent soil moisture conditions"""
-    
-    # Read the CSV file
-    df = pd.read_csv('scout.csv')
-    
-    # Rename columns to match expected names
-    df = df.rename(columns={
-        'Date': 'date',
-        'Section': 'section', 
-        'Observation Type': 'metric',
-        'Pass/Fail': 'condition',
-        'Scout': 'scout',
-        'Notes': 'notes'
-    })
+def prepare_moisture_data(df):
+    """Parse dates row by row and keep the scored soil moisture rows"""
     
     # Parse dates
     df['date'] = df['date'].apply(parse_date)
@@ -100,16 +91,96 @@ def create_moisture_dashboard():
     # Filter for moisture metrics only
     moisture_df = df[df['metric'].str.lower() == 'soil moisture'].copy()
     
-    if moisture_df.empty:
-        print("No moisture data found in the CSV file.")
-        return
-    
     # Convert conditions to numeric values
     moisture_df['condition_numeric'] = moisture_df['condition'].apply(condition_to_numeric)
+    return moisture_df
+
+def compute_section_trends(recent_moisture):
+    """First-to-last score change per section, worst first (None when no section has two readings)"""
+    section_trends = []
+    for section in recent_moisture['section'].unique():
+        section_data = recent_moisture[recent_moisture['section'] == section].sort_values('date')
+        if len(section_data) >= 2:
+            # Calculate trend (positive = improving, negative = worsening)
+            first_score = section_data['condition_numeric'].iloc[0]
+            last_score = section_data['condition_numeric'].iloc[-1]
+            trend = last_score - first_score
+            section_trends.append({'section': section, 'trend': trend, 'current': last_score})
+    
+    if not section_trends:
+        return None
+    trend_df = pd.DataFrame(section_trends)
+    return trend_df.sort_values('trend')
+
+def moisture_issues_text(latest_moisture):
+    """Text for the critical issues and alerts panel"""
+    
+    # Find critical issues
+    critical_issues = latest_moisture[latest_moisture['condition_numeric'] < 1.5]
+    moisture_issues = latest_moisture[latest_moisture['notes'].notna() & (latest_moisture['notes'] != '')]
+    
+    issues_text = "CRITICAL ISSUES AND ALERTS:\n\n"
+    
+    if not critical_issues.empty:
+        issues_text += "🔴 CRITICAL MOISTURE ISSUES:\n"
+        for _, row in critical_issues.iterrows():
+            issues_text += f"   • {row['section']}: {row['condition']} (Score: {row['condition_numeric']:.1f})\n"
+            issues_text += f"     Last Updated: {format_date_for_display(row['date'])}\n"
+            if pd.notna(row['notes']) and str(row['notes']).strip():
+                issues_text += f"     Note: {row['notes']}\n"
+            issues_text += "\n"
+    else:
+        issues_text += "✅ No critical moisture issues detected.\n\n"
+    
+    if not moisture_issues.empty:
+        issues_text += "📝 MOISTURE NOTES AND OBSERVATIONS:\n"
+        for _, row in moisture_issues.iterrows():
+            status_icon = "🔴" if row['condition'].lower() == 'fail' else "🟡" if row['condition'].lower() == 'partial' else "🟢"
+            issues_text += f"   {status_icon} {row['section']}: {row['condition']}\n"
+            issues_text += f"     Note: {row['notes']}\n"
+            issues_text += f"     Date: {format_date_for_display(row['date'])}\n\n"
+    return issues_text
+
+def compute_moisture_panels(moisture_df):
+    """Everything the moisture dashboard shows, computed from the prepared moisture rows"""
     
     # Get the most recent moisture data for each section
     latest_moisture = moisture_df.loc[moisture_df.groupby('section')['date'].idxmax()]
     
+    # Trend panel covers the last 60 days
+    latest_date = moisture_df['date'].max()
+    sixty_days_ago = latest_date - timedelta(days=60)
+    recent_moisture = moisture_df[moisture_df['date'] >= sixty_days_ago]
+    
+    months = moisture_df['date'].dt.to_period('M')
+    return panels_from_latest(latest_moisture, recent_moisture, moisture_df.groupby('section').size(),
+                              moisture_df.groupby(months)['condition_numeric'].mean())
+
+def compute_moisture_panels_from_aggregates(aggregates, recent_moisture):
+    """The same panels from soil moisture DashboardAggregates and the prepared rows of the last 60 days"""
+    return panels_from_latest(aggregates.latest_data(), recent_moisture, aggregates.section_counts,
+                              aggregates.monthly_health())
+
+def panels_from_latest(latest_moisture, recent_moisture, section_counts, monthly_scores):
+    """Panels from the latest row per section, the 60-day window, and per-section counts and monthly averages"""
+    
+    # Monthly averages, one point per month in order
+    monthly_avg = monthly_scores.rename('condition_numeric').rename_axis('month').reset_index()
+    monthly_avg['month'] = monthly_avg['month'].astype(str)
+    monthly_avg['position'] = range(len(monthly_avg))
+    
+    return {
+        'latest_moisture': latest_moisture,
+        'section_scores': latest_moisture.groupby('section')['condition_numeric'].first(),
+        'section_trends': compute_section_trends(recent_moisture) if not recent_moisture.empty else None,
+        'section_activity': section_counts.sort_values(ascending=True),
+        'monthly_avg': monthly_avg,
+        'issues_text': moisture_issues_text(latest_moisture)
+    }
+
+def draw_moisture_dashboard(panels, full_resolution=False):
+    """Build the moisture dashboard figure from computed panels"""
+    
     # Create the dashboard
     fig = plt.figure(figsize=(6, 40))
     
@@ -120,15 +191,13 @@ def create_moisture_dashboard():
     ax1 = fig.add_subplot(gs[0, :])
     
     # Create heatmap data
-    section_scores = latest_moisture.groupby('section')['condition_numeric'].first()
+    section_scores = panels['section_scores']
     heatmap_data = section_scores.values.reshape(1, -1)
     
     # Create custom colormap
     colors = ['red', 'orange', 'green']
-    n_bins = 3
     cmap = plt.cm.colors.ListedColormap(colors)
     
-    
     im = ax1.imshow(heatmap_data, cmap=cmap, aspect='auto', vmin=0.5, vmax=3.5)
     ax1.set_yticks([])
     ax1.set_xticks(range(len(section_scores)))
@@ -144,43 +213,23 @@ def create_moisture_dashboard():
     # 3. Moisture Trend Analysis (Last 60 days)
     ax2 = fig.add_subplot(gs[1, :])
     
-    # Get data from last 60 days
-    latest_date = moisture_df['date'].max()
-    sixty_days_ago = latest_date - timedelta(days=60)
-    recent_moisture = moisture_df[moisture_df['date'] >= sixty_days_ago]
+    trend_df = panels['section_trends']
     
-    if not recent_moisture.empty:
-        # Calculate trend for each section
-        section_trends = []
-        for section in recent_moisture['section'].unique():
-            section_data = recent_moisture[recent_moisture['section'] == section].sort_values('date')
-            if len(section_data) >= 2:
-                # Calculate trend (positive = improving, negative = worsening)
-                first_score = section_data['condition_numeric'].iloc[0]
-                last_score = section_data['condition_numeric'].iloc[-1]
-                trend = last_score - first_score
-                section_trends.append({'section': section, 'trend': trend, 'current': last_score})
+    if trend_df is not None:
+        colors = ['red' if t < -0.5 else 'orange' if t < 0.5 else 'green' for t in trend_df['trend']]
+        bars = ax2.barh(range(len(trend_df)), trend_df['trend'], color=colors)
         
-        if section_trends:
-            trend_df = pd.DataFrame(section_trends)
-            trend_df = trend_df.sort_values('trend')
-            
-            colors = ['red' if t < -0.5 else 'orange' if t < 0.5 else 'green' for t in trend_df['trend']]
-            bars = ax2.barh(range(len(trend_df)), trend_df['trend'], color=colors)
-            
-            ax2.set_yticks(range(len(trend_df)))
-            ax2.set_yticklabels(trend_df['section'], fontsize=9)
-            ax2.set_xlabel('Trend (Negative = Worsening, Positive = Improving)')
-            ax2.set_title('Moisture Trend Analysis (Last 60 Days)', fontsize=12, fontweight='bold')
-            ax2.axvline(x=0, color='black', linestyle='--', alpha=0.5)
-            ax2.grid(True, alpha=0.3)
-    
-
+        ax2.set_yticks(range(len(trend_df)))
+        ax2.set_yticklabels(trend_df['section'], fontsize=9)
+        ax2.set_xlabel('Trend (Negative = Worsening, Positive = Improving)')
+        ax2.set_title('Moisture Trend Analysis (Last 60 Days)', fontsize=12, fontweight='bold')
+        ax2.axvline(x=0, color='black', linestyle='--', alpha=0.5)
+        ax2.grid(True, alpha=0.3)
     
     # 5. Section Monitoring Activity
     ax4 = fig.add_subplot(gs[2, :])
     
-    section_activity = moisture_df.groupby('section').size().sort_values(ascending=True)
+    section_activity = panels['section_activity']
     
     bars = ax4.barh(range(len(section_activity)), section_activity.values, 
                     color=plt.cm.viridis(np.linspace(0, 1, len(section_activity))))
@@ -198,14 +247,16 @@ def create_moisture_dashboard():
     # 6. Time Series of Moisture Conditions
     ax5 = fig.add_subplot(gs[3, :])
     
-    # Get monthly averages
-    moisture_df['month'] = moisture_df['date'].dt.to_period('M')
-    monthly_avg = moisture_df.groupby('month')['condition_numeric'].mean().reset_index()
-    monthly_avg['month'] = monthly_avg['month'].astype(str)
+    monthly_avg = panels['monthly_avg']
     
-    ax5.plot(range(len(monthly_avg)), monthly_avg['condition_numeric'], 
+    # Keep long histories within the pixel width of the panel
+    if not full_resolution:
+        monthly_avg = downsample_series(monthly_avg, 'position', 'condition_numeric',
+                                        max_points=pixel_budget(ax5), method='lttb')
+    
+    ax5.plot(monthly_avg['position'], monthly_avg['condition_numeric'], 
              marker='o', linewidth=2, markersize=8, color='blue')
-    ax5.set_xticks(range(len(monthly_avg)))
+    ax5.set_xticks(monthly_avg['position'])
     ax5.set_xticklabels(monthly_avg['month'], rotation=45, ha='right')
     ax5.set_ylabel('Average Moisture Score')
     ax5.set_title('Monthly Average Moisture Conditions', fontsize=12, fontweight='bold')
@@ -221,54 +272,51 @@ def create_moisture_dashboard():
     ax6 = fig.add_subplot(gs[4, :])
     ax6.axis('off')
     
-    # Find critical issues
-    critical_issues = latest_moisture[latest_moisture['condition_numeric'] < 1.5]
-    moisture_issues = latest_moisture[latest_moisture['notes'].notna() & (latest_moisture['notes'] != '')]
+    ax6.text(0.05, 0.95, panels['issues_text'], transform=ax6.transAxes, fontsize=10,
+             verticalalignment='top', fontfamily='monospace',
+             bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8))
     
-    issues_text = "CRITICAL ISSUES AND ALERTS:\n\n"
+    return fig
+
+def create_moisture_dashboard(source='scout.csv', full_resolution=False, tiled=False):
+    """Create comprehensive dashboard showing recent soil moisture conditions"""
     
-    if not critical_issues.empty:
-        issues_text += "🔴 CRITICAL MOISTURE ISSUES:\n"
-        for _, row in critical_issues.iterrows():
-            issues_text += f"   • {row['section']}: {row['condition']} (Score: {row['condition_numeric']:.1f})\n"
-            issues_text += f"     Last Updated: {format_date_for_display(row['date'])}\n"
-            if pd.notna(row['notes']) and str(row['notes']).strip():
-                issues_text += f"     Note: {row['notes']}\n"
-            issues_text += "\n"
-    else:
-        issues_text += "✅ No critical moisture issues detected.\n\n"
+    # Read the scout exports (a single CSV or a directory of CSVs)
+    moisture_df = prepare_moisture_data(load_scout_exports(source))
     
-    if not moisture_issues.empty:
-        issues_text += "📝 MOISTURE NOTES AND OBSERVATIONS:\n"
-        for _, row in moisture_issues.iterrows():
-            status_icon = "🔴" if row['condition'].lower() == 'fail' else "🟡" if row['condition'].lower() == 'partial' else "🟢"
-            issues_text += f"   {status_icon} {row['section']}: {row['condition']}\n"
-            issues_text += f"     Note: {row['notes']}\n"
-            issues_text += f"     Date: {format_date_for_display(row['date'])}\n\n"
+    if moisture_df.empty:
+        print("No moisture data found in the CSV file.")
+        return
     
-    ax6.text(0.05, 0.95, issues_text, transform=ax6.transAxes, fontsize=10,
-             verticalalignment='top', fontfamily='monospace',
-             bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8))
+    panels = compute_moisture_panels(moisture_df)
+    fig = draw_moisture_dashboard(panels, full_resolution=full_resolution)
     
     # Save the dashboard
-    plt.savefig('soil_moisture_dashboard.png', dpi=300, bbox_inches='tight')
-    print("Soil Moisture Dashboard saved as 'soil_moisture_dashboard.png'")
+    output = save_dashboard(fig, 'soil_moisture_dashboard.png', dpi=300, tiled=tiled)
+    print(f"Soil Moisture Dashboard saved as '{output}'")
     
     # Generate comprehensive text report
-    generate_dashboard_text_report(moisture_df, latest_moisture)
+    generate_dashboard_text_report(moisture_df, panels['latest_moisture'])
     
     plt.show()
 
 def generate_dashboard_text_report(moisture_df, latest_moisture):
     """Generate a comprehensive text report for the dashboard"""
+    daily_scores = moisture_df.groupby('date')['condition_numeric'].agg(['sum', 'count'])
+    write_dashboard_text_report(latest_moisture, daily_scores)
+
+def format_dashboard_text_report(latest_moisture, daily_scores):
+    """Report lines from the latest row per section and the score sum and count per date of the whole history"""
+    
+    first_date, latest_date = daily_scores.index.min(), daily_scores.index.max()
     
     report = []
     report.append("=" * 100)
     report.append("SOIL MOISTURE DASHBOARD REPORT")
     report.append("=" * 100)
     report.append(f"Report Generated: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
-    report.append(f"Data Range: {format_date_for_display(moisture_df['date'].min())} to {format_date_for_display(moisture_df['date'].max())}")
-    report.append(f"Total Moisture Observations: {len(moisture_df)}")
+    report.append(f"Data Range: {format_date_for_display(first_date)} to {format_date_for_display(latest_date)}")
+    report.append(f"Total Moisture Observations: {int(daily_scores['count'].sum())}")
     report.append("")
     
     # Executive Summary
@@ -339,17 +387,17 @@ def generate_dashboard_text_report(moisture_df, latest_moisture):
     report.append("-" * 50)
     
     # Calculate recent trends (last 30 days)
-    latest_date = moisture_df['date'].max()
     thirty_days_ago = latest_date - timedelta(days=30)
-    recent_data = moisture_df[moisture_df['date'] >= thirty_days_ago]
+    recent_data = daily_scores[daily_scores.index >= thirty_days_ago]
+    recent_count = int(recent_data['count'].sum())
     
-    if not recent_data.empty:
-        report.append(f"• Recent observations (last 30 days): {len(recent_data)}")
-        report.append(f"• Average moisture score: {recent_data['condition_numeric'].mean():.2f}")
+    if recent_count:
+        recent_avg = recent_data['sum'].sum() / recent_count
+        report.append(f"• Recent observations (last 30 days): {recent_count}")
+        report.append(f"• Average moisture score: {recent_avg:.2f}")
         
         # Compare with overall average
-        overall_avg = moisture_df['condition_numeric'].mean()
-        recent_avg = recent_data['condition_numeric'].mean()
+        overall_avg = daily_scores['sum'].sum() / daily_scores['count'].sum()
         if recent_avg > overall_avg:
             report.append("• Trend: Improving moisture conditions")
         elif recent_avg < overall_avg:
@@ -361,6 +409,11 @@ def generate_dashboard_text_report(moisture_df, latest_moisture):
     
     report.append("")
     report.append("=" * 100)
+    return report
+
+def write_dashboard_text_report(latest_moisture, daily_scores):
+    """Save and print the text report"""
+    report = format_dashboard_text_report(latest_moisture, daily_scores)
     
     # Save text report
     with open('soil_moisture_dashboard_report.txt', 'w', encoding='utf-8') as f:
@@ -371,4 +424,5 @@ def generate_dashboard_text_report(moisture_df, latest_moisture):
     print("\nDashboard text report saved as 'soil_moisture_dashboard_report.txt'")
 
 if __name__ == "__main__":
-    create_moisture_dashboard() 
\ No newline at end of file
+    args = [arg for arg in sys.argv[1:] if arg != '--tiled']
+    create_moisture_dashboard(args[0] if args else 'scout.csv', tiled='--tiled' in sys.argv) 
\ No newline at end of file
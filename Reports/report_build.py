@@ -0,0 +1,193 @@
+import ast
+import hashlib
+import json
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from scout_ingest import load_scout_exports
+
+BUILD_MANIFEST = '.report_build.json'
+
+REPORTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def frame_digest(df):
+    """Order-sensitive content hash of the rows a report reads"""
+    columns = ['date', 'section', 'metric', 'condition', 'scout', 'notes']
+    row_hashes = pd.util.hash_pandas_object(df[columns].astype(str), index=False).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
+
+
+def file_digest(path):
+    """Content hash of a file, used to rebuild outputs when a report script changes"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def local_dependencies(script):
+    """The script plus every module in this directory it imports, directly or indirectly"""
+    found = []
+    pending = [script]
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        found.append(name)
+        with open(os.path.join(REPORTS_DIR, name), 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=name)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                modules = [node.module]
+            else:
+                continue
+            for module in modules:
+                path = module.split('.')[0] + '.py'
+                if os.path.exists(os.path.join(REPORTS_DIR, path)):
+                    pending.append(path)
+    return sorted(found)
+
+
+def _metric_rows(metric):
+    return lambda df: df[df['metric'].str.lower() == metric]
+
+
+def _build_section_health(source):
+    from dashboard_report import create_dashboard_report
+    create_dashboard_report(source)
+
+
+def _build_section_summary(source):
+    from section_summary_dashboard import create_section_summary_dashboard
+    create_section_summary_dashboard(source)
+
+
+def _build_moisture_dashboard(source):
+    from moisture_dashboard import create_moisture_dashboard
+    create_moisture_dashboard(source)
+
+
+def _build_moisture_chart(source):
+    from moisture_chart import create_moisture_chart
+    create_moisture_chart(source)
+
+
+# Each target lists its outputs, the script that produces them (hashed along
+# with the local modules it imports), the slice of rows its output depends on
+# and any parameters baked into that slice
+TARGETS = {
+    'section_health': {
+        'outputs': ['section_health_dashboard.png', 'section_health_report.txt'],
+        'script': 'dashboard_report.py',
+        # Totals and the data range in the text report cover every row
+        'inputs': lambda df: df,
+        'params': {'trend_days': 30},
+        'build': _build_section_health
+    },
+    'section_summary': {
+        'outputs': ['section_summary_dashboard.png', 'section_summary_report.txt'],
+        'script': 'section_summary_dashboard.py',
+        'inputs': lambda df: df.tail(200),
+        'params': {'last_lines': 200},
+        'build': _build_section_summary
+    },
+    'soil_moisture_dashboard': {
+        'outputs': ['soil_moisture_dashboard.png', 'soil_moisture_dashboard_report.txt'],
+        'script': 'moisture_dashboard.py',
+        # The 60-day trend panel is windowed, but activity and monthly panels read all moisture rows
+        'inputs': _metric_rows('soil moisture'),
+        'params': {'trend_days': 60},
+        'build': _build_moisture_dashboard
+    },
+    'moisture_chart': {
+        'outputs': ['moisture_conditions_chart.png'],
+        'script': 'moisture_chart.py',
+        'inputs': _metric_rows('soil moisture'),
+        'params': {},
+        'build': _build_moisture_chart
+    }
+}
+
+
+def target_digest(name, inputs):
+    """Hash everything a target's outputs depend on: input rows, parameters, script and its local modules"""
+    target = TARGETS[name]
+    digest = hashlib.sha256()
+    digest.update(frame_digest(inputs).encode('utf-8'))
+    digest.update(json.dumps(target['params'], sort_keys=True).encode('utf-8'))
+    for script in local_dependencies(target['script']):
+        digest.update(script.encode('utf-8'))
+        digest.update(file_digest(os.path.join(REPORTS_DIR, script)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_manifest(path=BUILD_MANIFEST):
+    """Read the recorded dependency hashes of previously built outputs"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        print(f"Warning: ignoring unreadable build manifest {path}")
+        return {}
+
+
+def save_manifest(manifest, path=BUILD_MANIFEST):
+    """Write the manifest atomically so an interrupted build cannot corrupt it"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def stale_targets(df, manifest, targets=None):
+    """Return {target: digest} for every target whose inputs changed or outputs are missing"""
+    stale = {}
+    for name in targets or TARGETS:
+        inputs = TARGETS[name]['inputs'](df)
+        digest = target_digest(name, inputs)
+        recorded = manifest.get(name, {})
+        # Scripts write nothing when their slice is empty, so only require outputs for data
+        outputs_exist = inputs.empty or all(os.path.exists(output) for output in TARGETS[name]['outputs'])
+        if recorded.get('digest') != digest or not outputs_exist:
+            stale[name] = digest
+    return stale
+
+
+def build_reports(source='scout.csv', targets=None, force=False, manifest_path=BUILD_MANIFEST):
+    """Regenerate only the report outputs whose input slices, parameters or code changed"""
+    df = load_scout_exports(source)
+    manifest = load_manifest(manifest_path)
+
+    if force:
+        stale = {name: target_digest(name, TARGETS[name]['inputs'](df)) for name in targets or TARGETS}
+    else:
+        stale = stale_targets(df, manifest, targets)
+
+    for name in targets or TARGETS:
+        if name not in stale:
+            print(f"Up to date: {name}")
+
+    for name, digest in stale.items():
+        print(f"Building: {name}")
+        try:
+            TARGETS[name]['build'](source)
+        finally:
+            plt.close('all')
+
+        manifest[name] = {'digest': digest, 'outputs': TARGETS[name]['outputs']}
+        save_manifest(manifest, manifest_path)
+
+    return list(stale)
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != '--force']
+    build_reports(args[0] if args else 'scout.csv', force='--force' in sys.argv)
@@ -0,0 +1,331 @@
+import contextlib
+import csv
+import io
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import matplotlib
+matplotlib.use('Agg')
+import pandas as pd
+
+import dashboard_report
+import moisture_dashboard
+import section_summary_dashboard
+from chunked_aggregates import compute_dashboard_aggregates
+from scout_index import load_scout_date_range, load_scout_tail
+from scout_ingest import COLUMN_MAP, ingest_scout_exports, load_scout_exports
+
+# Lines that legitimately differ between two runs of the same report
+MASKED_LINES = re.compile(r'^Report Generated:.*$', re.MULTILINE)
+
+# Relative tolerance for float aggregates (means of small integers)
+FLOAT_RTOL = 1e-9
+
+SYNTHETIC_SECTIONS = ['B1S1', 'B1S2', 'B2S1', 'B2S2', 'B2S3', 'b2s3', 'B2S4']
+SYNTHETIC_METRICS = ['soil moisture', 'Soil moisture', 'insect pests', 'diseases', 'pipes', 'mowing', 'flowering']
+SYNTHETIC_CONDITIONS = ['pass', 'Pass', 'partial', 'Partial', 'fail', 'Fail', 'n/a']
+SYNTHETIC_NOTES = ['', '', '', 'Dry patches near pipes', 'Leak at valve', 'Weeds in basins, needs spraying']
+
+
+def make_synthetic_export(path, rows=5000, seed=0):
+    """Write a scout export with the quirks seen in real exports.
+
+    Mixed-case sections, metrics and conditions, unpadded dates, exact
+    duplicate rows, several observations of a section on the same day, a
+    stray header row, an unparseable date and no trailing newline.
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    header = list(COLUMN_MAP)
+
+    records = []
+    for i in range(rows):
+        date = start + timedelta(days=rng.randrange(240))
+        date_text = date.strftime('%d/%m/%Y') if rng.random() < 0.8 else f"{date.day}/{date.month}/{date.year}"
+        records.append([str(i + 1), date_text, rng.choice(SYNTHETIC_SECTIONS), rng.choice(SYNTHETIC_METRICS),
+                        rng.choice(SYNTHETIC_CONDITIONS), rng.choice(['Ann', 'Ben', 'Chipo']), rng.choice(SYNTHETIC_NOTES)])
+
+    for _ in range(rows // 20):
+        records.insert(rng.randrange(len(records)), list(rng.choice(records)))
+    records.insert(rng.randrange(len(records)), header)
+    records.insert(rng.randrange(len(records)), ['0', '31/02/2024', 'B1S1', 'pipes', 'pass', 'Ann', ''])
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(header)
+    writer.writerows(records)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(buffer.getvalue().rstrip('\n'))
+    return path
+
+
+def compare(legacy, fast):
+    """Return None when two stage outputs match, otherwise a short description of the difference"""
+    if isinstance(legacy, dict):
+        for key, value in legacy.items():
+            difference = compare(value, fast.get(key))
+            if difference is not None:
+                return f"{key}: {difference}"
+        return None
+
+    if legacy is None or fast is None:
+        return None if legacy is fast else f"{legacy!r} != {fast!r}"
+
+    if isinstance(legacy, str):
+        legacy_lines = MASKED_LINES.sub('', legacy).splitlines()
+        fast_lines = MASKED_LINES.sub('', fast).splitlines()
+        for i, (a, b) in enumerate(zip(legacy_lines, fast_lines)):
+            if a != b:
+                return f"line {i + 1}: {a.strip()!r} != {b.strip()!r}"
+        if len(legacy_lines) != len(fast_lines):
+            return f"{len(legacy_lines)} lines != {len(fast_lines)} lines"
+        return None
+
+    try:
+        if isinstance(legacy, pd.DataFrame):
+            pd.testing.assert_frame_equal(legacy, fast, check_dtype=False, check_names=False,
+                                          check_index_type=False, rtol=FLOAT_RTOL)
+        else:
+            pd.testing.assert_series_equal(legacy, fast, check_dtype=False, check_names=False,
+                                           check_index_type=False, rtol=FLOAT_RTOL)
+    except AssertionError as e:
+        return ' '.join(str(e).split())[:300]
+    return None
+
+
+class StageResult:
+    """Outcome and timings of one legacy/fast comparison"""
+
+    def __init__(self, dataset, report, stage, legacy_seconds, fast_seconds, difference):
+        self.dataset = dataset
+        self.report = report
+        self.stage = stage
+        self.legacy_seconds = legacy_seconds
+        self.fast_seconds = fast_seconds
+        self.difference = difference
+
+    @property
+    def ok(self):
+        return self.difference is None
+
+    @property
+    def speedup(self):
+        return self.legacy_seconds / self.fast_seconds if self.fast_seconds > 0 else float('inf')
+
+
+class Harness:
+    """Runs legacy and fast stages on one dataset and records the comparisons"""
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.results = []
+
+    def stage(self, report, stage, legacy, fast, normalise=None):
+        """Time both callables, compare their (normalised) outputs and return both outputs"""
+        # Both paths print progress and date warnings; only the comparison is of interest here
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            legacy_value = legacy()
+            legacy_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            fast_value = fast()
+            fast_seconds = time.perf_counter() - start
+
+        if normalise:
+            difference = compare(normalise(legacy_value), normalise(fast_value))
+        else:
+            difference = compare(legacy_value, fast_value)
+        self.results.append(StageResult(self.dataset, report, stage, legacy_seconds, fast_seconds, difference))
+        return legacy_value, fast_value
+
+
+def capture_report(generate, *args):
+    """Run a text report generator and return what it wrote to the console"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        generate(*args)
+    return output.getvalue()
+
+
+def comparable_rows(df):
+    """Columns and order shared by legacy frames and the aggregates' latest rows"""
+    rows = df[['section', 'metric', 'date', 'condition', 'condition_numeric', 'notes']].copy()
+    rows['date'] = pd.to_datetime(rows['date'])
+    rows['notes'] = rows['notes'].fillna('')
+    return rows.sort_values('section', kind='mergesort').reset_index(drop=True)
+
+
+def comparable_panels(rows_key):
+    """Normalise the panel holding dashboard rows; every other panel is compared as drawn"""
+    return lambda panels: {**panels, rows_key: comparable_rows(panels[rows_key])}
+
+
+def observation_count(value):
+    """Rows loaded by a legacy path, or observations folded into aggregates"""
+    return pd.Series([len(value) if isinstance(value, pd.DataFrame) else value.total_observations])
+
+
+def fast_aggregates(source, store, metric=None):
+    """Ingest once into the deduplicating store, then stream it in chunks"""
+    if not os.path.exists(store):
+        ingest_scout_exports(source, store)
+    return compute_dashboard_aggregates(store, metric=metric)
+
+
+def check_section_health(harness, source, store):
+    """create_dashboard_report against create_dashboard_from_aggregates"""
+    report = 'section_health'
+    module = dashboard_report
+
+    df, aggregates = harness.stage(report, 'load', lambda: module.prepare_dashboard_data(load_scout_exports(source)),
+                                   lambda: fast_aggregates(source, store), normalise=observation_count)
+
+    panels, fast_panels = harness.stage(report, 'panels', lambda: module.compute_dashboard_panels(df),
+                                        lambda: module.compute_dashboard_panels_from_aggregates(aggregates),
+                                        normalise=comparable_panels('latest_data'))
+
+    harness.stage(report, 'text report',
+                  lambda: capture_report(module.generate_text_report, df, panels['latest_data']),
+                  lambda: capture_report(module.write_text_report, fast_panels['latest_data'],
+                                         aggregates.min_date, aggregates.max_date, aggregates.total_observations))
+
+
+def check_section_summary(harness, source):
+    """create_section_summary_dashboard's indexed tail read against a full read"""
+    report = 'section_summary'
+    module = section_summary_dashboard
+
+    df, tail = harness.stage(report, 'last 200 rows',
+                             lambda: module.prepare_summary_data(load_scout_exports(source).tail(200).reset_index(drop=True)),
+                             lambda: module.prepare_summary_data(load_scout_tail(source, 200)),
+                             normalise=comparable_rows)
+
+    panels, fast_panels = harness.stage(report, 'panels', lambda: module.compute_summary_panels(df),
+                                        lambda: module.compute_summary_panels(tail),
+                                        normalise=comparable_panels('latest_data'))
+
+    harness.stage(report, 'text report',
+                  lambda: capture_report(module.generate_summary_text_report, df, panels['latest_data']),
+                  lambda: capture_report(module.generate_summary_text_report, tail, fast_panels['latest_data']))
+
+
+def check_soil_moisture(harness, source, store):
+    """create_moisture_dashboard against soil moisture aggregates and an indexed read of the trend window"""
+    report = 'soil_moisture'
+    module = moisture_dashboard
+
+    moisture_df, aggregates = harness.stage(
+        report, 'load', lambda: module.prepare_moisture_data(load_scout_exports(source)),
+        lambda: fast_aggregates(source, store, metric='soil moisture'), normalise=observation_count)
+    if moisture_df.empty:
+        return
+
+    def fast_panels():
+        since = aggregates.max_date - timedelta(days=60)
+        recent_moisture = module.prepare_moisture_data(load_scout_date_range(source, since))
+        return module.compute_moisture_panels_from_aggregates(aggregates, recent_moisture)
+
+    panels, fast = harness.stage(report, 'panels', lambda: module.compute_moisture_panels(moisture_df), fast_panels,
+                                 normalise=comparable_panels('latest_moisture'))
+
+    harness.stage(report, 'text report',
+                  lambda: capture_report(module.generate_dashboard_text_report, moisture_df, panels['latest_moisture']),
+                  lambda: capture_report(module.write_dashboard_text_report, fast['latest_moisture'],
+                                         aggregates.daily_scores))
+
+
+def run_dataset(name, source):
+    """Copy a dataset into a scratch directory and compare every report stage on it"""
+    harness = Harness(name)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # Work on a copy so index sidecars, stores and text reports stay out of the source tree
+        target = os.path.join(workdir, os.path.basename(os.path.normpath(source)))
+        if os.path.isdir(source):
+            shutil.copytree(source, target)
+        else:
+            shutil.copy(source, target)
+
+        os.chdir(workdir)
+        try:
+            store = os.path.join(workdir, 'store.db')
+            check_section_health(harness, target, store)
+            check_section_summary(harness, target)
+            check_soil_moisture(harness, target, store)
+        finally:
+            os.chdir(cwd)
+    return harness.results
+
+
+def format_results(results):
+    """Table of stage outcomes and legacy/fast timing ratios"""
+    lines = []
+    lines.append("=" * 100)
+    lines.append("REPORT EQUIVALENCE: LEGACY VS FAST PATHS")
+    lines.append("=" * 100)
+    lines.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append("")
+    width = max([len('Dataset')] + [len(r.dataset) for r in results]) + 2
+    lines.append(f"{'Dataset':<{width}}{'Report':<17}{'Stage':<18}{'Result':<8}{'Legacy ms':>11}{'Fast ms':>10}{'Speedup':>9}")
+    lines.append("-" * 100)
+    for r in results:
+        lines.append(f"{r.dataset:<{width}}{r.report:<17}{r.stage:<18}{'ok' if r.ok else 'DIFF':<8}"
+                     f"{r.legacy_seconds * 1000:>11.1f}{r.fast_seconds * 1000:>10.1f}{r.speedup:>8.1f}x")
+    lines.append("")
+
+    failures = [r for r in results if not r.ok]
+    if failures:
+        lines.append("DIFFERENCES:")
+        lines.append("-" * 40)
+        for r in failures:
+            lines.append(f"{r.dataset} / {r.report} / {r.stage}: {r.difference}")
+        lines.append("")
+    lines.append(f"{len(results) - len(failures)} of {len(results)} stages match")
+    lines.append("=" * 100)
+    return lines
+
+
+def dataset_labels(sources):
+    """Unique label for every source: its path as given, numbered if it is listed more than once"""
+    labels = {}
+    for source in sources:
+        label = os.path.normpath(source)
+        name, n = label, 1
+        while name in labels:
+            n += 1
+            name = f"{label} #{n}"
+        labels[name] = source
+    return labels
+
+
+def run_equivalence(sources=('scout.csv',), synthetic_rows=(2000, 20000)):
+    """Compare legacy and fast report paths on synthetic exports and the given sources"""
+    results = []
+    with tempfile.TemporaryDirectory() as synthetic_dir:
+        for seed, rows in enumerate(synthetic_rows):
+            path = make_synthetic_export(os.path.join(synthetic_dir, f"synthetic_{rows}.csv"), rows, seed)
+            results.extend(run_dataset(f"synthetic-{rows}", path))
+
+    for name, source in dataset_labels(sources).items():
+        if os.path.exists(source):
+            results.extend(run_dataset(name, source))
+        else:
+            print(f"Warning: {source} not found, skipping")
+
+    report = format_results(results)
+    with open('report_equivalence_report.txt', 'w', encoding='utf-8') as f:
+        f.write('\n'.join(report))
+    print('\n'.join(report))
+    print("\nText report saved as 'report_equivalence_report.txt'")
+    return all(r.ok for r in results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_equivalence(sys.argv[1:] or ['scout.csv']) else 1)
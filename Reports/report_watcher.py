@@ -0,0 +1,219 @@
+import asyncio
+import hashlib
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from chunked_aggregates import DashboardAggregates, compute_dashboard_aggregates
+from dashboard_report import create_dashboard_from_aggregates
+from report_build import TARGETS, build_reports
+from scout_ingest import (
+    INGEST_DB,
+    compute_row_hashes,
+    drop_duplicate_rows,
+    list_scout_exports,
+    merge_into_store,
+    normalise_scout_columns,
+    unseen_rows,
+)
+
+# Targets that still need the rows themselves; section_health renders from the aggregates
+ROW_TARGETS = [name for name in TARGETS if name != 'section_health']
+
+
+def snapshot_exports(source):
+    """(size, mtime) of every export under source, keyed by path"""
+    snapshot = {}
+    for path in list_scout_exports(source):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def prefix_digest(path, length):
+    """sha256 of the first length bytes of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while length > 0:
+            block = f.read(min(length, 1 << 20))
+            if not block:
+                break
+            digest.update(block)
+            length -= len(block)
+    return digest
+
+
+def complete_records_end(data):
+    """Length of the complete CSV records at the start of data.
+
+    A record is complete at a newline outside quotes, so a line the app is
+    still writing, or a quoted note cut off mid-way, is left for later.
+    """
+    end = position = 0
+    in_quotes = False
+    for line in io.BytesIO(data):
+        position += len(line)
+        if line.count(b'"') % 2:
+            in_quotes = not in_quotes
+        if not in_quotes and line.endswith(b'\n'):
+            end = position
+    return end
+
+
+def read_export_from(path, offset, prefix=None):
+    """Read the complete rows of an export from a byte offset.
+
+    prefix is the sha256 of the bytes before offset (None when offset is 0);
+    it is extended with the bytes consumed. Returns (rows, end offset,
+    prefix), where rows is None when no complete record was added.
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+        if not header.endswith(b'\n'):
+            return None, 0, None
+        if prefix is None:
+            prefix = hashlib.sha256(header)
+        start = max(offset, f.tell())
+        f.seek(start)
+        data = f.read()
+
+    data = data[:complete_records_end(data)]
+    prefix.update(data)
+    if not data.strip():
+        return None, start + len(data), prefix
+
+    df = pd.read_csv(io.BytesIO(header + data), dtype=str, keep_default_na=False)
+    return normalise_scout_columns(df, os.path.basename(path)), start + len(data), prefix
+
+
+class ReportWatcher:
+    """Watches scout exports and keeps the ingest store, aggregates and dashboards current.
+
+    Polling, debouncing and ingest run on the event loop (file reads and
+    SQLite writes go through worker threads); dashboard rendering runs in a
+    process pool, so the loop keeps noticing new exports while a render is
+    in progress. Appended rows are read from the last known byte offset, so
+    a sync only parses the new bytes; an export whose earlier bytes changed
+    is read again from the start. The health dashboard is drawn from the
+    aggregates of the store, not from the exports.
+    """
+
+    def __init__(self, source='scout.csv', db_path=INGEST_DB, poll_interval=1.0, debounce=3.0):
+        self.source = source
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+
+        self.snapshot = {}
+        self.offsets = {}
+        self.aggregates = DashboardAggregates()
+        self.changed = asyncio.Event()
+        self.last_change = 0.0
+
+    def read_new_rows(self, snapshot):
+        """Read rows appended to known exports and all rows of new or rewritten ones"""
+        frames = []
+        for path, (size, mtime) in snapshot.items():
+            offset, read_mtime, prefix = self.offsets.get(path, (0, None, None))
+            if mtime == read_mtime:
+                continue
+            if offset and (size < offset or prefix_digest(path, offset).digest() != prefix.digest()):
+                # Re-sent or edited rather than appended to; re-read it and let the hashes dedup
+                print(f"{path} was rewritten, re-reading it")
+                offset, prefix = 0, None
+            rows, end, prefix = read_export_from(path, offset, prefix)
+            self.offsets[path] = (end, mtime, prefix)
+            if rows is not None:
+                frames.append(rows)
+
+        if not frames:
+            return None
+        df = pd.concat(frames, ignore_index=True)
+        df.insert(0, 'row_hash', compute_row_hashes(df))
+        df, _, _ = drop_duplicate_rows(df)
+        return df
+
+    def ingest(self, snapshot):
+        """Merge new rows into the store; return the rows not seen before and the corrected count"""
+        df = self.read_new_rows(snapshot)
+        if df is None:
+            return None, 0
+        new_rows = unseen_rows(df, self.db_path)
+        _, corrected = merge_into_store(df, self.db_path)
+        return new_rows, corrected
+
+    async def refresh(self, executor):
+        """Run an incremental ingest and aggregate update, then re-render stale dashboards"""
+        loop = asyncio.get_running_loop()
+        snapshot = self.snapshot
+
+        new_rows, corrected = await asyncio.to_thread(self.ingest, snapshot)
+        if not corrected and (new_rows is None or new_rows.empty):
+            print("No new observations")
+            return
+
+        if corrected:
+            # A corrected condition cannot be taken back out of the counts; restream the store
+            self.aggregates = await asyncio.to_thread(compute_dashboard_aggregates, self.db_path)
+        else:
+            self.aggregates.update(new_rows)
+        print(f"Ingested {len(new_rows)} new observations, corrected {corrected} "
+              f"({self.aggregates.total_observations} total, latest {self.aggregates.max_date:%d/%m/%Y})")
+
+        # The health dashboard needs nothing beyond the aggregates; the other
+        # targets window or trend individual rows, so they are rebuilt from the exports
+        await loop.run_in_executor(executor, create_dashboard_from_aggregates, self.aggregates)
+        rebuilt = await loop.run_in_executor(executor, build_reports, self.source, ROW_TARGETS)
+        print(f"Re-rendered: {', '.join(['section_health'] + rebuilt)}")
+
+    async def poll(self):
+        """Flag a change whenever an export is added, appended to or rewritten"""
+        loop = asyncio.get_running_loop()
+        while True:
+            snapshot = await asyncio.to_thread(snapshot_exports, self.source)
+            if snapshot != self.snapshot:
+                self.snapshot = snapshot
+                self.last_change = loop.time()
+                self.changed.set()
+            await asyncio.sleep(self.poll_interval)
+
+    async def run(self, max_workers=1):
+        """Watch until cancelled"""
+        loop = asyncio.get_running_loop()
+        print(f"Watching {self.source} (debounce {self.debounce}s)")
+
+        # Start from what is already in the store; the first refresh adds the rest
+        if os.path.exists(self.db_path):
+            self.aggregates = await asyncio.to_thread(compute_dashboard_aggregates, self.db_path)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            poller = asyncio.create_task(self.poll())
+            try:
+                while True:
+                    await self.changed.wait()
+
+                    # Wait for the burst of writes to settle
+                    while (quiet := loop.time() - self.last_change) < self.debounce:
+                        await asyncio.sleep(self.debounce - quiet)
+                    self.changed.clear()
+
+                    try:
+                        await self.refresh(executor)
+                    except Exception as e:
+                        print(f"Error refreshing reports: {e}")
+            finally:
+                poller.cancel()
+
+
+if __name__ == "__main__":
+    watcher = ReportWatcher(sys.argv[1] if len(sys.argv) > 1 else 'scout.csv')
+    try:
+        asyncio.run(watcher.run())
+    except KeyboardInterrupt:
+        print("Stopped watching")
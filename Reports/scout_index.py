@@ -0,0 +1,272 @@
+import hashlib
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from scout_ingest import (
+    ROW_HASH_VERSION,
+    compute_row_hashes,
+    drop_duplicate_rows,
+    load_scout_exports,
+    normalise_scout_columns,
+    parse_scout_dates
+)
+
+INDEX_SUFFIX = '.idx.npz'
+
+# Bytes at the start of the file used to detect a rewritten (not appended) export
+PREFIX_BYTES = 4096
+
+
+class ScoutIndex:
+    """Byte offsets, dates and row hashes for every record of one scout CSV export.
+
+    offsets[i] is where record i starts; record i ends where record i + 1
+    starts (or at size). duplicate[i] marks records whose row hash already
+    appeared earlier in the file, matching the dedup in load_scout_exports.
+    mtime, prefix_hash and tail_hash describe the file as it was indexed.
+    """
+
+    def __init__(self, offsets, dates, hashes, size, open_tail, prefix_hash, mtime, tail_hash):
+        self.offsets = offsets
+        self.dates = dates
+        self.hashes = hashes
+        self.size = size
+        self.open_tail = open_tail
+        self.prefix_hash = prefix_hash
+        self.mtime = mtime
+        self.tail_hash = tail_hash
+        self.duplicate = pd.Index(hashes).duplicated(keep='first')
+
+    def ends(self):
+        """End offset of every record"""
+        return np.append(self.offsets[1:], self.size)
+
+
+def index_path(path):
+    """Sidecar index location for an export"""
+    return path + INDEX_SUFFIX
+
+
+def _prefix_hash(f, size):
+    """Hash of the first bytes of the file as they were when it was size bytes long"""
+    f.seek(0)
+    return hashlib.sha256(f.read(min(size, PREFIX_BYTES))).hexdigest()
+
+
+def _tail_hash(f, offsets, size):
+    """Hash of the last record as it was when the file was size bytes long"""
+    start = int(offsets[-1]) if len(offsets) else size
+    f.seek(start)
+    return hashlib.sha256(f.read(size - start)).hexdigest()
+
+
+def _scan_records(f, start):
+    """Return the start offset of every CSV record from start onwards.
+
+    Lines inside a quoted field (an odd number of quotes so far) belong to
+    the same record, so notes containing newlines are handled. Blank lines
+    are skipped like pandas does.
+    """
+    f.seek(start)
+    offsets = []
+    position = start
+    record_start = None
+    in_quotes = False
+
+    for line in f:
+        if record_start is None:
+            if not line.strip():
+                position += len(line)
+                continue
+            record_start = position
+        if line.count(b'"') % 2:
+            in_quotes = not in_quotes
+        position += len(line)
+        if not in_quotes:
+            offsets.append(record_start)
+            record_start = None
+
+    if record_start is not None:
+        offsets.append(record_start)
+    return offsets, position
+
+
+def _parse_records(f, header, start, end):
+    """Parse the records between two offsets into a normalised frame"""
+    f.seek(start)
+    data = f.read(end - start)
+    df = pd.read_csv(io.BytesIO(header + data), dtype=str, keep_default_na=False)
+    return normalise_scout_columns(df, '')
+
+
+def _load_index(path):
+    sidecar = index_path(path)
+    if not os.path.exists(sidecar):
+        return None
+    try:
+        with np.load(sidecar) as data:
+            # Hashes from another version would not dedup like load_scout_exports
+            if int(data['hash_version']) != ROW_HASH_VERSION:
+                return None
+            return ScoutIndex(
+                data['offsets'], data['dates'], data['hashes'], int(data['size']),
+                bool(data['open_tail']), str(data['prefix_hash']), int(data['mtime']),
+                str(data['tail_hash'])
+            )
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_index(path, index):
+    sidecar = index_path(path)
+    temp_path = sidecar + '.tmp.npz'
+    np.savez(
+        temp_path, offsets=index.offsets, dates=index.dates, hashes=index.hashes,
+        size=index.size, open_tail=index.open_tail, prefix_hash=index.prefix_hash,
+        mtime=index.mtime, tail_hash=index.tail_hash, hash_version=ROW_HASH_VERSION
+    )
+    os.replace(temp_path, sidecar)
+
+
+def update_index(path):
+    """Bring the sidecar index up to date with the export and return it.
+
+    An untouched file (same size and mtime) is returned as indexed. If it
+    grew and both its first bytes and its last indexed record are unchanged,
+    only the appended bytes are scanned and parsed. Any other change (it
+    shrank, or was modified without growing) re-indexes it from scratch.
+    Exports are append-only, so an edit in the middle that also grows the
+    file is not detected.
+    """
+    stat = os.stat(path)
+    size, mtime = stat.st_size, stat.st_mtime_ns
+    index = _load_index(path)
+    if index is not None and index.size == size and index.mtime == mtime:
+        return index
+
+    with open(path, 'rb') as f:
+        header = f.readline()
+
+        appended = (index is not None and index.size < size
+                    and _prefix_hash(f, index.size) == index.prefix_hash
+                    and _tail_hash(f, index.offsets, index.size) == index.tail_hash)
+
+        keep = 0
+        start = len(header)
+        if appended:
+            keep = len(index.offsets)
+            start = index.size
+            # The last record may continue into the appended bytes
+            if index.open_tail and keep:
+                keep -= 1
+                start = int(index.offsets[keep])
+        elif index is not None:
+            print(f"Warning: {path} was rewritten, rebuilding its index")
+
+        new_offsets, end = _scan_records(f, start)
+        new_rows = _parse_records(f, header, start, end)
+        if len(new_rows) != len(new_offsets):
+            raise ValueError(f"Could not index {path}: found {len(new_offsets)} records "
+                             f"but parsed {len(new_rows)} rows")
+
+        f.seek(max(end - 1, 0))
+        open_tail = end > len(header) and f.read(1) != b'\n'
+        prefix_hash = _prefix_hash(f, end)
+        offsets = np.concatenate([index.offsets[:keep] if keep else np.empty(0, 'int64'),
+                                  np.asarray(new_offsets, dtype='int64')])
+        tail_hash = _tail_hash(f, offsets, end)
+
+    new_dates = parse_scout_dates(new_rows['date']).to_numpy(dtype='datetime64[D]')
+    old = slice(0, keep)
+    index = ScoutIndex(
+        offsets,
+        np.concatenate([index.dates[old] if keep else np.empty(0, 'datetime64[D]'), new_dates]),
+        np.concatenate([index.hashes[old] if keep else np.empty(0, 'int64'),
+                        compute_row_hashes(new_rows)]),
+        end, open_tail, prefix_hash, mtime, tail_hash
+    )
+    _save_index(path, index)
+    return index
+
+
+def read_records(path, ordinals, index=None):
+    """Parse only the given records of an export, reading contiguous runs in one go"""
+    index = index or update_index(path)
+    ordinals = np.asarray(ordinals, dtype='int64')
+    ends = index.ends()
+
+    parts = []
+    with open(path, 'rb') as f:
+        header = f.readline()
+        if len(ordinals):
+            # Split the selection into runs of consecutive records
+            breaks = np.flatnonzero(np.diff(ordinals) != 1) + 1
+            for run in np.split(ordinals, breaks):
+                f.seek(int(index.offsets[run[0]]))
+                chunk = f.read(int(ends[run[-1]] - index.offsets[run[0]]))
+                parts.append(chunk if chunk.endswith(b'\n') else chunk + b'\n')
+
+    df = pd.read_csv(io.BytesIO(header + b''.join(parts)), dtype=str, keep_default_na=False)
+    df = normalise_scout_columns(df, os.path.basename(path))
+    df.insert(0, 'row_hash', index.hashes[ordinals])
+    df['notes'] = df['notes'].replace('', None)
+    return df
+
+
+def _read_unique_records(source, index, mask):
+    """Parse the selected records with their later copies and dedup them like load_scout_exports"""
+    df, _, _ = drop_duplicate_rows(read_records(source, np.flatnonzero(mask), index))
+    return df
+
+
+def load_scout_tail(source, n):
+    """Last n unique records, the same rows as load_scout_exports(source).tail(n)"""
+    if os.path.isdir(source):
+        return load_scout_exports(source).tail(n).reset_index(drop=True)
+
+    index = update_index(source)
+    ordinals = np.flatnonzero(~index.duplicate)[-n:] if n > 0 else []
+    return _read_unique_records(source, index, np.isin(index.hashes, index.hashes[ordinals]))
+
+
+def load_scout_date_range(source, start=None, end=None):
+    """Unique records dated within [start, end], parsing only their bytes"""
+    if os.path.isdir(source):
+        df = load_scout_exports(source)
+        dates = parse_scout_dates(df['date'])
+        mask = dates.notna()
+        if start is not None:
+            mask &= dates >= pd.Timestamp(start)
+        if end is not None:
+            mask &= dates <= pd.Timestamp(end)
+        return df[mask].reset_index(drop=True)
+
+    index = update_index(source)
+    # Copies of a record share its date, so they fall in the same range
+    mask = ~np.isnat(index.dates)
+    if start is not None:
+        mask &= index.dates >= np.datetime64(pd.Timestamp(start).date(), 'D')
+    if end is not None:
+        mask &= index.dates <= np.datetime64(pd.Timestamp(end).date(), 'D')
+    return _read_unique_records(source, index, mask)
+
+
+def latest_scout_date(source):
+    """Most recent valid observation date in an export"""
+    index = update_index(source)
+    valid = index.dates[~np.isnat(index.dates)]
+    return pd.Timestamp(valid.max()) if len(valid) else None
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else 'scout.csv'
+    index = update_index(path)
+    print(f"Indexed {len(index.offsets)} records ({int(index.duplicate.sum())} duplicates) "
+          f"in {index_path(path)}")
+    latest = latest_scout_date(path)
+    if latest is not None:
+        print(f"Latest observation: {latest.strftime('%d/%m/%Y')}")
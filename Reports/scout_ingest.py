@@ -0,0 +1,292 @@
+import os
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+# Column names used by the scout CSV exports and the names the reports expect
+COLUMN_MAP = {
+    'Index': 'index',
+    'Date': 'date',
+    'Section': 'section',
+    'Observation Type': 'metric',
+    'Pass/Fail': 'condition',
+    'Scout': 'scout',
+    'Notes': 'notes'
+}
+
+# Fields that identify an observation; the Index column is not reliable
+DEDUP_KEYS = ['date', 'section', 'metric', 'scout', 'notes']
+
+STORE_COLUMNS = ['row_hash', 'date', 'section', 'metric', 'condition', 'scout', 'notes', 'source']
+
+# Bump when compute_row_hashes changes; stores and index sidecars keyed by
+# another version are refused or rebuilt rather than mixed
+ROW_HASH_VERSION = 2
+
+INGEST_DB = 'scout_ingest.db'
+
+CONDITION_SCORES = {
+    'pass': 3,
+    'partial': 2,
+    'fail': 1,
+    'n/a': 0
+}
+
+
+def normalise_section(value):
+    """'b2-s1 ' -> 'B2S1', the form used by both farm.dbf and the scout sheets"""
+    return value.strip().upper().replace('-', '').replace(' ', '')
+
+
+def normalise_metric(value):
+    """Lower case with single spaces"""
+    return ' '.join(value.lower().split())
+
+
+def normalise_date(value):
+    """'1/2/2024' -> '01/02/2024'; unparseable dates are returned stripped"""
+    value = value.strip()
+    try:
+        return datetime.strptime(value, '%d/%m/%Y').strftime('%d/%m/%Y')
+    except ValueError:
+        return value
+
+
+def list_scout_exports(source):
+    """Return the CSV export paths for a single file or a directory of exports"""
+    if os.path.isdir(source):
+        return sorted(
+            os.path.join(source, name) for name in os.listdir(source)
+            if name.lower().endswith('.csv')
+        )
+    return [source]
+
+
+def normalise_scout_columns(df, source_name):
+    """Rename export columns to report names and strip whitespace from values"""
+    df = df.rename(columns=COLUMN_MAP)
+    for column in COLUMN_MAP.values():
+        if column not in df.columns:
+            df[column] = ''
+        df[column] = df[column].fillna('').str.strip()
+    df['source'] = source_name
+    return df
+
+
+def read_scout_export(path, catalogues=None):
+    """Read one scout CSV export and normalise its columns.
+
+    With catalogues (scout_validator.load_catalogues()), rows go through the
+    validator first: unusable rows are dropped and section, metric,
+    condition and date spellings are normalised, so e.g. 'b2s1a' and
+    'B2S1A' count as one section. The validation counts are kept in
+    df.attrs.
+    """
+    if catalogues is None:
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        return normalise_scout_columns(df, os.path.basename(path))
+
+    # Imported here: the validator itself builds on this module
+    from scout_validator import ValidationSummary, validated_rows
+
+    summary = ValidationSummary()
+    rows = validated_rows(path, summary, catalogues)
+    header = next(rows, list(COLUMN_MAP))
+    df = normalise_scout_columns(pd.DataFrame(list(rows), columns=header, dtype=str),
+                                 os.path.basename(path))
+    df.attrs.update(rows_checked=summary.rows, rows_rejected=summary.rejected,
+                    rows_normalised=summary.normalised)
+    return df
+
+
+def parse_scout_dates(dates):
+    """Parse a Series of dd/mm/yyyy strings, returning NaT for invalid dates"""
+    return pd.to_datetime(dates, format='%d/%m/%Y', errors='coerce')
+
+
+def conditions_to_numeric(conditions):
+    """Convert a Series of conditions to numeric scores (unknown values score 0)"""
+    return conditions.str.lower().map(CONDITION_SCORES).fillna(0).astype('int8')
+
+
+def canonical_keys(df):
+    """DEDUP_KEYS with the spellings the validator normalises folded together.
+
+    Each distinct value is normalised once, so the hashes of a row are the
+    same whether or not it went through the validator.
+    """
+    keys = df[DEDUP_KEYS].fillna('').astype(str)
+    for column, normalise in (('date', normalise_date), ('section', normalise_section),
+                              ('metric', normalise_metric), ('scout', str.strip), ('notes', str.strip)):
+        values = keys[column].unique()
+        keys[column] = keys[column].map(dict(zip(values, map(normalise, values))))
+    return keys
+
+
+def compute_row_hashes(df):
+    """Hash the canonical (date, section, metric, scout, notes) of every row as signed 64-bit ints"""
+    hashes = pd.util.hash_pandas_object(canonical_keys(df), index=False)
+    return hashes.to_numpy().view('int64')
+
+
+def drop_duplicate_rows(df):
+    """Drop rows whose row hash appeared earlier, keeping the last condition entered.
+
+    A duplicate keeps the position of its first appearance but takes the
+    condition of its last one: when a scout re-enters an observation with a
+    different condition, the later entry is the correction. Returns the
+    frame, the number of rows dropped and the number of observations whose
+    copies disagreed on the condition.
+    """
+    repeated = df['row_hash'].duplicated(keep=False)
+    if not repeated.any():
+        return df, 0, 0
+
+    copies = df.loc[repeated, ['row_hash', 'condition']]
+    conflicting = int((copies['condition'].str.lower().groupby(copies['row_hash']).nunique() > 1).sum())
+    last_condition = copies.groupby('row_hash')['condition'].last()
+
+    unique = df.drop_duplicates(subset='row_hash', keep='first').reset_index(drop=True)
+    corrected = unique['row_hash'].map(last_condition)
+    unique['condition'] = corrected.where(corrected.notna(), unique['condition'])
+    return unique, len(df) - len(unique), conflicting
+
+
+def load_scout_exports(source='scout.csv', max_workers=None, validate=False):
+    """Read every scout export concurrently and drop repeated observations.
+
+    Rows are repeated both across re-sent exports and within one export, so
+    the dedup runs over all rows read; see drop_duplicate_rows for which
+    copy wins. The counts are printed and kept in df.attrs. With validate,
+    every export is validated and normalised first (see read_scout_export),
+    so copies that differ only in spelling are deduplicated too.
+    """
+    paths = list_scout_exports(source)
+    if not paths:
+        raise FileNotFoundError(f"No CSV exports found in {source}")
+
+    catalogues = None
+    if validate:
+        from scout_validator import load_catalogues
+        catalogues = load_catalogues()
+
+    # Parsing is mostly done in the C engine, so threads overlap I/O and parsing
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(lambda path: read_scout_export(path, catalogues), paths))
+
+    df = pd.concat(frames, ignore_index=True)
+    df.attrs = {}
+    if validate:
+        for key in ('rows_checked', 'rows_rejected', 'rows_normalised'):
+            df.attrs[key] = sum(frame.attrs[key] for frame in frames)
+        print(f"Validated {df.attrs['rows_checked']} rows: {df.attrs['rows_rejected']} rejected, "
+              f"{df.attrs['rows_normalised']} normalised")
+    df.insert(0, 'row_hash', compute_row_hashes(df))
+    df, dropped, conflicting = drop_duplicate_rows(df)
+    df.attrs.update(duplicates_dropped=dropped, conflicting_duplicates=conflicting)
+    if dropped:
+        print(f"Dropped {dropped} duplicate rows ({conflicting} observations re-entered "
+              f"with a different condition; the last entry was kept)")
+
+    # Keep missing notes as NaN like pd.read_csv does for the reports
+    df['notes'] = df['notes'].replace('', None)
+    return df
+
+
+def merge_into_store(df, db_path=INGEST_DB):
+    """Merge ingested rows into the SQLite ingest store in a single bulk write.
+
+    A row already in the store keeps its place and spelling; if it arrives
+    again with a different condition (ignoring case) the stored condition is
+    corrected, like the dedup in load_scout_exports. Returns (inserted,
+    corrected) row counts. A store keyed by another ROW_HASH_VERSION is
+    refused, since its rows would not dedup against these.
+    """
+    rows = df.reindex(columns=STORE_COLUMNS).astype(object)
+    rows = rows.where(rows.notna(), None)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'observations'"
+        ).fetchone()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if exists and version != ROW_HASH_VERSION:
+            raise ValueError(f"{db_path} was built with row hash version {version}, not "
+                             f"{ROW_HASH_VERSION}; re-ingest the exports into a new store")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS observations ("
+            "row_hash INTEGER NOT NULL UNIQUE, date TEXT, section TEXT, metric TEXT, "
+            "condition TEXT, scout TEXT, notes TEXT, source TEXT)"
+        )
+        conn.execute(f"PRAGMA user_version = {ROW_HASH_VERSION}")
+        before = conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0]
+        changes = conn.total_changes
+        with conn:
+            conn.executemany(
+                f"INSERT INTO observations ({', '.join(STORE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(STORE_COLUMNS))}) "
+                "ON CONFLICT(row_hash) DO UPDATE SET condition = excluded.condition, source = excluded.source "
+                "WHERE lower(observations.condition) IS NOT lower(excluded.condition)",
+                rows.itertuples(index=False, name=None)
+            )
+        changes = conn.total_changes - changes
+        after = conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0]
+    finally:
+        conn.close()
+
+    inserted = after - before
+    return inserted, changes - inserted
+
+
+def unseen_rows(df, db_path=INGEST_DB):
+    """Return the rows of df whose hash is not yet in the ingest store"""
+    if not os.path.exists(db_path):
+        return df
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TEMP TABLE incoming (row_hash INTEGER PRIMARY KEY)")
+        conn.executemany("INSERT OR IGNORE INTO incoming VALUES (?)",
+                         ((int(h),) for h in df['row_hash']))
+        known = {row[0] for row in conn.execute(
+            "SELECT o.row_hash FROM observations o JOIN incoming i ON o.row_hash = i.row_hash"
+        )}
+    except sqlite3.OperationalError:
+        # No observations table yet
+        return df
+    finally:
+        conn.close()
+
+    return df[~df['row_hash'].isin(known)]
+
+
+def read_ingest_store(db_path=INGEST_DB):
+    """Read all observations from the ingest store in insertion order"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql_query(
+            f"SELECT {', '.join(STORE_COLUMNS)} FROM observations ORDER BY rowid", conn
+        )
+    finally:
+        conn.close()
+
+
+def ingest_scout_exports(source='scout.csv', db_path=INGEST_DB, max_workers=None, validate=False):
+    """Load, deduplicate (optionally validate and normalise) and merge scout exports into the ingest store"""
+    df = load_scout_exports(source, max_workers=max_workers, validate=validate)
+    inserted, corrected = merge_into_store(df, db_path)
+
+    print(f"Exports read: {df['source'].nunique()}")
+    print(f"Unique observations: {len(df)}")
+    print(f"New observations stored: {inserted}")
+    print(f"Stored conditions corrected: {corrected}")
+    return inserted
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != '--validate']
+    ingest_scout_exports(args[0] if args else 'scout.csv', validate='--validate' in sys.argv)
@@ -0,0 +1,290 @@
+import csv
+import json
+import os
+import struct
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+
+from scout_ingest import COLUMN_MAP, CONDITION_SCORES, normalise_metric, normalise_section
+
+RAW_RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'FarmScout', 'Resources', 'Raw')
+FARM_DBF = os.path.join(RAW_RESOURCES, 'farm.dbf')
+OBSERVATION_TYPES_JSON = os.path.join(RAW_RESOURCES, 'observation_types_seeding.json')
+
+# Scout sheet metrics and the seeded observation type each one records.
+# A metric is accepted when it is listed here (and its type is seeded) or
+# when it is a seeded type name itself.
+SCOUT_METRIC_TYPES = {
+    'diseases': 'Disease',
+    'dead plants': 'Dead Plant',
+    'insect pests': 'Pest',
+    'pests': 'Pest',
+    'health status': 'Phenology',
+    'leaf colour': 'Phenology',
+    'plant growth': 'Phenology',
+    'bud break': 'Phenology',
+    'flowering': 'Phenology',
+    'nutsetting': 'Phenology',
+    'nutdrop': 'Phenology',
+    'remaining nuts': 'Phenology',
+    'soil moisture': 'Soil',
+    'soil nutrients': 'Soil',
+    'liming': 'Soil',
+    'basin weeds': 'Orchard Floor',
+    'basin formation': 'Orchard Floor',
+    'basins': 'Orchard Floor',
+    'inrows': 'Orchard Floor',
+    'mowing': 'Orchard Floor',
+    'contours': 'Orchard Floor',
+    'fire guard': 'Orchard Floor',
+    'inaccessibles': 'Orchard Floor',
+    'staking': 'Orchard Floor',
+    'pruning': 'Orchard Floor',
+    'destumping': 'Orchard Floor',
+    'pipes': 'Irrigation System',
+    'drippers': 'Irrigation System',
+    'microjets': 'Irrigation System'
+}
+
+# Violations that make a row unusable; it is left out of the normalised output
+REJECTING = {'short_row', 'header_row', 'blank_row', 'bad_date', 'unknown_condition'}
+
+EXAMPLES_PER_KIND = 5
+
+
+def read_dbf_fields(path, names):
+    """Yield the named character fields of every live record in a dBASE table"""
+    with open(path, 'rb') as f:
+        header = f.read(32)
+        n_records, header_length, record_length = struct.unpack('<IHH', header[4:12])
+
+        fields = {}
+        offset = 1  # deletion flag
+        while True:
+            descriptor = f.read(32)
+            if not descriptor or descriptor[0] == 0x0D:
+                break
+            fields[descriptor[:11].split(b'\0')[0].decode('ascii')] = (offset, descriptor[16])
+            offset += descriptor[16]
+
+        missing = [name for name in names if name not in fields]
+        if missing:
+            raise ValueError(f"{path} has no {', '.join(missing)} field")
+
+        f.seek(header_length)
+        for _ in range(n_records):
+            record = f.read(record_length)
+            if len(record) < record_length or record[:1] == b'*':
+                continue
+            yield tuple(
+                record[start:start + length].decode('utf-8', errors='replace').strip()
+                for start, length in (fields[name] for name in names)
+            )
+
+
+def read_farm_sections(path=FARM_DBF):
+    """Section names from the Desc field of the farm shapefile's dBASE table"""
+    return {normalise_section(name) for name, in read_dbf_fields(path, ['Desc']) if name}
+
+
+def read_farm_locations(path=FARM_DBF):
+    """Section name for every farm location id (the Gid field the app uses as FarmLocation.Id)"""
+    return {gid.lower(): normalise_section(name) for gid, name in read_dbf_fields(path, ['Gid', 'Desc']) if gid}
+
+
+def load_catalogues(dbf_path=FARM_DBF, types_path=OBSERVATION_TYPES_JSON):
+    """Hash sets (and the metric -> type map) every row is checked against"""
+    with open(types_path, 'r', encoding='utf-8') as f:
+        type_names = {t['name'] for t in json.load(f).get('observationTypes', [])}
+
+    folded_types = {name.lower(): name for name in type_names}
+    metric_types = {metric: t for metric, t in SCOUT_METRIC_TYPES.items() if t.lower() in folded_types}
+    metric_types.update({folded: name for folded, name in folded_types.items()})
+
+    return {
+        'sections': read_farm_sections(dbf_path),
+        'metric_types': metric_types,
+        'conditions': set(CONDITION_SCORES)
+    }
+
+
+class ValidationSummary:
+    """Counts and a few examples of every violation found in one pass"""
+
+    def __init__(self):
+        self.rows = 0
+        self.written = 0
+        self.normalised = 0
+        self.counts = Counter()
+        self.values = defaultdict(Counter)
+        self.examples = defaultdict(list)
+
+    def add(self, kind, line, value):
+        self.counts[kind] += 1
+        self.values[kind][value] += 1
+        if len(self.examples[kind]) < EXAMPLES_PER_KIND:
+            self.examples[kind].append(line)
+
+    @property
+    def rejected(self):
+        return self.rows - self.written
+
+    def format(self, path, elapsed):
+        lines = []
+        lines.append("=" * 80)
+        lines.append("SCOUT EXPORT VALIDATION")
+        lines.append("=" * 80)
+        lines.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Export: {path}")
+        lines.append(f"Rows Checked: {self.rows} in {elapsed * 1000:.0f} ms")
+        lines.append(f"Rows Written: {self.written} ({self.normalised} with values normalised)")
+        lines.append(f"Rows Rejected: {self.rejected}")
+        lines.append("")
+        if not self.counts:
+            lines.append("No violations found.")
+        for kind, count in self.counts.most_common():
+            action = "rejected" if kind in REJECTING else "kept"
+            top = ', '.join(f"'{value}' x{n}" for value, n in self.values[kind].most_common(EXAMPLES_PER_KIND))
+            lines.append(f"{kind}: {count} rows ({action}), e.g. lines {', '.join(map(str, self.examples[kind]))}")
+            lines.append(f"    {top}")
+        lines.append("")
+        lines.append("=" * 80)
+        return lines
+
+
+def validated_rows(path, summary, catalogues=None):
+    """Check every row of an export in a single streaming pass.
+
+    Yields the export's header, then every accepted row with its values
+    normalised (section case and dashes, metric case and spacing, condition
+    case, zero-padded dates); counts and examples of every violation go to
+    summary. Rows with unparseable dates or conditions, short, blank and
+    repeated header rows are rejected; unknown sections and metrics are
+    reported but kept.
+    """
+    catalogues = catalogues or load_catalogues()
+    sections = catalogues['sections']
+    metric_types = catalogues['metric_types']
+    conditions = catalogues['conditions']
+
+    # Dates repeat heavily, so each distinct string is parsed once
+    parsed_dates = {}
+
+    with open(path, 'r', encoding='utf-8', newline='') as source:
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        columns = {name: i for i, name in enumerate(header)}
+        missing = [name for name in COLUMN_MAP if name not in columns]
+        if missing:
+            raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+        index_i, date_i, section_i = columns['Index'], columns['Date'], columns['Section']
+        metric_i, condition_i = columns['Observation Type'], columns['Pass/Fail']
+        width = len(header)
+        yield header
+
+        for row in reader:
+            if not any(field.strip() for field in row):
+                continue
+            summary.rows += 1
+            line = reader.line_num
+
+            if len(row) < width:
+                summary.add('short_row', line, ','.join(row))
+                continue
+            if row == header:
+                summary.add('header_row', line, row[date_i])
+                continue
+            if not any(field.strip() for i, field in enumerate(row) if i != index_i):
+                # Numbered but otherwise empty rows left at the end of the sheet
+                summary.add('blank_row', line, row[index_i])
+                continue
+
+            date = row[date_i].strip()
+            if date not in parsed_dates:
+                try:
+                    parsed_dates[date] = datetime.strptime(date, '%d/%m/%Y').strftime('%d/%m/%Y')
+                except ValueError:
+                    parsed_dates[date] = None
+            new_date = parsed_dates[date]
+
+            section = normalise_section(row[section_i])
+            metric = normalise_metric(row[metric_i])
+            condition = row[condition_i].strip().lower()
+
+            rejected = False
+            if new_date is None:
+                summary.add('bad_date', line, date)
+                rejected = True
+            if condition not in conditions:
+                summary.add('unknown_condition', line, row[condition_i])
+                rejected = True
+            if section not in sections:
+                summary.add('unknown_section', line, section)
+            if metric not in metric_types:
+                summary.add('unknown_metric', line, metric)
+            if rejected:
+                continue
+
+            normalised = row.copy()
+            normalised[date_i] = new_date
+            normalised[section_i] = section
+            normalised[metric_i] = metric
+            normalised[condition_i] = condition
+            if normalised != row:
+                summary.normalised += 1
+            summary.written += 1
+            yield normalised
+
+
+def validate_scout_export(path='scout.csv', output_path=None, catalogues=None):
+    """Validate an export (see validated_rows) and return the summary.
+
+    Normalised rows are written to output_path with the export's own header
+    so every report can read it.
+    """
+    summary = ValidationSummary()
+    rows = validated_rows(path, summary, catalogues)
+    header = next(rows, None)
+    if header is None:
+        return summary
+
+    output = open(output_path, 'w', encoding='utf-8', newline='') if output_path else None
+    try:
+        writer = csv.writer(output) if output else None
+        if writer:
+            writer.writerow(header)
+        for row in rows:
+            if writer:
+                writer.writerow(row)
+    finally:
+        if output:
+            output.close()
+
+    return summary
+
+
+def create_validation_report(path='scout.csv', output_path='scout_normalised.csv'):
+    """Validate an export, write the normalised copy and the violation summary"""
+    start = time.perf_counter()
+    summary = validate_scout_export(path, output_path)
+    elapsed = time.perf_counter() - start
+
+    report = summary.format(path, elapsed)
+    with open('scout_validation_report.txt', 'w', encoding='utf-8') as f:
+        f.write('\n'.join(report))
+    print('\n'.join(report))
+    print(f"\nNormalised export saved as '{output_path}'")
+    print("Text report saved as 'scout_validation_report.txt'")
+    return summary
+
+
+if __name__ == "__main__":
+    create_validation_report(
+        sys.argv[1] if len(sys.argv) > 1 else 'scout.csv',
+        sys.argv[2] if len(sys.argv) > 2 else 'scout_normalised.csv'
+    )
@@ -3,6 +3,9 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 import numpy as np
+import sys
+from scout_index import load_scout_tail
+from tiled_output import save_dashboard
 
 def parse_date(date_str):
     """Parse date string to datetime object"""
@@ -21,35 +24,69 @@ def condition_to_numeric(condition):
     }
     return condition_map.get(condition.lower(), 0)
 
-def create_section_summary_dashboard():
-    """Create dashboard showing section health summary from last 200 lines"""
-    
-    # Read the CSV file
-    df = pd.read_csv('scout.csv')
-    
-    # Rename columns to match expected names
-    df = df.rename(columns={
-        'Date': 'date',
-        'Section': 'section', 
-        'Observation Type': 'metric',
-        'Pass/Fail': 'condition',
-        'Scout': 'scout',
-        'Notes': 'notes'
-    })
+def prepare_summary_data(df):
+    """Parse dates and score conditions row by row, dropping undated rows"""
+    df['date'] = df['date'].apply(parse_date)
+    df = df.dropna(subset=['date'])
+    df['condition_numeric'] = df['condition'].apply(condition_to_numeric)
+    return df
+
+def status_icon(condition):
+    """Traffic light for a condition"""
+    return "🔴" if condition.lower() == 'fail' else "🟡" if condition.lower() == 'partial' else "🟢"
+
+def warning_notes_text(latest_data):
+    """Text for the warning notes panel"""
+    issues_with_notes = latest_data[latest_data['notes'].notna() & (latest_data['notes'] != '')]
     
-    # Get last 200 lines
-    df_last_200 = df.tail(200).copy()
+    warning_text = "WARNING NOTES AND CRITICAL ISSUES:\n\n"
     
-    # Parse dates
-    df_last_200['date'] = df_last_200['date'].apply(parse_date)
-    df_last_200 = df_last_200.dropna(subset=['date'])
+    if not issues_with_notes.empty:
+        for _, row in issues_with_notes.iterrows():
+            warning_text += f"{status_icon(row['condition'])} {row['section']} - {row['metric']}: {row['condition']}\n"
+            warning_text += f"   Note: {row['notes']}\n\n"
+    else:
+        warning_text += "✅ No warning notes found in recent data.\n"
+    return warning_text
+
+def section_analysis_text(latest_data):
+    """Text for the detailed section analysis panel"""
+    analysis_text = "DETAILED SECTION ANALYSIS:\n\n"
     
-    # Convert conditions to numeric values
-    df_last_200['condition_numeric'] = df_last_200['condition'].apply(condition_to_numeric)
+    for section in sorted(latest_data['section'].unique()):
+        section_data = latest_data[latest_data['section'] == section]
+        avg_score = section_data['condition_numeric'].mean()
+        
+        status = "🟢 GOOD" if avg_score >= 2.5 else "🟡 FAIR" if avg_score >= 1.5 else "🔴 POOR"
+        analysis_text += f"{section}: {status} (Score: {avg_score:.2f})\n"
+        
+        # List metrics for this section
+        for _, row in section_data.iterrows():
+            analysis_text += f"  {status_icon(row['condition'])} {row['metric']}: {row['condition']}\n"
+        
+        analysis_text += "\n"
+    return analysis_text
+
+def compute_summary_panels(df_last_200):
+    """Everything the summary dashboard shows, computed from the prepared rows"""
     
     # Get the most recent data for each section from the last 200 lines
     latest_data = df_last_200.loc[df_last_200.groupby('section')['date'].idxmax()]
     
+    return {
+        'latest_data': latest_data,
+        'section_scores': latest_data.groupby('section')['condition_numeric'].mean().sort_values(ascending=True),
+        'metric_performance': latest_data.groupby('metric')['condition_numeric'].mean().sort_values(ascending=True),
+        'condition_counts': latest_data['condition'].value_counts(),
+        'section_activity': df_last_200.groupby('section').size().sort_values(ascending=True),
+        'daily_health': df_last_200.groupby('date')['condition_numeric'].mean(),
+        'warning_text': warning_notes_text(latest_data),
+        'analysis_text': section_analysis_text(latest_data)
+    }
+
+def draw_summary_dashboard(panels):
+    """Build the summary dashboard figure from computed panels"""
+    
     # Create the dashboard
     fig = plt.figure(figsize=(20, 16))
     
@@ -59,8 +96,7 @@ def create_section_summary_dashboard():
     # 1. Section Health Summary (Bar Chart)
     ax1 = fig.add_subplot(gs[0, :2])
     
-    # Calculate average health score per section
-    section_scores = latest_data.groupby('section')['condition_numeric'].mean().sort_values(ascending=True)
+    section_scores = panels['section_scores']
     
     colors = ['red' if score < 1.5 else 'orange' if score < 2.5 else 'green' for score in section_scores.values]
     bars = ax1.barh(range(len(section_scores)), section_scores.values, color=colors)
@@ -80,7 +116,7 @@ def create_section_summary_dashboard():
     # 2. Metric Performance Analysis
     ax2 = fig.add_subplot(gs[0, 2])
     
-    metric_performance = latest_data.groupby('metric')['condition_numeric'].mean().sort_values(ascending=True)
+    metric_performance = panels['metric_performance']
     
     bars = ax2.barh(range(len(metric_performance)), metric_performance.values, color='lightblue')
     ax2.set_yticks(range(len(metric_performance)))
@@ -92,7 +128,7 @@ def create_section_summary_dashboard():
     # 3. Condition Distribution
     ax3 = fig.add_subplot(gs[1, 0])
     
-    condition_counts = latest_data['condition'].value_counts()
+    condition_counts = panels['condition_counts']
     colors = ['red', 'orange', 'green']
     wedges, texts, autotexts = ax3.pie(condition_counts.values, labels=condition_counts.index, 
                                        autopct='%1.1f%%', colors=colors, startangle=90)
@@ -101,7 +137,7 @@ def create_section_summary_dashboard():
     # 4. Section Activity (Number of observations per section)
     ax4 = fig.add_subplot(gs[1, 1])
     
-    section_activity = df_last_200.groupby('section').size().sort_values(ascending=True)
+    section_activity = panels['section_activity']
     
     bars = ax4.barh(range(len(section_activity)), section_activity.values, color='lightcoral')
     ax4.set_yticks(range(len(section_activity)))
@@ -112,8 +148,7 @@ def create_section_summary_dashboard():
     # 5. Recent Health Trends (Last 200 lines timeline)
     ax5 = fig.add_subplot(gs[1, 2])
     
-    # Calculate daily average health score
-    daily_health = df_last_200.groupby('date')['condition_numeric'].mean()
+    daily_health = panels['daily_health']
     
     ax5.plot(daily_health.index, daily_health.values, marker='o', linewidth=2, markersize=4)
     ax5.set_title('Recent Health Trend\n(Last 200 Lines)', fontsize=12, fontweight='bold')
@@ -127,52 +162,33 @@ def create_section_summary_dashboard():
     ax6 = fig.add_subplot(gs[2, :])
     ax6.axis('off')
     
-    # Find all issues with notes
-    issues_with_notes = latest_data[latest_data['notes'].notna() & (latest_data['notes'] != '')]
-    
-    warning_text = "WARNING NOTES AND CRITICAL ISSUES:\n\n"
-    
-    if not issues_with_notes.empty:
-        for _, row in issues_with_notes.iterrows():
-            status_icon = "🔴" if row['condition'].lower() == 'fail' else "🟡" if row['condition'].lower() == 'partial' else "🟢"
-            warning_text += f"{status_icon} {row['section']} - {row['metric']}: {row['condition']}\n"
-            warning_text += f"   Note: {row['notes']}\n\n"
-    else:
-        warning_text += "✅ No warning notes found in recent data.\n"
-    
-    ax6.text(0.05, 0.95, warning_text, transform=ax6.transAxes, fontsize=10,
+    ax6.text(0.05, 0.95, panels['warning_text'], transform=ax6.transAxes, fontsize=10,
              verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
     
     # 7. Detailed Section Analysis
     ax7 = fig.add_subplot(gs[3, :])
     ax7.axis('off')
     
-    # Create detailed analysis for each section
-    analysis_text = "DETAILED SECTION ANALYSIS:\n\n"
+    ax7.text(0.05, 0.95, panels['analysis_text'], transform=ax7.transAxes, fontsize=9,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
     
-    for section in sorted(latest_data['section'].unique()):
-        section_data = latest_data[latest_data['section'] == section]
-        avg_score = section_data['condition_numeric'].mean()
-        
-        status = "🟢 GOOD" if avg_score >= 2.5 else "🟡 FAIR" if avg_score >= 1.5 else "🔴 POOR"
-        analysis_text += f"{section}: {status} (Score: {avg_score:.2f})\n"
-        
-        # List metrics for this section
-        for _, row in section_data.iterrows():
-            metric_status = "🔴" if row['condition'].lower() == 'fail' else "🟡" if row['condition'].lower() == 'partial' else "🟢"
-            analysis_text += f"  {metric_status} {row['metric']}: {row['condition']}\n"
-        
-        analysis_text += "\n"
+    return fig
+
+def create_section_summary_dashboard(source='scout.csv', tiled=False):
+    """Create dashboard showing section health summary from last 200 lines"""
     
-    ax7.text(0.05, 0.95, analysis_text, transform=ax7.transAxes, fontsize=9,
-             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+    # Read only the last 200 lines, seeking via the export's byte-offset index
+    df_last_200 = prepare_summary_data(load_scout_tail(source, 200))
+    
+    panels = compute_summary_panels(df_last_200)
+    fig = draw_summary_dashboard(panels)
     
     # Save the dashboard
-    plt.savefig('section_summary_dashboard.png', dpi=300, bbox_inches='tight')
-    print("Section Summary Dashboard saved as 'section_summary_dashboard.png'")
+    output = save_dashboard(fig, 'section_summary_dashboard.png', dpi=300, tiled=tiled)
+    print(f"Section Summary Dashboard saved as '{output}'")
     
     # Generate text report
-    generate_summary_text_report(df_last_200, latest_data)
+    generate_summary_text_report(df_last_200, panels['latest_data'])
     
     plt.show()
 
@@ -257,4 +273,5 @@ def generate_summary_text_report(df_last_200, latest_data):
     print("\nText report saved as 'section_summary_report.txt'")
 
 if __name__ == "__main__":
-    create_section_summary_dashboard() 
\ No newline at end of file
+    args = [arg for arg in sys.argv[1:] if arg != '--tiled']
+    create_section_summary_dashboard(args[0] if args else 'scout.csv', tiled='--tiled' in sys.argv) 
\ No newline at end of file
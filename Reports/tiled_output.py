@@ -0,0 +1,139 @@
+import io
+import math
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, features
+
+TILE_SIZE = 512
+
+# Longest side of each thumbnail written next to the pyramid
+THUMBNAIL_SIZES = (256, 1024)
+
+WEBP_QUALITY = 85
+
+# Encoder effort (0-6); 2 is about twice as fast as the default 4 for a few percent larger tiles
+WEBP_METHOD = 2
+
+Image.MAX_IMAGE_PIXELS = None  # 300 dpi dashboards are larger than Pillow's bomb check allows
+
+
+def tile_format():
+    """WebP when this Pillow build can write it, otherwise optimized PNG"""
+    return 'webp' if features.check('webp') else 'png'
+
+
+def _save_image(image, path, fmt):
+    if fmt == 'webp':
+        image.save(path, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+    else:
+        image.save(path, 'PNG', optimize=True)
+
+
+def render_figure(fig, dpi=300):
+    """Render a figure once to an RGB image, cropped like savefig(bbox_inches='tight').
+
+    The PNG is written uncompressed to memory, so this costs a raster copy
+    rather than a full PNG encode.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', pil_kwargs={'compress_level': 0})
+    buffer.seek(0)
+    with Image.open(buffer) as image:
+        return image.convert('RGB')
+
+
+def pyramid_levels(width, height):
+    """Image size at every Deep Zoom level, from 1x1 (level 0) to full size"""
+    max_level = math.ceil(math.log2(max(width, height, 1)))
+    return [(math.ceil(width / 2 ** (max_level - level)), math.ceil(height / 2 ** (max_level - level)))
+            for level in range(max_level + 1)]
+
+
+def write_tile_pyramid(image, output_base, tile_size=TILE_SIZE, fmt=None, max_workers=None):
+    """Write image as a Deep Zoom (.dzi) tile pyramid and return the .dzi path.
+
+    Tiles go to <output_base>_files/<level>/<column>_<row>.<fmt>; the .dzi
+    file describes the layout, so viewers such as OpenSeadragon fetch only
+    the tiles for the current zoom and viewport. Each level is a 2x box
+    reduction of the one above; tiles are cropped on this thread and
+    encoded in parallel (Pillow releases the GIL while encoding).
+    """
+    fmt = fmt or tile_format()
+    tiles_dir = output_base + '_files'
+    levels = pyramid_levels(*image.size)
+
+    # Tiles from a previous, larger render would otherwise linger at unused positions
+    shutil.rmtree(tiles_dir, ignore_errors=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        level_image = image
+        for level in range(len(levels) - 1, -1, -1):
+            if level_image.size != levels[level]:
+                level_image = level_image.reduce(2)
+            width, height = level_image.size
+
+            level_dir = os.path.join(tiles_dir, str(level))
+            os.makedirs(level_dir, exist_ok=True)
+            for column in range(math.ceil(width / tile_size)):
+                for row in range(math.ceil(height / tile_size)):
+                    box = (column * tile_size, row * tile_size,
+                           min((column + 1) * tile_size, width), min((row + 1) * tile_size, height))
+                    path = os.path.join(level_dir, f"{column}_{row}.{fmt}")
+                    futures.append(executor.submit(_save_image, level_image.crop(box), path, fmt))
+
+        for future in futures:
+            future.result()
+
+    dzi_path = output_base + '.dzi'
+    with open(dzi_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                f'<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" TileSize="{tile_size}" '
+                f'Overlap="0" Format="{fmt}">\n'
+                f'  <Size Width="{image.width}" Height="{image.height}"/>\n'
+                '</Image>\n')
+    return dzi_path
+
+
+def write_thumbnails(image, output_base, sizes=THUMBNAIL_SIZES, fmt=None):
+    """Small previews (longest side at most each size) for lists and phones"""
+    fmt = fmt or tile_format()
+    paths = []
+    for size in sizes:
+        thumbnail = image.copy()
+        thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        path = f"{output_base}_{size}.{fmt}"
+        _save_image(thumbnail, path, fmt)
+        paths.append(path)
+    return paths
+
+
+def save_dashboard(fig, path, dpi=300, tiled=False, max_workers=None):
+    """Save a dashboard figure as a single PNG, or as a tile pyramid plus thumbnails.
+
+    Returns the file a viewer should open: the PNG, or the .dzi descriptor.
+    """
+    if not tiled:
+        fig.savefig(path, dpi=dpi, bbox_inches='tight')
+        return path
+
+    output_base = os.path.splitext(path)[0]
+    image = render_figure(fig, dpi)
+    write_thumbnails(image, output_base)
+    return write_tile_pyramid(image, output_base, max_workers=max_workers)
+
+
+if __name__ == "__main__":
+    # Convert an existing dashboard PNG into a tile pyramid
+    if len(sys.argv) < 2:
+        print("Usage: python tiled_output.py <dashboard.png>")
+        sys.exit(1)
+    with Image.open(sys.argv[1]) as source_image:
+        image = source_image.convert('RGB')
+    output_base = os.path.splitext(sys.argv[1])[0]
+    thumbnails = write_thumbnails(image, output_base)
+    print(f"Tiles written to '{write_tile_pyramid(image, output_base)}'")
+    print(f"Thumbnails: {', '.join(thumbnails)}")
@@ -0,0 +1,217 @@
+import json
+import os
+import sqlite3
+import sys
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+
+LOOKUP_DATA_PATH = "FarmScout/Resources/Raw/lookup_data_seeding.json"
+OBSERVATION_TYPES_PATH = "FarmScout/Resources/Raw/observation_types_seeding.json"
+OUTPUT_PATH = "FarmScout/Resources/Raw/farmscout_seed.db3"
+
+# Tables as sqlite-net creates them from the models (Guid -> varchar(36),
+# DateTime -> bigint ticks, bool -> integer), so the app's CreateTableAsync
+# calls find nothing to migrate when the shipped file is opened.
+SCHEMA = [
+    '''CREATE TABLE "LookupGroups" (
+        "Id" varchar(36) PRIMARY KEY NOT NULL,
+        "Name" varchar(50) NOT NULL,
+        "Icon" varchar(10),
+        "Color" varchar(7),
+        "SortOrder" integer,
+        "CreatedAt" bigint,
+        "UpdatedAt" bigint,
+        "IsActive" integer)''',
+    '''CREATE TABLE "LookupSubGroups" (
+        "Id" varchar(36) PRIMARY KEY NOT NULL,
+        "Name" varchar(50) NOT NULL,
+        "GroupId" varchar(36) NOT NULL,
+        "SortOrder" integer,
+        "CreatedAt" bigint,
+        "UpdatedAt" bigint,
+        "IsActive" integer)''',
+    '''CREATE TABLE "LookupItems" (
+        "Id" varchar(36) PRIMARY KEY NOT NULL,
+        "Name" varchar(100) NOT NULL,
+        "GroupId" varchar(36) NOT NULL,
+        "SubGroupId" varchar(36),
+        "Description" varchar(500),
+        "CreatedAt" bigint,
+        "UpdatedAt" bigint,
+        "IsActive" integer)''',
+    '''CREATE TABLE "ObservationTypes" (
+        "Id" varchar(36) PRIMARY KEY NOT NULL,
+        "Name" varchar(100) NOT NULL,
+        "Description" varchar(500),
+        "Icon" varchar(10),
+        "Color" varchar(7),
+        "IsActive" integer,
+        "CreatedAt" bigint,
+        "UpdatedAt" bigint,
+        "SortOrder" integer)''',
+    '''CREATE TABLE "ObservationTypeDataPoints" (
+        "Id" varchar(36) PRIMARY KEY NOT NULL,
+        "ObservationTypeId" varchar(36),
+        "Code" varchar(50) NOT NULL,
+        "Label" varchar(100) NOT NULL,
+        "DataType" varchar(20) NOT NULL,
+        "LookupGroupName" varchar(100),
+        "Description" varchar(500),
+        "IsRequired" integer,
+        "IsActive" integer,
+        "SortOrder" integer,
+        "CreatedAt" bigint,
+        "UpdatedAt" bigint)''',
+]
+
+# Created after the bulk load. The first two use sqlite-net's own names for
+# the [Unique]/[Indexed] attributes so the app does not create duplicates.
+INDEXES = [
+    'CREATE UNIQUE INDEX "LookupGroups_Name" ON "LookupGroups"("Name")',
+    'CREATE INDEX "ObservationTypeDataPoints_ObservationTypeId" ON "ObservationTypeDataPoints"("ObservationTypeId")',
+    'CREATE INDEX "LookupSubGroups_GroupId" ON "LookupSubGroups"("GroupId")',
+    'CREATE INDEX "LookupItems_GroupId" ON "LookupItems"("GroupId")',
+]
+
+
+def to_ticks(value):
+    """Convert a datetime to .NET ticks, the way sqlite-net stores DateTime columns"""
+    return (value - datetime(1, 1, 1)) // timedelta(microseconds=1) * 10
+
+
+def parse_guid(value, errors, what):
+    """Lowercase GUID text as sqlite-net stores Guid columns, or None when invalid"""
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        errors.append(f"Invalid GUID for {what}: {value}")
+        return None
+
+
+def load_seed_rows(lookup_path, types_path, now_ticks):
+    """Flatten both seeding files into per-table row lists, mirroring DatabaseSeeder"""
+    with open(lookup_path, 'r', encoding='utf-8') as file:
+        lookup_data = json.load(file)
+    with open(types_path, 'r', encoding='utf-8') as file:
+        types_data = json.load(file)
+
+    rows = {table: [] for table in
+            ('LookupGroups', 'LookupSubGroups', 'LookupItems', 'ObservationTypes', 'ObservationTypeDataPoints')}
+    errors = []
+
+    for group in lookup_data.get('lookupGroups', []):
+        group_id = parse_guid(group.get('id'), errors, f"lookup group {group.get('name')}")
+        if group_id is None:
+            continue
+        rows['LookupGroups'].append((
+            group_id, group.get('name', ''), group.get('icon', ''), group.get('color', ''),
+            group.get('sortOrder', 0), now_ticks, now_ticks, 1
+        ))
+
+        for sub_group in group.get('subGroups', []):
+            sub_group_id = parse_guid(sub_group.get('id'), errors, f"lookup subgroup {sub_group.get('name')}")
+            if sub_group_id is None:
+                continue
+            rows['LookupSubGroups'].append((
+                sub_group_id, sub_group.get('name', ''), group_id,
+                sub_group.get('sortOrder', 0), now_ticks, now_ticks, 1
+            ))
+
+            for item in sub_group.get('items', []):
+                item_id = parse_guid(item.get('id'), errors, f"lookup item {item.get('name')}")
+                if item_id is None:
+                    continue
+                rows['LookupItems'].append((
+                    item_id, item.get('name', ''), group_id, sub_group_id,
+                    item.get('description', ''), now_ticks, now_ticks, 1
+                ))
+
+    for observation_type in types_data.get('observationTypes', []):
+        type_id = parse_guid(observation_type.get('id'), errors, f"observation type {observation_type.get('name')}")
+        if type_id is None:
+            continue
+        rows['ObservationTypes'].append((
+            type_id, observation_type.get('name', ''), observation_type.get('description', ''),
+            observation_type.get('icon', ''), observation_type.get('color', ''), 1,
+            now_ticks, now_ticks, observation_type.get('sortOrder', 0)
+        ))
+
+        for data_point in observation_type.get('dataPoints', []):
+            data_point_id = parse_guid(data_point.get('id'), errors, f"data point {data_point.get('code')}")
+            if data_point_id is None:
+                continue
+            rows['ObservationTypeDataPoints'].append((
+                data_point_id, type_id, data_point.get('code', ''), data_point.get('label', ''),
+                data_point.get('dataType', ''), data_point.get('lookupGroupName') or '',
+                data_point.get('description', ''), int(bool(data_point.get('isRequired'))), 1,
+                data_point.get('sortOrder', 0), now_ticks, now_ticks
+            ))
+
+    return rows, errors
+
+
+def find_duplicate_guids(rows):
+    """GUIDs used more than once across all seeded tables"""
+    id_counts = Counter(row[0] for table_rows in rows.values() for row in table_rows)
+    return {id_val: count for id_val, count in id_counts.items() if count > 1}
+
+
+def build_seed_database(output_path=OUTPUT_PATH, lookup_path=LOOKUP_DATA_PATH, types_path=OBSERVATION_TYPES_PATH):
+    """Build a ready-seeded SQLite file the app can copy on first run instead of seeding row by row.
+
+    Returns the number of rows written per table, or None when the seed
+    data has invalid or duplicate GUIDs (nothing is written in that case).
+    """
+    rows, errors = load_seed_rows(lookup_path, types_path, to_ticks(datetime.now()))
+
+    duplicates = find_duplicate_guids(rows)
+    for id_val, count in duplicates.items():
+        errors.append(f"{id_val} appears {count} times")
+    if errors:
+        print(f"❌ Seed data has {len(errors)} GUID problem(s):")
+        for error in errors:
+            print(f"  {error}")
+        return None
+
+    # Build next to the target and swap it in, so a failed build never leaves a partial asset
+    temp_path = output_path + '.tmp'
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    conn = sqlite3.connect(temp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            for table, table_rows in rows.items():
+                if table_rows:
+                    placeholders = ', '.join('?' * len(table_rows[0]))
+                    conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', table_rows)
+            for statement in INDEXES:
+                conn.execute(statement)
+
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(temp_path, output_path)
+    return {table: len(table_rows) for table, table_rows in rows.items()}
+
+
+if __name__ == "__main__":
+    output_path = sys.argv[1] if len(sys.argv) > 1 else OUTPUT_PATH
+    counts = build_seed_database(output_path)
+
+    if counts is None:
+        print("\n❌ SUMMARY: Seed database not built")
+        exit(1)
+
+    for table, count in counts.items():
+        print(f"  {table}: {count} rows")
+    print(f"\n✅ SUMMARY: Seed database written to {output_path} ({os.path.getsize(output_path) // 1024} KB)")
+    exit(0)